@@ -0,0 +1,60 @@
+"""
+Benchmarks for the client's hot paths: parsing, pagination, request serialization, uploads,
+downloads, startup and job polling. Anything that talks to a server runs against the local
+REST simulator in test/simulator.py, so no Tableau Server is needed.
+
+Run them from the repository root, and compare two runs (e.g. before and after a change):
+
+    python -m benchmarks run --output head.json
+    python -m benchmarks compare base.json head.json
+
+Each benchmark module has a `run(quick)` function returning a list of results, as built by
+`result`, and can also be run on its own, e.g. `python -m benchmarks.parse`.
+"""
+
+import contextlib
+import os
+import timeit
+from typing import Any, Callable, Optional
+from collections.abc import Iterator
+
+import tableauserverclient as TSC
+
+from test.simulator import RestSimulator, SimulatedSite
+
+ASSET_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "test", "assets")
+NS = {"t": "http://tableau.com/api"}
+
+
+def result(
+    benchmark: str, case: str, metric: str, value: float, unit: str, higher_is_better: bool = True
+) -> dict[str, Any]:
+    return {
+        "benchmark": benchmark,
+        "case": case,
+        "metric": metric,
+        "value": value,
+        "unit": unit,
+        "higher_is_better": higher_is_better,
+    }
+
+
+def best_time(func: Callable[[], Any], number: int = 1, repeat: int = 5) -> float:
+    """The best time, in seconds, taken by one call of `func`."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+@contextlib.contextmanager
+def simulated_server(site: Optional[SimulatedSite] = None, **kwargs) -> Iterator[tuple[TSC.Server, RestSimulator]]:
+    """A server signed in to a simulated site, with the simulator serving it."""
+    site = site or SimulatedSite()
+    with RestSimulator([site], **kwargs) as simulator:
+        server = TSC.Server(simulator.url, use_server_version=True)
+        with server.auth.sign_in(TSC.TableauAuth("benchmark", "password", site.content_url)):
+            yield server, simulator
+
+
+def print_results(results: list[dict[str, Any]]) -> None:
+    print(f"{'benchmark':<16}{'case':<50}{'metric':<20}{'value':>14} unit")
+    for r in results:
+        print(f"{r['benchmark']:<16}{r['case']:<50}{r['metric']:<20}{r['value']:>14.2f} {r['unit']}")
@@ -0,0 +1,107 @@
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+from typing import Any, Optional
+
+import tableauserverclient as TSC
+
+from benchmarks import jobs, memory, pagination, parse, print_results, request_factory, startup, transfer
+
+BENCHMARKS = {
+    "parse": parse,
+    "memory": memory,
+    "pagination": pagination,
+    "request_factory": request_factory,
+    "transfer": transfer,
+    "startup": startup,
+    "jobs": jobs,
+}
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args) -> int:
+    names = args.only or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmarks {', '.join(unknown)}, expected any of {', '.join(BENCHMARKS)}", file=sys.stderr)
+        return 2
+
+    results: list[dict[str, Any]] = []
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        results.extend(BENCHMARKS[name].run(quick=args.quick))
+    print_results(results)
+
+    if args.output:
+        document = {
+            "commit": git_commit(),
+            "version": TSC.get_versions()["version"],
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "quick": args.quick,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+    return 0
+
+
+def compare(args) -> int:
+    with open(args.base) as f:
+        base = {(r["benchmark"], r["case"], r["metric"]): r for r in json.load(f)["results"]}
+    with open(args.head) as f:
+        head = json.load(f)["results"]
+
+    regressions = 0
+    print(f"{'benchmark':<16}{'case':<50}{'metric':<20}{'base':>12}{'head':>12}{'change':>9}")
+    for r in head:
+        old = base.get((r["benchmark"], r["case"], r["metric"]))
+        if old is None or not old["value"]:
+            continue
+        change = r["value"] / old["value"] - 1
+        worse = -change if r["higher_is_better"] else change
+        flag = ""
+        if worse > args.threshold:
+            flag = "  regression"
+            regressions += 1
+        print(
+            f"{r['benchmark']:<16}{r['case']:<50}{r['metric']:<20}"
+            f"{old['value']:>12.2f}{r['value']:>12.2f}{change:>+9.1%}{flag}"
+        )
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the client's hot paths.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--only", nargs="+", help=f"benchmarks to run, any of {', '.join(BENCHMARKS)}")
+    run_parser.add_argument("--output", "-o", help="write the results to this JSON file")
+    run_parser.add_argument("--quick", action="store_true", help="smaller workloads, for smoke testing")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser("compare", help="compare the results of two runs")
+    compare_parser.add_argument("base", help="results of the baseline run")
+    compare_parser.add_argument("head", help="results of the run to check")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative change counted as a regression (default 0.1)"
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+####
+# Measures the requests made and the time spent by Jobs.wait_for_job for jobs that finish
+# after a given number of polls on the REST simulator.
+#
+# Run from the repository root:
+#   python -m benchmarks.jobs --polls 0 2 5
+####
+
+import argparse
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from benchmarks import print_results, result, simulated_server
+from test.simulator import item_id
+
+POLLS = (0, 2, 5)
+
+
+def run(quick: bool = False, polls: Sequence[int] = POLLS) -> list[dict[str, Any]]:
+    if quick:
+        polls = (0, 2)
+    results = []
+    with simulated_server() as (server, simulator):
+        for count in polls:
+            simulator.job_polls = count
+            job = server.workbooks.refresh(item_id("workbooks", 0))
+            before = simulator.stats["job"]
+            start = time.perf_counter()
+            server.jobs.wait_for_job(job)
+            seconds = time.perf_counter() - start
+            requests = simulator.stats["job"] - before
+            case = f"job done after {count} polls"
+            results.append(result("jobs", case, "requests", requests, "requests", higher_is_better=False))
+            results.append(result("jobs", case, "seconds", seconds, "s", higher_is_better=False))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the polling done by wait_for_job.")
+    parser.add_argument("--polls", type=int, nargs="+", default=POLLS, help="polls before each job completes")
+    args = parser.parse_args()
+    print_results(run(polls=args.polls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+####
+# Measures the memory held per model instance when a large list response is parsed, for
+# the models that make up bulk inventories. The generated items carry the usual
+# sub-elements (project, owner, tags, usage) so the numbers reflect a real page.
+#
+# Run from the repository root:
+#   python -m benchmarks.memory --items 10000
+####
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any
+
+import tableauserverclient as TSC
+
+from benchmarks import NS, print_results, result
+
+TIMESTAMPS = 'createdAt="2016-07-06T20:19:00Z" updatedAt="2016-07-07T20:19:00Z"'
+CHILDREN = '<project id="p" name="default" /><owner id="o" /><tags><tag label="a" /></tags>'
+
+ELEMENTS: dict[str, tuple[Any, str, str]] = {
+    "workbook": (
+        TSC.WorkbookItem,
+        "workbooks",
+        f'<workbook id="wb{{i}}" name="Workbook {{i}}" contentUrl="wb{{i}}" size="1" {TIMESTAMPS}>{CHILDREN}</workbook>',
+    ),
+    "view": (
+        TSC.ViewItem,
+        "views",
+        f'<view id="v{{i}}" name="View {{i}}" contentUrl="wb/sheets/v{{i}}" {TIMESTAMPS}>'
+        f'<workbook id="wb" />{CHILDREN}<usage totalViewCount="{{i}}" /></view>',
+    ),
+    "datasource": (
+        TSC.DatasourceItem,
+        "datasources",
+        f'<datasource id="ds{{i}}" name="Datasource {{i}}" type="hyper" {TIMESTAMPS}>{CHILDREN}</datasource>',
+    ),
+    "user": (
+        TSC.UserItem,
+        "users",
+        '<user id="u{i}" name="user{i}" siteRole="Viewer" lastLogin="2016-07-07T20:19:00Z" '
+        'fullName="User {i}" email="user{i}@example.com"><domain name="local" /></user>',
+    ),
+}
+
+
+def page(container: str, element: str, items: int) -> bytes:
+    body = "".join(element.format(i=i) for i in range(items))
+    return f'<tsResponse xmlns="http://tableau.com/api"><{container}>{body}</{container}></tsResponse>'.encode()
+
+
+def bytes_per_item(model, response: bytes, items: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    parsed = model.from_response(response, NS)
+    gc.collect()
+    # The parse tree has been released at this point, so what remains is held by the models
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(parsed) == items
+    return held / items
+
+
+def run(quick: bool = False, items: int = 10000) -> list[dict[str, Any]]:
+    if quick:
+        items = 1000
+    results = []
+    for name, (model, container, element) in ELEMENTS.items():
+        response = page(container, element, items)
+        value = bytes_per_item(model, response, items)
+        results.append(result("memory", name, "bytes_per_item", value, "B", higher_is_better=False))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure memory held per parsed model instance.")
+    parser.add_argument("--items", type=int, default=10000, help="items per generated response")
+    args = parser.parse_args()
+    print_results(run(items=args.items))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+####
+# Measures how many items per second Pager (with and without streaming) and QuerySet read
+# from a simulated site, at different page sizes.
+#
+# Run from the repository root:
+#   python -m benchmarks.pagination --items 20000 --latency 0.01
+####
+
+import argparse
+import time
+from typing import Any, Callable
+from collections.abc import Iterable
+
+import tableauserverclient as TSC
+
+from benchmarks import print_results, result, simulated_server
+from test.simulator import Faults, SimulatedSite
+
+PAGE_SIZES = (100, 1000)
+
+
+def read_all(iterable: Iterable) -> int:
+    return sum(1 for _ in iterable)
+
+
+def run(quick: bool = False, items: int = 20000, latency: float = 0.0) -> list[dict[str, Any]]:
+    if quick:
+        items = 2000
+    results = []
+    site = SimulatedSite(workbooks=items)
+    with simulated_server(site, faults=Faults(latency=latency)) as (server, _):
+        for page_size in PAGE_SIZES:
+            readers: dict[str, Callable[[], Iterable]] = {
+                "Pager": lambda: TSC.Pager(server.workbooks, TSC.RequestOptions(pagesize=page_size)),
+                "Pager stream": lambda: TSC.Pager(
+                    server.workbooks, TSC.RequestOptions(pagesize=page_size), stream=True
+                ),
+                "QuerySet": lambda: server.workbooks.all(page_size=page_size),
+            }
+            for name, reader in readers.items():
+                start = time.perf_counter()
+                count = read_all(reader())
+                seconds = time.perf_counter() - start
+                assert count == items
+                case = f"{name} page_size={page_size}"
+                results.append(result("pagination", case, "items_per_second", count / seconds, "items/s"))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure pagination throughput against the REST simulator.")
+    parser.add_argument("--items", type=int, default=20000, help="workbooks on the simulated site")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every simulated request")
+    args = parser.parse_args()
+    print_results(run(items=args.items, latency=args.latency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+####
+# Measures how many items per second the model parsers read from list responses, with each
+# available XML backend: the test assets, and a generated page of workbooks that each embed
+# their views, where searching every item's subtree once per sub-element used to dominate.
+#
+# Run from the repository root:
+#   python -m benchmarks.parse --items 1000 --views 20
+####
+
+import argparse
+import glob
+import os
+from typing import Any
+
+import tableauserverclient as TSC
+from tableauserverclient.models import xml_backend
+
+from benchmarks import ASSET_DIR, NS, best_time, print_results, result
+
+# Models with a list parser, keyed by the asset file name prefix of their get responses
+MODELS: dict[str, Any] = {
+    "workbook_get": TSC.WorkbookItem,
+    "view_get": TSC.ViewItem,
+    "datasource_get": TSC.DatasourceItem,
+    "flow_get": TSC.FlowItem,
+    "project_get": TSC.ProjectItem,
+    "user_get": TSC.UserItem,
+    "group_get": TSC.GroupItem,
+    "metrics_get": TSC.MetricItem,
+    "database_get": TSC.DatabaseItem,
+    "table_get": TSC.TableItem,
+}
+
+
+def workbook_page(items: int, views: int) -> bytes:
+    view = (
+        '<view id="v{i}-{j}" name="View {j}" contentUrl="wb{i}/sheets/v{j}" createdAt="2016-07-06T20:19:00Z" '
+        'updatedAt="2016-07-07T20:19:00Z"><workbook id="wb{i}" /><owner id="o" /><project id="p" />'
+        '<tags><tag label="a" /><tag label="b" /></tags><usage totalViewCount="{j}" /></view>'
+    )
+    workbooks = "".join(
+        f'<workbook id="wb{i}" name="Workbook {i}" contentUrl="wb{i}" showTabs="false" size="1" '
+        'createdAt="2016-07-06T20:19:00Z" updatedAt="2016-07-07T20:19:00Z">'
+        '<project id="p" name="default" /><owner id="o" /><tags><tag label="t" /></tags>'
+        "<views>" + "".join(view.format(i=i, j=j) for j in range(views)) + "</views>"
+        '<dataAccelerationConfig accelerationEnabled="false" /></workbook>'
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><tsResponse xmlns="http://tableau.com/api">'
+        f'<pagination pageNumber="1" pageSize="{items}" totalAvailable="{items}" />'
+        f"<workbooks>{workbooks}</workbooks></tsResponse>"
+    ).encode("utf-8")
+
+
+def items_per_second(model, response: bytes, repeat: int) -> tuple[int, float]:
+    count = len(model.from_response(response, NS))
+    seconds = best_time(lambda: model.from_response(response, NS), number=repeat)
+    return count, count / seconds if seconds else 0.0
+
+
+def backends() -> list[str]:
+    if xml_backend.lxml_available():
+        return [xml_backend.DEFUSEDXML, xml_backend.LXML]
+    return [xml_backend.DEFUSEDXML]
+
+
+def run(quick: bool = False, items: int = 1000, views: int = 20, repeat: int = 50) -> list[dict[str, Any]]:
+    if quick:
+        items, views, repeat = 100, 5, 5
+    results = []
+    generated = workbook_page(items, views)
+    try:
+        for backend in backends():
+            xml_backend.set_backend(backend)
+            for prefix, model in MODELS.items():
+                for path in sorted(glob.glob(os.path.join(ASSET_DIR, prefix + "*.xml"))):
+                    with open(path, "rb") as f:
+                        response = f.read()
+                    count, rate = items_per_second(model, response, repeat)
+                    if count:
+                        case = f"{os.path.basename(path)} [{backend}]"
+                        results.append(result("parse", case, "items_per_second", rate, "items/s"))
+
+            count, rate = items_per_second(TSC.WorkbookItem, generated, 1)
+            case = f"generated {items}x{views} views [{backend}]"
+            results.append(result("parse", case, "items_per_second", rate, "items/s"))
+    finally:
+        xml_backend.set_backend(None)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure model parse throughput.")
+    parser.add_argument("--items", type=int, default=1000, help="workbooks in the generated page")
+    parser.add_argument("--views", type=int, default=20, help="views embedded in each generated workbook")
+    parser.add_argument("--repeat", "-r", type=int, default=50, help="parses per timing run for the assets")
+    args = parser.parse_args()
+    print_results(run(items=args.items, views=args.views, repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    main()
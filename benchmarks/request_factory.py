@@ -0,0 +1,81 @@
+####
+# Measures how fast RequestFactory serializes the requests the client sends most: item
+# updates, permission rules, tags and the multipart bodies of uploads and publishes.
+#
+# Run from the repository root:
+#   python -m benchmarks.request_factory --repeat 2000
+####
+
+import argparse
+from typing import Any, Callable
+
+import tableauserverclient as TSC
+from tableauserverclient.server import RequestFactory
+
+from benchmarks import best_time, print_results, result
+
+MB = 1024 * 1024
+
+
+def workbook() -> TSC.WorkbookItem:
+    item = TSC.WorkbookItem("project-id", "Workbook", show_tabs=True)
+    item._id = "workbook-id"
+    item.owner_id = "owner-id"
+    item.description = "A workbook"
+    return item
+
+
+def user() -> TSC.UserItem:
+    item = TSC.UserItem("user", TSC.UserItem.Roles.Viewer, TSC.UserItem.Auth.ServerDefault)
+    item.email = "user@example.com"
+    item.fullname = "User"
+    return item
+
+
+def permission_rules(count: int) -> list[TSC.PermissionsRule]:
+    capabilities = {
+        TSC.Permission.Capability.Read: TSC.Permission.Mode.Allow,
+        TSC.Permission.Capability.Write: TSC.Permission.Mode.Deny,
+        TSC.Permission.Capability.ExportData: TSC.Permission.Mode.Allow,
+    }
+    return [TSC.PermissionsRule(TSC.GroupItem.as_reference(f"group-{i}"), capabilities) for i in range(count)]
+
+
+def run(quick: bool = False, repeat: int = 2000) -> list[dict[str, Any]]:
+    if quick:
+        repeat = 100
+    results = []
+    item = workbook()
+    new_user = user()
+    rules = permission_rules(100)
+    tags = {f"tag-{i}" for i in range(50)}
+    requests: dict[str, Callable[[], Any]] = {
+        "Workbook.update_req": lambda: RequestFactory.Workbook.update_req(item),
+        "User.add_req": lambda: RequestFactory.User.add_req(new_user),
+        "Permission.add_req 100 rules": lambda: RequestFactory.Permission.add_req(rules),
+        "Tag.add_req 50 tags": lambda: RequestFactory.Tag.add_req(tags),
+    }
+    for name, serialize in requests.items():
+        seconds = best_time(serialize, number=repeat)
+        results.append(result("request_factory", name, "requests_per_second", 1 / seconds, "req/s"))
+
+    chunk = b"\0" * (4 * MB)
+    bodies: dict[str, Callable[[], Any]] = {
+        "Fileupload.chunk_req 4MB": lambda: RequestFactory.Fileupload.chunk_req(chunk),
+        "Workbook.publish_req 4MB": lambda: RequestFactory.Workbook.publish_req(item, "Workbook.twbx", chunk),
+    }
+    for name, serialize in bodies.items():
+        seconds = best_time(serialize, number=max(repeat // 100, 1))
+        results.append(result("request_factory", name, "megabytes_per_second", len(chunk) / MB / seconds, "MB/s"))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure request serialization speed.")
+    parser.add_argument("--repeat", "-r", type=int, default=2000, help="requests per timing run")
+    args = parser.parse_args()
+    print_results(run(repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+####
+# Measures the time taken to import tableauserverclient in a fresh interpreter, to construct
+# a Server with all of its endpoints, and to check its API version as every endpoint call does.
+#
+# Run from the repository root:
+#   python -m benchmarks.startup --repeat 10
+####
+
+import argparse
+import subprocess
+import sys
+from typing import Any
+
+import tableauserverclient as TSC
+
+from benchmarks import best_time, print_results, result
+
+IMPORT_TIME = "import time; start = time.perf_counter(); import tableauserverclient; print(time.perf_counter() - start)"
+
+
+def import_seconds() -> float:
+    output = subprocess.run([sys.executable, "-c", IMPORT_TIME], check=True, capture_output=True, text=True).stdout
+    return float(output)
+
+
+def run(quick: bool = False, repeat: int = 10) -> list[dict[str, Any]]:
+    if quick:
+        repeat = 3
+    seconds = min(import_seconds() for _ in range(repeat))
+    server_seconds = best_time(lambda: TSC.Server("http://localhost"), number=100 * repeat)
+    server = TSC.Server("http://localhost")
+    check_seconds = best_time(lambda: server.check_at_least_version("3.7"), number=10_000 * repeat)
+    return [
+        result("startup", "import tableauserverclient", "milliseconds", seconds * 1000, "ms", higher_is_better=False),
+        result("startup", "Server()", "microseconds", server_seconds * 1e6, "us", higher_is_better=False),
+        result("startup", "version check", "nanoseconds", check_seconds * 1e9, "ns", higher_is_better=False),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import and Server construction time.")
+    parser.add_argument("--repeat", "-r", type=int, default=10, help="fresh interpreters to time the import in")
+    args = parser.parse_args()
+    print_results(run(repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    main()
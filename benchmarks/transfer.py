@@ -0,0 +1,62 @@
+####
+# Measures Fileuploads.upload and download_revision throughput against the REST simulator,
+# with the peak Python memory allocated while each transfer runs.
+#
+# Run from the repository root:
+#   python -m benchmarks.transfer --size 128
+####
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks import print_results, result, simulated_server
+from test.simulator import SimulatedSite, item_id
+
+MB = 1024 * 1024
+
+
+def measure(transfer: Callable[[], Any]) -> tuple[float, int]:
+    """Seconds taken by `transfer` and the peak memory it allocated, in bytes."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    transfer()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def run(quick: bool = False, size: int = 128) -> list[dict[str, Any]]:
+    if quick:
+        size = 8
+    results = []
+    site = SimulatedSite(workbooks=1, download_size=size * MB)
+    with tempfile.TemporaryDirectory() as directory, simulated_server(site) as (server, _):
+        path = os.path.join(directory, "upload.twbx")
+        with open(path, "wb") as f:
+            f.write(os.urandom(MB) * size)
+
+        seconds, peak = measure(lambda: server.fileuploads.upload(path))
+        results.append(result("transfer", f"upload {size}MB", "megabytes_per_second", size / seconds, "MB/s"))
+        results.append(result("transfer", f"upload {size}MB", "peak_memory", peak / MB, "MB", higher_is_better=False))
+
+        download = lambda: server.workbooks.download_revision(item_id("workbooks", 0), None, directory)
+        seconds, peak = measure(download)
+        results.append(result("transfer", f"download {size}MB", "megabytes_per_second", size / seconds, "MB/s"))
+        results.append(result("transfer", f"download {size}MB", "peak_memory", peak / MB, "MB", higher_is_better=False))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure upload and download throughput.")
+    parser.add_argument("--size", type=int, default=128, help="megabytes to upload and download")
+    args = parser.parse_args()
+    print_results(run(size=args.size))
+
+
+if __name__ == "__main__":
+    main()
@@ -64,11 +64,11 @@ def main():
             filepath = os.path.abspath(args.file)
             print(f"Add users to site from file {filepath}:")
             added: list[TSC.UserItem]
-            failed: list[TSC.UserItem, TSC.ServerResponseError]
+            failed: list[tuple[TSC.UserItem, Exception]]
             added, failed = server.users.create_from_file(filepath)
             for user, error in failed:
-                print(user, error.code)
-                if error.code == "409017":
+                print(user, error)
+                if isinstance(error, ServerResponseError) and error.code == "409017":
                     user = server.users.filter(name=user.name)[0]
                     added.append(user)
             print(f"Adding users to group:{added}")
@@ -50,10 +50,24 @@ from tableauserverclient.models import (
 )
 
 from tableauserverclient.server import (
+    AdaptivePageSize,
     CSVRequestOptions,
     ExcelRequestOptions,
     ImageRequestOptions,
     PDFRequestOptions,
+    PaginationCheckpoint,
+    Hooks,
+    MetricsAggregator,
+    RateLimiter,
+    EffectivePermissions,
+    ProjectTree,
+    Migration,
+    Backup,
+    ContentStore,
+    ViewExport,
+    WebhookReceiver,
+    Capabilities,
+    RequestEvent,
     RequestOptions,
     MissingRequiredFieldError,
     FailedSignInError,
@@ -122,6 +136,20 @@ __all__ = [
     "ServerResponseError",
     "Filter",
     "Pager",
+    "AdaptivePageSize",
+    "PaginationCheckpoint",
+    "Hooks",
+    "MetricsAggregator",
+    "RateLimiter",
+    "EffectivePermissions",
+    "ProjectTree",
+    "Migration",
+    "Backup",
+    "ContentStore",
+    "ViewExport",
+    "WebhookReceiver",
+    "Capabilities",
+    "RequestEvent",
     "Server",
     "Sort",
     "LinkedTaskItem",
@@ -23,5 +23,15 @@ class Config:
     def PAGE_SIZE(self):
         return int(os.getenv("TSC_PAGE_SIZE", 100))
 
+    # Largest page size the server will return, used as the starting point for adaptive paging
+    @property
+    def MAX_PAGE_SIZE(self):
+        return int(os.getenv("TSC_MAX_PAGE_SIZE", 1000))
+
+    # Parser used to read responses into models: defusedxml, lxml or auto (lxml when it is installed)
+    @property
+    def XML_BACKEND(self):
+        return os.getenv("TSC_XML_BACKEND", "defusedxml")
+
 
 config = Config()
@@ -1,4 +1,7 @@
 import datetime
+import functools
+import re
+from typing import Optional
 
 
 ZERO = datetime.timedelta(0)
@@ -26,12 +29,31 @@ class UTC(datetime.tzinfo):
 
 utc = UTC()
 TABLEAU_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+TABLEAU_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})Z", re.ASCII)
+
+# Bulk responses repeat the same timestamps over and over (items created by one publish or
+# import, extract refreshes on a schedule), and datetimes are immutable so they can be shared.
+DATETIME_CACHE_SIZE = 4096
 
 
 def parse_datetime(date):
     if date is None:
         return None
 
+    return _parse_datetime(date)
+
+
+@functools.lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _parse_datetime(date: str) -> Optional[datetime.datetime]:
+    # The server always sends the zero padded form, which can be read without strptime
+    match = TABLEAU_DATE_RE.fullmatch(date)
+    if match is not None:
+        year, month, day, hour, minute, second = map(int, match.groups())
+        try:
+            return datetime.datetime(year, month, day, hour, minute, second, tzinfo=utc)
+        except ValueError:
+            return None
+
     try:
         return datetime.datetime.strptime(date, TABLEAU_DATE_FORMAT).replace(tzinfo=utc)
     except ValueError:
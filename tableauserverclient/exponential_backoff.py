@@ -1,4 +1,6 @@
+import threading
 import time
+from typing import Optional
 
 # Polling for server-side events (such as job completion) uses exponential backoff for the sleep intervals between polls
 ASYNC_POLL_MIN_INTERVAL = 0.5
@@ -12,8 +14,12 @@ class ExponentialBackoffTimer:
         self.timeout = timeout
         self.current_sleep_interval = ASYNC_POLL_MIN_INTERVAL
 
-    def sleep(self):
-        max_sleep_time = ASYNC_POLL_MAX_INTERVAL
+    def sleep(self, wake: Optional[threading.Event] = None) -> bool:
+        """
+        Sleep until the next poll. With `wake`, the sleep ends early when that event is set, and
+        is then cleared. Returns whether it was.
+        """
+        max_sleep_time: float = ASYNC_POLL_MAX_INTERVAL
         if self.timeout is not None:
             elapsed = time.time() - self.start_time
             if elapsed >= self.timeout:
@@ -26,5 +32,11 @@ class ExponentialBackoffTimer:
             # due to waking up to early from the `sleep`.
             max_sleep_time = max(max_sleep_time, ASYNC_POLL_MIN_INTERVAL)
 
-        time.sleep(min(self.current_sleep_interval, max_sleep_time))
+        interval = min(self.current_sleep_interval, max_sleep_time)
+        if wake is None:
+            time.sleep(interval)
+        elif wake.wait(interval):
+            wake.clear()
+            return True
         self.current_sleep_interval *= ASYNC_POLL_BACKOFF_FACTOR
+        return False
@@ -0,0 +1,434 @@
+import abc
+import csv
+import datetime
+import io
+import json
+import os
+from typing import Any, Callable, Optional
+from collections.abc import Iterable, Iterator
+
+from tableauserverclient.datetime_helpers import format_datetime
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.models.exceptions import UnpopulatedPropertyError
+from tableauserverclient.models.slots import slot_attributes
+from tableauserverclient.server.checkpoint import PaginationCheckpoint
+from tableauserverclient.server.pager import Pager
+from tableauserverclient.server.request_options import RequestOptions
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+# Column types of inventory exports
+STRING = "string"
+INT = "int"
+FLOAT = "float"
+BOOL = "bool"
+TIMESTAMP = "timestamp"
+LIST = "list"
+
+NDJSON = "ndjson"
+CSV = "csv"
+PARQUET = "parquet"
+FORMATS = (NDJSON, CSV, PARQUET)
+
+Columns = list[tuple[str, str]]
+
+
+def pyarrow_available() -> bool:
+    return pyarrow is not None
+
+
+# The content that can be exported by `server.export.inventory`: the server endpoint to page
+# through, the arguments to pass to its get and the columns written for each item.
+INVENTORY: dict[str, tuple[str, dict[str, Any], Columns]] = {
+    "workbooks": (
+        "workbooks",
+        {},
+        [
+            ("id", STRING),
+            ("name", STRING),
+            ("content_url", STRING),
+            ("webpage_url", STRING),
+            ("description", STRING),
+            ("project_id", STRING),
+            ("project_name", STRING),
+            ("owner_id", STRING),
+            ("size", INT),
+            ("show_tabs", BOOL),
+            ("created_at", TIMESTAMP),
+            ("updated_at", TIMESTAMP),
+            ("tags", LIST),
+        ],
+    ),
+    "views": (
+        "views",
+        {"usage": True},
+        [
+            ("id", STRING),
+            ("name", STRING),
+            ("content_url", STRING),
+            ("sheet_type", STRING),
+            ("workbook_id", STRING),
+            ("project_id", STRING),
+            ("owner_id", STRING),
+            ("total_views", INT),
+            ("created_at", TIMESTAMP),
+            ("updated_at", TIMESTAMP),
+            ("tags", LIST),
+        ],
+    ),
+    "datasources": (
+        "datasources",
+        {},
+        [
+            ("id", STRING),
+            ("name", STRING),
+            ("content_url", STRING),
+            ("webpage_url", STRING),
+            ("description", STRING),
+            ("datasource_type", STRING),
+            ("project_id", STRING),
+            ("project_name", STRING),
+            ("owner_id", STRING),
+            ("certified", BOOL),
+            ("has_extracts", BOOL),
+            ("size", INT),
+            ("created_at", TIMESTAMP),
+            ("updated_at", TIMESTAMP),
+            ("tags", LIST),
+        ],
+    ),
+    "flows": (
+        "flows",
+        {},
+        [
+            ("id", STRING),
+            ("name", STRING),
+            ("webpage_url", STRING),
+            ("description", STRING),
+            ("project_id", STRING),
+            ("project_name", STRING),
+            ("owner_id", STRING),
+            ("created_at", TIMESTAMP),
+            ("updated_at", TIMESTAMP),
+            ("tags", LIST),
+        ],
+    ),
+    "projects": (
+        "projects",
+        {},
+        [
+            ("id", STRING),
+            ("name", STRING),
+            ("description", STRING),
+            ("parent_id", STRING),
+            ("owner_id", STRING),
+            ("content_permissions", STRING),
+        ],
+    ),
+    "users": (
+        "users",
+        {},
+        [
+            ("id", STRING),
+            ("name", STRING),
+            ("fullname", STRING),
+            ("email", STRING),
+            ("site_role", STRING),
+            ("auth_setting", STRING),
+            ("domain_name", STRING),
+            ("external_auth_user_id", STRING),
+            ("last_login", TIMESTAMP),
+        ],
+    ),
+}
+
+
+def item_to_dict(item: Any) -> dict[str, Any]:
+    """Flatten the public properties of a model item into a dict of JSON-friendly values.
+
+    Properties that have not been populated are left out, and lazy fetchers bound by the
+    populate_* methods are never called.
+    """
+    row: dict[str, Any] = {}
+    attributes = slot_attributes(item)
+    for name in dir(type(item)):
+        if name.startswith("_") or not isinstance(getattr(type(item), name), property):
+            continue
+        if callable(attributes.get(f"_{name}")):
+            continue
+        try:
+            value = getattr(item, name)
+        except UnpopulatedPropertyError:
+            continue
+        row[name] = _to_json_value(value)
+    for name, value in attributes.items():
+        if not name.startswith("_") and name not in row and not callable(value):
+            row[name] = _to_json_value(value)
+    return row
+
+
+def _to_json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, datetime.datetime):
+        return format_datetime(value)
+    if isinstance(value, dict):
+        return {str(k): _to_json_value(v) for k, v in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(_to_json_value(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(v) for v in value]
+    return getattr(value, "id", None) or str(value)
+
+
+def export_ndjson(
+    endpoint: Any,
+    path: str,
+    request_opts: Optional[RequestOptions] = None,
+    checkpoint_path: Optional[str] = None,
+    to_row: Callable[[Any], dict[str, Any]] = item_to_dict,
+    checkpoint_every: int = 100,
+    **kwargs,
+) -> int:
+    """Write every item of an endpoint to `path` as newline delimited JSON, one item per line.
+
+    Rows are written as the pages arrive. Every `checkpoint_every` rows the pager's checkpoint
+    and the length of the output file are saved to `checkpoint_path` (by default `path`
+    + ".checkpoint"). If that file exists when the export starts, the output is truncated to
+    the saved length and the crawl continues from the checkpoint, so an interrupted export
+    can simply be run again. The checkpoint file is removed once the export completes.
+
+    Returns the number of rows written by this call.
+
+    Example:
+    >>> export_ndjson(server.views, "views.ndjson", usage=True)
+    """
+    checkpoint_path = checkpoint_path or path + CHECKPOINT_SUFFIX
+    state = _load_state(checkpoint_path)
+    if state is None:
+        pager: Pager = Pager(endpoint, request_opts, **kwargs)
+        mode = "wb"
+    else:
+        checkpoint = PaginationCheckpoint.from_dict(state["checkpoint"])
+        logger.info(f"Resuming export to {path} from {checkpoint}")
+        pager = Pager.from_checkpoint(endpoint, checkpoint)
+        mode = "ab"
+
+    rows = 0
+    with open(path, mode) as output:
+        if state is not None:
+            # Drop anything written after the last checkpoint, it will be fetched again
+            output.truncate(state["position"])
+        for item in pager:
+            output.write(json.dumps(to_row(item)).encode("utf-8") + b"\n")
+            rows += 1
+            if rows % checkpoint_every == 0:
+                _save_state(checkpoint_path, pager.checkpoint, output)
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return rows
+
+
+def _load_state(checkpoint_path: str) -> Optional[dict[str, Any]]:
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path) as f:
+        return json.load(f)
+
+
+def _save_state(checkpoint_path: str, checkpoint: PaginationCheckpoint, output) -> None:
+    output.flush()
+    state = {"checkpoint": checkpoint.to_dict(), "position": output.tell()}
+    temp_path = checkpoint_path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(temp_path, checkpoint_path)
+
+
+def column_value(item: Any, name: str, kind: str) -> Any:
+    try:
+        value = getattr(item, name)
+    except UnpopulatedPropertyError:
+        return None
+    if value is None:
+        return None
+    if kind == INT:
+        return int(value)
+    if kind == FLOAT:
+        return float(value)
+    if kind == BOOL:
+        return value if isinstance(value, bool) else str(value).lower() == "true"
+    if kind == LIST:
+        return sorted(value)
+    if kind == TIMESTAMP:
+        return value
+    return str(value)
+
+
+def to_columns(items: Iterable[Any], columns: Columns) -> dict[str, list[Any]]:
+    """Read the `columns` of each item into one list of values per column."""
+    batch: dict[str, list[Any]] = {name: [] for name, _ in columns}
+    for item in items:
+        for name, kind in columns:
+            batch[name].append(column_value(item, name, kind))
+    return batch
+
+
+class InventoryWriter(abc.ABC):
+    """Writes batches of columns, as built by `to_columns`, to a file in one of the export formats."""
+
+    def __init__(self, path: str, columns: Columns) -> None:
+        self.path = path
+        self.columns = columns
+        self.rows = 0
+
+    def write(self, batch: dict[str, list[Any]]) -> None:
+        count = len(batch[self.columns[0][0]]) if self.columns else 0
+        if count:
+            self._write(batch)
+            self.rows += count
+
+    @abc.abstractmethod
+    def _write(self, batch: dict[str, list[Any]]) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    @staticmethod
+    def create(fmt: str, path: str, columns: Columns) -> "InventoryWriter":
+        if fmt == NDJSON:
+            return NdjsonWriter(path, columns)
+        if fmt == CSV:
+            return CsvWriter(path, columns)
+        if fmt == PARQUET:
+            return ParquetWriter(path, columns)
+        raise ValueError(f"Unknown export format {fmt}, expected one of {', '.join(FORMATS)}")
+
+
+class NdjsonWriter(InventoryWriter):
+    def __init__(self, path: str, columns: Columns) -> None:
+        super().__init__(path, columns)
+        self._file = open(path, "w", encoding="utf-8")
+
+    def _write(self, batch: dict[str, list[Any]]) -> None:
+        names = list(batch)
+        for row in zip(*batch.values()):
+            self._file.write(json.dumps(dict(zip(names, map(_to_json_value, row)))) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CsvWriter(InventoryWriter):
+    def __init__(self, path: str, columns: Columns) -> None:
+        super().__init__(path, columns)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([name for name, _ in columns])
+
+    def _write(self, batch: dict[str, list[Any]]) -> None:
+        self._writer.writerows(zip(*(map(_to_csv_value, values) for values in batch.values())))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _to_csv_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime.datetime):
+        return format_datetime(value)
+    if isinstance(value, list):
+        return ",".join(value)
+    return value
+
+
+class ParquetWriter(InventoryWriter):
+    def __init__(self, path: str, columns: Columns) -> None:
+        if pyarrow is None:
+            raise ImportError("Parquet export requires pyarrow, export to csv or ndjson instead.")
+        super().__init__(path, columns)
+        types = {
+            STRING: pyarrow.string(),
+            INT: pyarrow.int64(),
+            FLOAT: pyarrow.float64(),
+            BOOL: pyarrow.bool_(),
+            TIMESTAMP: pyarrow.timestamp("s", tz="UTC"),
+            LIST: pyarrow.list_(pyarrow.string()),
+        }
+        self._schema = pyarrow.schema([(name, types[kind]) for name, kind in columns])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def _write(self, batch: dict[str, list[Any]]) -> None:
+        self._writer.write_table(pyarrow.table(batch, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class _ChunkReader(io.RawIOBase):
+    """A readable stream over an iterator of byte chunks, such as a streamed response body."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self) -> None:
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+        super().close()
+
+
+def read_csv_rows(
+    chunks: Iterable[bytes], encoding: str = "utf-8-sig", buffer_size: int = 64 * 1024
+) -> Iterator[list[str]]:
+    """Parse CSV rows from byte chunks as they arrive, decoding `buffer_size` bytes at a time."""
+    with io.TextIOWrapper(io.BufferedReader(_ChunkReader(chunks), buffer_size), encoding, newline="") as text:
+        yield from csv.reader(text)
+
+
+_CSV_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    STRING: str,
+    INT: int,
+    FLOAT: float,
+    BOOL: lambda value: value.lower() == "true",
+}
+
+
+def csv_converters(header: list[str], types: dict[str, str]) -> list[Callable[[str], Any]]:
+    """One function per column of `header` that reads a value of the type given for it in `types`."""
+    if unknown := set(types) - set(header):
+        raise ValueError(f"Columns {', '.join(sorted(unknown))} are not in the data")
+    if unsupported := set(types.values()) - set(_CSV_CONVERTERS):
+        raise ValueError(f"Columns cannot be read as {', '.join(sorted(unsupported))}")
+    return [_CSV_CONVERTERS[types.get(name, STRING)] for name in header]
+
+
+def convert_csv_row(row: list[str], converters: list[Callable[[str], Any]]) -> list[Any]:
+    # Empty cells are missing values whatever the type of their column, as are cells missing
+    # at the end of a short row
+    values = [convert(value) if value != "" else None for convert, value in zip(converters, row)]
+    return values + [None] * (len(converters) - len(values))
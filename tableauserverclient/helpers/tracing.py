@@ -0,0 +1,103 @@
+"""
+Optional tracing of endpoint calls, HTTP requests and response parsing.
+
+Tracing is off until a tracer is assigned to `Server.tracer`. Any object with the OpenTelemetry
+Tracer interface (`start_as_current_span`) can be used; with opentelemetry-api installed,
+`opentelemetry_tracer()` returns the tracer of the globally configured provider and the trace
+context is propagated to the server in the request headers.
+
+Example:
+>>> server.tracer = opentelemetry_tracer()
+>>> server.workbooks.publish(workbook, "Sales.twbx", "Overwrite")
+"""
+
+import contextlib
+import re
+import threading
+from typing import Any, Optional
+from collections.abc import Iterator
+
+try:
+    from opentelemetry import propagate as _propagate
+    from opentelemetry import trace as _trace
+except ImportError:
+    _propagate = None  # type: ignore[assignment]
+    _trace = None  # type: ignore[assignment]
+
+_local = threading.local()
+
+
+def opentelemetry_tracer() -> Any:
+    if _trace is None:
+        raise ImportError("Tracing with OpenTelemetry requires opentelemetry-api to be installed.")
+    from tableauserverclient import get_versions
+
+    return _trace.get_tracer("tableauserverclient", get_versions()["version"])
+
+
+def active_tracer() -> Optional[Any]:
+    """The tracer of the endpoint call running on this thread, used to trace response parsing."""
+    return getattr(_local, "tracer", None)
+
+
+def operation_name(endpoint: Any, method: str) -> str:
+    # The endpoint's attribute name on Server, e.g. FlowTasks.create -> "flow_tasks.create"
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", endpoint.__class__.__name__).lower() + "." + method
+
+
+@contextlib.contextmanager
+def endpoint_span(tracer: Any, endpoint: Any, method: str, args: tuple) -> Iterator[Any]:
+    """A span around an endpoint call, with the id or name of the item it acts on."""
+    attributes = {"tsc.endpoint": endpoint.__class__.__name__, "tsc.operation": method}
+    if args:
+        item = args[0]
+        if isinstance(item, str):
+            attributes["tsc.item.id"] = item
+        else:
+            for name in ("id", "name"):
+                value = getattr(item, name, None)
+                if isinstance(value, str):
+                    attributes[f"tsc.item.{name}"] = value
+    previous = active_tracer()
+    _local.tracer = tracer
+    try:
+        with tracer.start_as_current_span(operation_name(endpoint, method), attributes=attributes) as span:
+            yield span
+    finally:
+        _local.tracer = previous
+
+
+def set_result_attributes(span: Any, result: Any) -> None:
+    # e.g. the id of a published item, or of the job started by a refresh
+    value = getattr(result, "id", None)
+    if isinstance(value, str):
+        span.set_attribute("tsc.result.id", value)
+
+
+@contextlib.contextmanager
+def request_span(tracer: Any, method: str, url: str, headers: dict, content: Any) -> Iterator[Any]:
+    """A client span around an HTTP request, propagating its context in the request headers."""
+    attributes: dict[str, Any] = {"http.request.method": method, "url.full": url}
+    if isinstance(content, (bytes, str)):
+        attributes["http.request.body.size"] = len(content)
+    kwargs = {"kind": _trace.SpanKind.CLIENT} if _trace is not None else {}
+    with tracer.start_as_current_span(f"HTTP {method}", attributes=attributes, **kwargs) as span:
+        if _propagate is not None:
+            _propagate.inject(headers)
+        yield span
+
+
+def set_response_attributes(span: Any, response: Any, streamed: bool) -> None:
+    span.set_attribute("http.response.status_code", response.status_code)
+    if streamed:
+        length = response.headers.get("Content-Length")
+        if length:
+            span.set_attribute("http.response.body.size", int(length))
+    else:
+        span.set_attribute("http.response.body.size", len(response.content))
+
+
+@contextlib.contextmanager
+def parse_span(tracer: Any, size: int) -> Iterator[Any]:
+    with tracer.start_as_current_span("parse", attributes={"tsc.response.bytes": size}) as span:
+        yield span
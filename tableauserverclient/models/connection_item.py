@@ -5,6 +5,7 @@ from defusedxml.ElementTree import fromstring
 
 from .connection_credentials import ConnectionCredentials
 from .property_decorators import property_is_boolean
+from .xml_backend import children_by_tag
 from tableauserverclient.helpers.logging import logger
 
 
@@ -74,7 +75,7 @@ class ConnectionItem:
             connection_item._query_tagging = (
                 string_to_bool(s) if (s := connection_xml.get("queryTagging", None)) else None
             )
-            datasource_elem = connection_xml.find(".//t:datasource", namespaces=ns)
+            datasource_elem = children_by_tag(connection_xml, ns).get("datasource")
             if datasource_elem is not None:
                 connection_item._datasource_id = datasource_elem.get("id", None)
                 connection_item._datasource_name = datasource_elem.get("name", None)
@@ -102,7 +103,7 @@ class ConnectionItem:
             connection_item.server_address = connection_xml.get("serverAddress", None)
             connection_item.server_port = connection_xml.get("serverPort", None)
 
-            connection_credentials = connection_xml.find(".//t:connectionCredentials", namespaces=ns)
+            connection_credentials = children_by_tag(connection_xml, ns).get("connectionCredentials")
 
             if connection_credentials is not None:
                 connection_item.connection_credentials = ConnectionCredentials.from_xml_element(
@@ -1,6 +1,5 @@
 from datetime import datetime
 
-from defusedxml import ElementTree
 from defusedxml.ElementTree import fromstring, tostring
 from typing import Callable, Optional
 
@@ -8,6 +7,7 @@ from .exceptions import UnpopulatedPropertyError
 from .user_item import UserItem
 from .view_item import ViewItem
 from .workbook_item import WorkbookItem
+from .xml_backend import children_by_tag
 from ..datetime_helpers import parse_datetime
 
 
@@ -126,9 +126,10 @@ class CustomViewItem:
         all_view_xml = parsed_response.findall(".//t:customView", namespaces=ns)
         for custom_view_xml in all_view_xml:
             cv_item = cls()
-            view_elem: ElementTree = custom_view_xml.find(".//t:view", namespaces=ns)
-            workbook_elem: str = custom_view_xml.find(".//t:workbook", namespaces=ns)
-            owner_elem: str = custom_view_xml.find(".//t:owner", namespaces=ns)
+            children = children_by_tag(custom_view_xml, ns)
+            view_elem = children.get("view")
+            workbook_elem = children.get("workbook")
+            owner_elem = children.get("owner")
             cv_item._created_at = parse_datetime(custom_view_xml.get("createdAt", None))
             cv_item._updated_at = parse_datetime(custom_view_xml.get("updatedAt", None))
             cv_item._content_url = custom_view_xml.get("contentUrl", None)
@@ -8,6 +8,7 @@ from .property_decorators import (
     property_not_empty,
     property_is_boolean,
 )
+from .xml_backend import children_by_tag
 
 
 class DatabaseItem:
@@ -277,7 +278,7 @@ class DatabaseItem:
     @staticmethod
     def _parse_element(database_xml, ns):
         database_values = database_xml.attrib.copy()
-        contact = database_xml.find(".//t:contact", namespaces=ns)
+        contact = children_by_tag(database_xml, ns).get("contact")
         if contact is not None:
             database_values["contact"] = contact.attrib.copy()
         return database_values
@@ -2,12 +2,12 @@ import copy
 import datetime
 import xml.etree.ElementTree as ET
 from typing import Optional
-
-from defusedxml.ElementTree import fromstring
+from collections.abc import Iterator
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.models.connection_item import ConnectionItem
 from tableauserverclient.models.exceptions import UnpopulatedPropertyError
+from tableauserverclient.models.pagination_item import PaginationItem
 from tableauserverclient.models.permissions_item import PermissionsRule
 from tableauserverclient.models.property_decorators import (
     property_not_nullable,
@@ -15,10 +15,43 @@ from tableauserverclient.models.property_decorators import (
     property_is_enum,
 )
 from tableauserverclient.models.revision_item import RevisionItem
+from tableauserverclient.models.streaming import stream_response
 from tableauserverclient.models.tag_item import TagItem
+from tableauserverclient.models.xml_backend import XPath, children_by_tag, fromstring
+
+_DATASOURCE = XPath(".//t:datasource")
 
 
 class DatasourceItem:
+    __slots__ = (
+        # Keeps attributes that callers add to items working; the dict is only created if they do
+        "__dict__",
+        "_ask_data_enablement",
+        "_certification_note",
+        "_certified",
+        "_connections",
+        "_content_url",
+        "_created_at",
+        "_data_quality_warnings",
+        "_datasource_type",
+        "_description",
+        "_encrypt_extracts",
+        "_has_extracts",
+        "_id",
+        "_initial_tags",
+        "_permissions",
+        "_project_id",
+        "_project_name",
+        "_revisions",
+        "_size",
+        "_updated_at",
+        "_use_remote_query_agent",
+        "_webpage_url",
+        "name",
+        "owner_id",
+        "tags",
+    )
+
     class AskDataEnablement:
         Enabled = "Enabled"
         Disabled = "Disabled"
@@ -200,7 +233,7 @@ class DatasourceItem:
         self._revisions = revisions
 
     def _parse_common_elements(self, datasource_xml, ns):
-        if not isinstance(datasource_xml, ET.Element):
+        if not ET.iselement(datasource_xml):
             datasource_xml = fromstring(datasource_xml).find(".//t:datasource", namespaces=ns)
         if datasource_xml is not None:
             (
@@ -312,13 +345,17 @@ class DatasourceItem:
     def from_response(cls, resp: str, ns: dict) -> list["DatasourceItem"]:
         all_datasource_items = list()
         parsed_response = fromstring(resp)
-        all_datasource_xml = parsed_response.findall(".//t:datasource", namespaces=ns)
+        all_datasource_xml = _DATASOURCE.all(parsed_response, ns)
 
         for datasource_xml in all_datasource_xml:
             datasource_item = cls.from_xml(datasource_xml, ns)
             all_datasource_items.append(datasource_item)
         return all_datasource_items
 
+    @classmethod
+    def stream_response(cls, resp: bytes, ns: dict) -> tuple[Iterator["DatasourceItem"], PaginationItem]:
+        return stream_response(resp, "datasource", ns, cls.from_xml)
+
     @classmethod
     def from_xml(cls, datasource_xml, ns):
         datasource_item = cls()
@@ -341,26 +378,27 @@ class DatasourceItem:
         use_remote_query_agent = datasource_xml.get("useRemoteQueryAgent", None)
         webpage_url = datasource_xml.get("webpageUrl", None)
         size = datasource_xml.get("size", None)
+        children = children_by_tag(datasource_xml, ns)
 
         tags = None
-        tags_elem = datasource_xml.find(".//t:tags", namespaces=ns)
+        tags_elem = children.get("tags")
         if tags_elem is not None:
             tags = TagItem.from_xml_element(tags_elem, ns)
 
         project_id = None
         project_name = None
-        project_elem = datasource_xml.find(".//t:project", namespaces=ns)
+        project_elem = children.get("project")
         if project_elem is not None:
             project_id = project_elem.get("id", None)
             project_name = project_elem.get("name", None)
 
         owner_id = None
-        owner_elem = datasource_xml.find(".//t:owner", namespaces=ns)
+        owner_elem = children.get("owner")
         if owner_elem is not None:
             owner_id = owner_elem.get("id", None)
 
         ask_data_enablement = None
-        ask_data_elem = datasource_xml.find(".//t:askData", namespaces=ns)
+        ask_data_elem = children.get("askData")
         if ask_data_elem is not None:
             ask_data_enablement = ask_data_elem.get("enablement", None)
 
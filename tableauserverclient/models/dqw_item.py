@@ -1,6 +1,7 @@
 from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
+from tableauserverclient.models.xml_backend import children_by_tag
 
 
 class DQWItem:
@@ -126,7 +127,7 @@ class DQWItem:
             dqw._updated_at = parse_datetime(dqw_elem.get("updatedAt", None))
 
             owner_id = None
-            owner_tag = dqw_elem.find(".//t:owner", namespaces=ns)
+            owner_tag = children_by_tag(dqw_elem, ns).get("owner")
             if owner_tag is not None:
                 owner_id = owner_tag.get("id", None)
             dqw._owner_id = owner_id
@@ -2,16 +2,20 @@ import copy
 import datetime
 import xml.etree.ElementTree as ET
 from typing import Optional
-
-from defusedxml.ElementTree import fromstring
+from collections.abc import Iterator
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.models.connection_item import ConnectionItem
 from tableauserverclient.models.dqw_item import DQWItem
 from tableauserverclient.models.exceptions import UnpopulatedPropertyError
+from tableauserverclient.models.pagination_item import PaginationItem
 from tableauserverclient.models.permissions_item import Permission
 from tableauserverclient.models.property_decorators import property_not_nullable
+from tableauserverclient.models.streaming import stream_response
 from tableauserverclient.models.tag_item import TagItem
+from tableauserverclient.models.xml_backend import XPath, children_by_tag, fromstring
+
+_FLOW = XPath(".//t:flow")
 
 
 class FlowItem:
@@ -105,7 +109,7 @@ class FlowItem:
         self._data_quality_warnings = dqws
 
     def _parse_common_elements(self, flow_xml, ns):
-        if not isinstance(flow_xml, ET.Element):
+        if not ET.iselement(flow_xml):
             flow_xml = fromstring(flow_xml).find(".//t:flow", namespaces=ns)
         if flow_xml is not None:
             (
@@ -173,13 +177,17 @@ class FlowItem:
     def from_response(cls, resp, ns) -> list["FlowItem"]:
         all_flow_items = list()
         parsed_response = fromstring(resp)
-        all_flow_xml = parsed_response.findall(".//t:flow", namespaces=ns)
+        all_flow_xml = _FLOW.all(parsed_response, ns)
 
         for flow_xml in all_flow_xml:
             flow_item = cls.from_xml(flow_xml, ns)
             all_flow_items.append(flow_item)
         return all_flow_items
 
+    @classmethod
+    def stream_response(cls, resp: bytes, ns) -> tuple[Iterator["FlowItem"], PaginationItem]:
+        return stream_response(resp, "flow", ns, cls.from_xml)
+
     @classmethod
     def from_xml(cls, flow_xml, ns) -> "FlowItem":
         (
@@ -217,21 +225,22 @@ class FlowItem:
         webpage_url = flow_xml.get("webpageUrl", None)
         created_at = parse_datetime(flow_xml.get("createdAt", None))
         updated_at = parse_datetime(flow_xml.get("updatedAt", None))
+        children = children_by_tag(flow_xml, ns)
 
         tags = None
-        tags_elem = flow_xml.find(".//t:tags", namespaces=ns)
+        tags_elem = children.get("tags")
         if tags_elem is not None:
             tags = TagItem.from_xml_element(tags_elem, ns)
 
         project_id = None
         project_name = None
-        project_elem = flow_xml.find(".//t:project", namespaces=ns)
+        project_elem = children.get("project")
         if project_elem is not None:
             project_id = project_elem.get("id", None)
             project_name = project_elem.get("name", None)
 
         owner_id = None
-        owner_elem = flow_xml.find(".//t:owner", namespaces=ns)
+        owner_elem = children.get("owner")
         if owner_elem is not None:
             owner_id = owner_elem.get("id", None)
 
@@ -6,6 +6,7 @@ from .exceptions import UnpopulatedPropertyError
 from .property_decorators import property_not_empty, property_is_enum
 from .reference_item import ResourceReference
 from .user_item import UserItem
+from .xml_backend import children_by_tag
 
 if TYPE_CHECKING:
     from tableauserverclient.server import Pager
@@ -88,13 +89,15 @@ class GroupItem:
             group_item = cls(name)
             group_item._id = group_xml.get("id", None)
 
+            children = children_by_tag(group_xml, ns)
+
             # Domain name is returned in a domain element for some calls
-            domain_elem = group_xml.find(".//t:domain", namespaces=ns)
+            domain_elem = children.get("domain")
             if domain_elem is not None:
                 group_item.domain_name = domain_elem.get("name", None)
 
             # Import element is returned for both local and AD groups (2020.3+)
-            import_elem = group_xml.find(".//t:import", namespaces=ns)
+            import_elem = children.get("import")
             if import_elem is not None:
                 group_item.domain_name = import_elem.get("domainName", None)
                 group_item.license_mode = import_elem.get("grantLicenseMode", None)
@@ -6,6 +6,7 @@ from tableauserverclient.datetime_helpers import parse_datetime
 from .property_decorators import property_is_boolean, property_is_datetime
 from .tag_item import TagItem
 from .permissions_item import Permission
+from .xml_backend import children_by_tag
 
 
 class MetricItem:
@@ -144,15 +145,16 @@ class MetricItem:
         metric_item._created_at = parse_datetime(metric_xml.get("createdAt", None))
         metric_item._updated_at = parse_datetime(metric_xml.get("updatedAt", None))
         metric_item._suspended = string_to_bool(metric_xml.get("suspended", ""))
-        for owner in metric_xml.findall(".//t:owner", namespaces=ns):
+        children = children_by_tag(metric_xml, ns)
+        if (owner := children.get("owner")) is not None:
             metric_item._owner_id = owner.get("id", None)
-        for project in metric_xml.findall(".//t:project", namespaces=ns):
+        if (project := children.get("project")) is not None:
             metric_item._project_id = project.get("id", None)
             metric_item._project_name = project.get("name", None)
-        for view in metric_xml.findall(".//t:underlyingView", namespaces=ns):
+        if (view := children.get("underlyingView")) is not None:
             metric_item._view_id = view.get("id", None)
         tags = set()
-        tags_elem = metric_xml.find(".//t:tags", namespaces=ns)
+        tags_elem = children.get("tags")
         if tags_elem is not None:
             all_tags = TagItem.from_xml_element(tags_elem, ns)
             tags = all_tags
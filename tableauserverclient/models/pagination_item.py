@@ -1,4 +1,6 @@
-from defusedxml.ElementTree import fromstring
+from tableauserverclient.models.xml_backend import XPath, fromstring
+
+_PAGINATION = XPath("t:pagination")
 
 
 class PaginationItem:
@@ -25,12 +27,17 @@ class PaginationItem:
     @classmethod
     def from_response(cls, resp, ns) -> "PaginationItem":
         parsed_response = fromstring(resp)
-        pagination_xml = parsed_response.find("t:pagination", namespaces=ns)
+        pagination_xml = _PAGINATION.first(parsed_response, ns)
+        if pagination_xml is None:
+            return cls()
+        return cls.from_xml(pagination_xml)
+
+    @classmethod
+    def from_xml(cls, pagination_xml) -> "PaginationItem":
         pagination_item = cls()
-        if pagination_xml is not None:
-            pagination_item._page_number = int(pagination_xml.get("pageNumber", "-1"))
-            pagination_item._page_size = int(pagination_xml.get("pageSize", "-1"))
-            pagination_item._total_available = int(pagination_xml.get("totalAvailable", "-1"))
+        pagination_item._page_number = int(pagination_xml.get("pageNumber", "-1"))
+        pagination_item._page_size = int(pagination_xml.get("pageSize", "-1"))
+        pagination_item._total_available = int(pagination_xml.get("totalAvailable", "-1"))
         return pagination_item
 
     @classmethod
@@ -100,6 +100,18 @@ class PermissionsRule:
 
         return PermissionsRule(self.grantee, new_capabilities)
 
+    def __sub__(self, other: "PermissionsRule") -> "PermissionsRule":
+        """The capabilities of this rule that `other` does not have with the same mode."""
+        if self.grantee != other.grantee:
+            raise ValueError("Cannot subtract two permissions rules with different grantees")
+
+        new_capabilities = {
+            capability: mode
+            for capability, mode in self.capabilities.items()
+            if other.capabilities.get(capability) != mode
+        }
+        return PermissionsRule(self.grantee, new_capabilities)
+
     @classmethod
     def from_response(cls, resp, ns=None) -> list["PermissionsRule"]:
         parsed_response = fromstring(resp)
@@ -1,11 +1,15 @@
 import logging
 import xml.etree.ElementTree as ET
 from typing import Optional
-
-from defusedxml.ElementTree import fromstring
+from collections.abc import Iterator
 
 from tableauserverclient.models.exceptions import UnpopulatedPropertyError
+from tableauserverclient.models.pagination_item import PaginationItem
 from tableauserverclient.models.property_decorators import property_is_enum, property_not_empty
+from tableauserverclient.models.streaming import stream_response
+from tableauserverclient.models.xml_backend import XPath, fromstring
+
+_PROJECT = XPath(".//t:project")
 
 
 class ProjectItem:
@@ -126,7 +130,7 @@ class ProjectItem:
         return self.name.lower() == "default"
 
     def _parse_common_tags(self, project_xml, ns):
-        if not isinstance(project_xml, ET.Element):
+        if not ET.iselement(project_xml):
             project_xml = fromstring(project_xml).find(".//t:project", namespaces=ns)
 
         if project_xml is not None:
@@ -169,13 +173,17 @@ class ProjectItem:
     def from_response(cls, resp, ns) -> list["ProjectItem"]:
         all_project_items = list()
         parsed_response = fromstring(resp)
-        all_project_xml = parsed_response.findall(".//t:project", namespaces=ns)
+        all_project_xml = _PROJECT.all(parsed_response, ns)
 
         for project_xml in all_project_xml:
             project_item = cls.from_xml(project_xml)
             all_project_items.append(project_item)
         return all_project_items
 
+    @classmethod
+    def stream_response(cls, resp: bytes, ns) -> tuple[Iterator["ProjectItem"], PaginationItem]:
+        return stream_response(resp, "project", ns, cls.from_xml)
+
     @classmethod
     def from_xml(cls, project_xml, namespace=None) -> "ProjectItem":
         project_item = cls()
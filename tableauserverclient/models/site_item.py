@@ -11,6 +11,7 @@ from .property_decorators import (
     property_not_nullable,
     property_is_int,
 )
+from .xml_backend import children_by_tag
 
 VALID_CONTENT_URL_RE = r"^[a-zA-Z0-9_\-]*$"
 
@@ -1057,7 +1058,7 @@ class SiteItem:
 
         num_users = None
         storage = None
-        usage_elem = site_xml.find(".//t:usage", namespaces=ns)
+        usage_elem = children_by_tag(site_xml, ns).get("usage")
         if usage_elem is not None:
             num_users = usage_elem.get("numUsers", None)
             storage = usage_elem.get("storage", None)
@@ -0,0 +1,19 @@
+from typing import Any
+
+
+def slot_attributes(obj: Any) -> dict[str, Any]:
+    """
+    The attributes of `obj` as a dict, like vars(obj), for objects that keep some or all of their
+    attributes in __slots__. Slots that have not been assigned are left out.
+    """
+    attributes: dict[str, Any] = {}
+    for cls in reversed(type(obj).__mro__):
+        for name in cls.__dict__.get("__slots__", ()):
+            if name in attributes or name in ("__dict__", "__weakref__"):
+                continue
+            try:
+                attributes[name] = getattr(obj, name)
+            except AttributeError:
+                continue
+    attributes.update(getattr(obj, "__dict__", {}))
+    return attributes
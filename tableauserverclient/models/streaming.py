@@ -0,0 +1,70 @@
+import xml.etree.ElementTree as ET
+from typing import Callable, Optional, TypeVar, Union
+from collections.abc import Iterator
+
+from tableauserverclient.models.pagination_item import PaginationItem
+from tableauserverclient.models.xml_backend import iterparse
+
+T = TypeVar("T")
+
+
+def iter_elements(
+    resp: Union[bytes, str], tag: str, ns: dict[str, str], include_pagination: bool = False
+) -> Iterator[ET.Element]:
+    """Incrementally parse a response, yielding each complete `tag` element in document order.
+
+    Parsing goes through the selected XML backend, so the same protections apply as for `fromstring`.
+    Each element is detached from the tree once the consumer moves on to the next one, so at most
+    one item's subtree is held in memory at a time. Elements of the same tag nested inside a
+    yielded element are part of that element and are not yielded separately.
+
+    With `include_pagination`, the response's top level pagination element is yielded as well.
+    """
+    qualified_tag = f"{{{ns['t']}}}{tag}"
+    pagination_tag = f"{{{ns['t']}}}pagination"
+    open_elements: list[ET.Element] = []
+    depth = 0
+    for event, element in iterparse(resp, events=("start", "end")):
+        if event == "start":
+            open_elements.append(element)
+            if element.tag == qualified_tag:
+                depth += 1
+            continue
+
+        open_elements.pop()
+        if include_pagination and element.tag == pagination_tag and len(open_elements) == 1:
+            yield element
+        elif element.tag == qualified_tag:
+            depth -= 1
+            if depth == 0:
+                yield element
+                element.clear()
+                if open_elements:
+                    open_elements[-1].remove(element)
+
+
+def stream_response(
+    resp: Union[bytes, str],
+    tag: str,
+    ns: dict[str, str],
+    from_xml: Callable[[ET.Element, dict[str, str]], T],
+) -> tuple[Iterator[T], PaginationItem]:
+    """Parse a list response lazily, returning an iterator of models and the response's pagination.
+
+    The pagination element comes before the items in REST API responses, so it is read up front
+    and the models are then built one element at a time as the iterator is consumed.
+    """
+    elements = iter_elements(resp, tag, ns, include_pagination=True)
+    pagination_item = PaginationItem()
+    first: Optional[ET.Element] = next(elements, None)
+    if first is not None and first.tag != f"{{{ns['t']}}}{tag}":
+        pagination_item = PaginationItem.from_xml(first)
+        first = None
+
+    def items() -> Iterator[T]:
+        if first is not None:
+            yield from_xml(first, ns)
+        for element in elements:
+            yield from_xml(element, ns)
+
+    return items(), pagination_item
@@ -2,6 +2,7 @@ from defusedxml.ElementTree import fromstring
 
 from .exceptions import UnpopulatedPropertyError
 from .property_decorators import property_not_empty, property_is_boolean
+from .xml_backend import children_by_tag
 
 
 class TableItem:
@@ -148,7 +149,7 @@ class TableItem:
     def _parse_element(table_xml, ns):
         table_values = table_xml.attrib.copy()
 
-        contact = table_xml.find(".//t:contact", namespaces=ns)
+        contact = children_by_tag(table_xml, ns).get("contact")
         if contact is not None:
             table_values["contact"] = contact.attrib.copy()
 
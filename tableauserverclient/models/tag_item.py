@@ -1,6 +1,7 @@
 import xml.etree.ElementTree as ET
+from tableauserverclient.models.xml_backend import XPath, fromstring
 
-from defusedxml.ElementTree import fromstring
+_TAG = XPath(".//t:tag")
 
 
 class TagItem:
@@ -11,7 +12,7 @@ class TagItem:
     @classmethod
     def from_xml_element(cls, parsed_response: ET.Element, ns) -> set[str]:
         all_tags = set()
-        tag_elem = parsed_response.findall(".//t:tag", namespaces=ns)
+        tag_elem = _TAG.all(parsed_response, ns)
         for tag_xml in tag_elem:
             tag = tag_xml.get("label", None)
             if tag is not None:
@@ -3,16 +3,19 @@ import xml.etree.ElementTree as ET
 from datetime import datetime
 from enum import IntEnum
 from typing import Optional, TYPE_CHECKING
-
-from defusedxml.ElementTree import fromstring
+from collections.abc import Iterator
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from .exceptions import UnpopulatedPropertyError
+from .pagination_item import PaginationItem
 from .property_decorators import (
     property_is_enum,
     property_not_empty,
 )
 from .reference_item import ResourceReference
+from .slots import slot_attributes
+from .streaming import stream_response
+from .xml_backend import children_by_tag, fromstring
 
 if TYPE_CHECKING:
     from tableauserverclient.server import Pager
@@ -48,6 +51,23 @@ class UserItem:
         TableauIDWithMFA = "TableauIDWithMFA"
         ServerDefault = "ServerDefault"
 
+    __slots__ = (
+        # Keeps attributes that callers add to items working; the dict is only created if they do
+        "__dict__",
+        "_auth_setting",
+        "_domain_name",
+        "_external_auth_user_id",
+        "_favorites",
+        "_groups",
+        "_id",
+        "_last_login",
+        "_name",
+        "_site_role",
+        "_workbooks",
+        "email",
+        "fullname",
+    )
+
     def __init__(
         self, name: Optional[str] = None, site_role: Optional[str] = None, auth_setting: Optional[str] = None
     ) -> None:
@@ -72,7 +92,7 @@ class UserItem:
         return f"<User {self.id} name={self.name} role={str_site_role}>"
 
     def __repr__(self):
-        return self.__str__() + "  { " + ", ".join(" % s: % s" % item for item in vars(self).items()) + "}"
+        return self.__str__() + "  { " + ", ".join(" % s: % s" % item for item in slot_attributes(self).items()) + "}"
 
     @property
     def auth_setting(self) -> Optional[str]:
@@ -161,7 +181,7 @@ class UserItem:
         self._groups = groups
 
     def _parse_common_tags(self, user_xml, ns) -> "UserItem":
-        if not isinstance(user_xml, ET.Element):
+        if not ET.iselement(user_xml):
             user_xml = fromstring(user_xml).find(".//t:user", namespaces=ns)
         if user_xml is not None:
             (
@@ -219,38 +239,47 @@ class UserItem:
         element_name = ".//t:owner"
         return cls._parse_xml(element_name, resp, ns)
 
+    @classmethod
+    def stream_response(cls, resp, ns) -> tuple[Iterator["UserItem"], PaginationItem]:
+        return stream_response(resp, UserItem.tag_name, ns, cls.from_xml)
+
     @classmethod
     def _parse_xml(cls, element_name, resp, ns):
         all_user_items = []
         parsed_response = fromstring(resp)
         all_user_xml = parsed_response.findall(element_name, namespaces=ns)
         for user_xml in all_user_xml:
-            (
-                id,
-                name,
-                site_role,
-                last_login,
-                external_auth_user_id,
-                fullname,
-                email,
-                auth_setting,
-                domain_name,
-            ) = cls._parse_element(user_xml, ns)
-            user_item = cls(name, site_role)
-            user_item._set_values(
-                id,
-                name,
-                site_role,
-                last_login,
-                external_auth_user_id,
-                fullname,
-                email,
-                auth_setting,
-                domain_name,
-            )
+            user_item = cls.from_xml(user_xml, ns)
             all_user_items.append(user_item)
         return all_user_items
 
+    @classmethod
+    def from_xml(cls, user_xml, ns) -> "UserItem":
+        (
+            id,
+            name,
+            site_role,
+            last_login,
+            external_auth_user_id,
+            fullname,
+            email,
+            auth_setting,
+            domain_name,
+        ) = cls._parse_element(user_xml, ns)
+        user_item = cls(name, site_role)
+        user_item._set_values(
+            id,
+            name,
+            site_role,
+            last_login,
+            external_auth_user_id,
+            fullname,
+            email,
+            auth_setting,
+            domain_name,
+        )
+        return user_item
+
     @staticmethod
     def as_reference(id_) -> ResourceReference:
         return ResourceReference(id_, UserItem.tag_name)
@@ -267,7 +296,7 @@ class UserItem:
         auth_setting = user_xml.get("authSetting", None)
 
         domain_name = None
-        domain_elem = user_xml.find(".//t:domain", namespaces=ns)
+        domain_elem = children_by_tag(user_xml, ns).get("domain")
         if domain_elem is not None:
             domain_name = domain_elem.get("name", None)
 
@@ -1,18 +1,45 @@
 import copy
 from datetime import datetime
-from requests import Response
 from typing import Callable, Optional
 from collections.abc import Iterator
 
-from defusedxml.ElementTree import fromstring
-
 from tableauserverclient.datetime_helpers import parse_datetime
 from .exceptions import UnpopulatedPropertyError
+from .pagination_item import PaginationItem
 from .permissions_item import PermissionsRule
+from .slots import slot_attributes
+from .streaming import stream_response
 from .tag_item import TagItem
+from .xml_backend import XPath, children_by_tag, fromstring
+
+_VIEW = XPath(".//t:view")
 
 
 class ViewItem:
+    __slots__ = (
+        # Keeps attributes that callers add to items working; the dict is only created if they do
+        "__dict__",
+        "_content_url",
+        "_created_at",
+        "_csv",
+        "_data_acceleration_config",
+        "_excel",
+        "_id",
+        "_image",
+        "_initial_tags",
+        "_name",
+        "_owner_id",
+        "_pdf",
+        "_permissions",
+        "_preview_image",
+        "_project_id",
+        "_sheet_type",
+        "_total_views",
+        "_updated_at",
+        "_workbook_id",
+        "tags",
+    )
+
     def __init__(self) -> None:
         self._content_url: Optional[str] = None
         self._created_at: Optional[datetime] = None
@@ -32,10 +59,7 @@ class ViewItem:
         self._workbook_id: Optional[str] = None
         self._permissions: Optional[Callable[[], list[PermissionsRule]]] = None
         self.tags: set[str] = set()
-        self._data_acceleration_config = {
-            "acceleration_enabled": None,
-            "acceleration_status": None,
-        }
+        self._data_acceleration_config: Optional[dict] = None
 
     def __str__(self):
         return "<ViewItem {} '{}' contentUrl='{}' project={}>".format(
@@ -43,7 +67,7 @@ class ViewItem:
         )
 
     def __repr__(self):
-        return self.__str__() + "  { " + ", ".join(" % s: % s" % item for item in vars(self).items()) + "}"
+        return self.__str__() + "  { " + ", ".join(" % s: % s" % item for item in slot_attributes(self).items()) + "}"
 
     def _set_preview_image(self, preview_image):
         self._preview_image = preview_image
@@ -140,6 +164,11 @@ class ViewItem:
 
     @property
     def data_acceleration_config(self):
+        if self._data_acceleration_config is None:
+            self._data_acceleration_config = {
+                "acceleration_enabled": None,
+                "acceleration_status": None,
+            }
         return self._data_acceleration_config
 
     @data_acceleration_config.setter
@@ -157,13 +186,17 @@ class ViewItem:
         self._permissions = permissions
 
     @classmethod
-    def from_response(cls, resp: "Response", ns, workbook_id="") -> list["ViewItem"]:
+    def from_response(cls, resp: bytes, ns, workbook_id="") -> list["ViewItem"]:
         return cls.from_xml_element(fromstring(resp), ns, workbook_id)
 
+    @classmethod
+    def stream_response(cls, resp: bytes, ns, workbook_id="") -> tuple[Iterator["ViewItem"], PaginationItem]:
+        return stream_response(resp, "view", ns, lambda view_xml, ns: cls.from_xml(view_xml, ns, workbook_id))
+
     @classmethod
     def from_xml_element(cls, parsed_response, ns, workbook_id="") -> list["ViewItem"]:
         all_view_items = list()
-        all_view_xml = parsed_response.findall(".//t:view", namespaces=ns)
+        all_view_xml = _VIEW.all(parsed_response, ns)
         for view_xml in all_view_xml:
             view_item = cls.from_xml(view_xml, ns, workbook_id)
             all_view_items.append(view_item)
@@ -172,12 +205,13 @@ class ViewItem:
     @classmethod
     def from_xml(cls, view_xml, ns, workbook_id="") -> "ViewItem":
         view_item = cls()
-        usage_elem = view_xml.find(".//t:usage", namespaces=ns)
-        workbook_elem = view_xml.find(".//t:workbook", namespaces=ns)
-        owner_elem = view_xml.find(".//t:owner", namespaces=ns)
-        project_elem = view_xml.find(".//t:project", namespaces=ns)
-        tags_elem = view_xml.find(".//t:tags", namespaces=ns)
-        data_acceleration_config_elem = view_xml.find(".//t:dataAccelerationConfig", namespaces=ns)
+        children = children_by_tag(view_xml, ns)
+        usage_elem = children.get("usage")
+        workbook_elem = children.get("workbook")
+        owner_elem = children.get("owner")
+        project_elem = children.get("project")
+        tags_elem = children.get("tags")
+        data_acceleration_config_elem = children.get("dataAccelerationConfig")
         view_item._created_at = parse_datetime(view_xml.get("createdAt", None))
         view_item._updated_at = parse_datetime(view_xml.get("updatedAt", None))
         view_item._id = view_xml.get("id", None)
@@ -1,26 +1,59 @@
 import copy
 import datetime
-import uuid
 import xml.etree.ElementTree as ET
 from typing import Callable, Optional
-
-from defusedxml.ElementTree import fromstring
+from collections.abc import Iterator
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from .connection_item import ConnectionItem
 from .exceptions import UnpopulatedPropertyError
+from .pagination_item import PaginationItem
 from .permissions_item import PermissionsRule
 from .property_decorators import (
     property_is_boolean,
     property_is_data_acceleration_config,
 )
 from .revision_item import RevisionItem
+from .slots import slot_attributes
+from .streaming import stream_response
 from .tag_item import TagItem
 from .view_item import ViewItem
 from .data_freshness_policy_item import DataFreshnessPolicyItem
+from .xml_backend import XPath, children_by_tag, fromstring
+
+_WORKBOOK = XPath(".//t:workbook")
 
 
 class WorkbookItem:
+    __slots__ = (
+        # Keeps attributes that callers add to items working; the dict is only created if they do
+        "__dict__",
+        "_connections",
+        "_content_url",
+        "_created_at",
+        "_data_acceleration_config",
+        "_data_freshness_policy",
+        "_description",
+        "_id",
+        "_initial_tags",
+        "_pdf",
+        "_permissions",
+        "_powerpoint",
+        "_preview_image",
+        "_project_id",
+        "_project_name",
+        "_revisions",
+        "_show_tabs",
+        "_size",
+        "_updated_at",
+        "_views",
+        "_webpage_url",
+        "hidden_views",
+        "name",
+        "owner_id",
+        "tags",
+    )
+
     def __init__(self, project_id: Optional[str] = None, name: Optional[str] = None, show_tabs: bool = False) -> None:
         self._connections = None
         self._content_url = None
@@ -39,17 +72,11 @@ class WorkbookItem:
         self.name = name
         self._description = None
         self.owner_id: Optional[str] = None
-        # workaround for Personal Space workbooks without a project
-        self.project_id: Optional[str] = project_id or uuid.uuid4().__str__()
+        self._project_id: Optional[str] = project_id or None
         self.show_tabs = show_tabs
         self.hidden_views: Optional[list[str]] = None
         self.tags: set[str] = set()
-        self.data_acceleration_config = {
-            "acceleration_enabled": None,
-            "accelerate_now": None,
-            "last_updated_at": None,
-            "acceleration_status": None,
-        }
+        self._data_acceleration_config: Optional[dict] = None
         self.data_freshness_policy = None
         self._permissions = None
 
@@ -61,7 +88,7 @@ class WorkbookItem:
         )
 
     def __repr__(self):
-        return self.__str__() + "  { " + ", ".join(" % s: % s" % item for item in vars(self).items()) + "}"
+        return self.__str__() + "  { " + ", ".join(" % s: % s" % item for item in slot_attributes(self).items()) + "}"
 
     @property
     def connections(self) -> list[ConnectionItem]:
@@ -124,6 +151,7 @@ class WorkbookItem:
 
     @property
     def project_id(self) -> Optional[str]:
+        # None for workbooks in a Personal Space, which have no project
         return self._project_id
 
     @project_id.setter
@@ -174,6 +202,13 @@ class WorkbookItem:
 
     @property
     def data_acceleration_config(self):
+        if self._data_acceleration_config is None:
+            self._data_acceleration_config = {
+                "acceleration_enabled": None,
+                "accelerate_now": None,
+                "last_updated_at": None,
+                "acceleration_status": None,
+            }
         return self._data_acceleration_config
 
     @data_acceleration_config.setter
@@ -219,7 +254,7 @@ class WorkbookItem:
         self._revisions = revisions
 
     def _parse_common_tags(self, workbook_xml, ns):
-        if not isinstance(workbook_xml, ET.Element):
+        if not ET.iselement(workbook_xml):
             workbook_xml = fromstring(workbook_xml).find(".//t:workbook", namespaces=ns)
         if workbook_xml is not None:
             (
@@ -319,12 +354,16 @@ class WorkbookItem:
     def from_response(cls, resp: str, ns: dict[str, str]) -> list["WorkbookItem"]:
         all_workbook_items = list()
         parsed_response = fromstring(resp)
-        all_workbook_xml = parsed_response.findall(".//t:workbook", namespaces=ns)
+        all_workbook_xml = _WORKBOOK.all(parsed_response, ns)
         for workbook_xml in all_workbook_xml:
             workbook_item = cls.from_xml(workbook_xml, ns)
             all_workbook_items.append(workbook_item)
         return all_workbook_items
 
+    @classmethod
+    def stream_response(cls, resp: bytes, ns: dict[str, str]) -> tuple[Iterator["WorkbookItem"], PaginationItem]:
+        return stream_response(resp, "workbook", ns, cls.from_xml)
+
     @classmethod
     def from_xml(cls, workbook_xml, ns):
         workbook_item = cls()
@@ -346,42 +385,38 @@ class WorkbookItem:
             size = int(size)
 
         show_tabs = string_to_bool(workbook_xml.get("showTabs", ""))
+        children = children_by_tag(workbook_xml, ns)
 
         project_id = None
         project_name = None
-        project_tag = workbook_xml.find(".//t:project", namespaces=ns)
+        project_tag = children.get("project")
         if project_tag is not None:
             project_id = project_tag.get("id", None)
             project_name = project_tag.get("name", None)
 
         owner_id = None
-        owner_tag = workbook_xml.find(".//t:owner", namespaces=ns)
+        owner_tag = children.get("owner")
         if owner_tag is not None:
             owner_id = owner_tag.get("id", None)
 
         tags = None
-        tags_elem = workbook_xml.find(".//t:tags", namespaces=ns)
+        tags_elem = children.get("tags")
         if tags_elem is not None:
             all_tags = TagItem.from_xml_element(tags_elem, ns)
             tags = all_tags
 
         views = None
-        views_elem = workbook_xml.find(".//t:views", namespaces=ns)
+        views_elem = children.get("views")
         if views_elem is not None:
             views = ViewItem.from_xml_element(views_elem, ns)
 
-        data_acceleration_config = {
-            "acceleration_enabled": None,
-            "accelerate_now": None,
-            "last_updated_at": None,
-            "acceleration_status": None,
-        }
-        data_acceleration_elem = workbook_xml.find(".//t:dataAccelerationConfig", namespaces=ns)
+        data_acceleration_config = None
+        data_acceleration_elem = children.get("dataAccelerationConfig")
         if data_acceleration_elem is not None:
             data_acceleration_config = parse_data_acceleration_config(data_acceleration_elem)
 
         data_freshness_policy = None
-        data_freshness_policy_elem = workbook_xml.find(".//t:dataFreshnessPolicy", namespaces=ns)
+        data_freshness_policy_elem = children.get("dataFreshnessPolicy")
         if data_freshness_policy_elem is not None:
             data_freshness_policy = DataFreshnessPolicyItem.from_xml_element(data_freshness_policy_elem, ns)
 
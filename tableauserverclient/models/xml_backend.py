@@ -0,0 +1,197 @@
+import io
+import threading
+import time
+import xml.etree.ElementTree as ET
+from typing import Any, Optional, Union
+from collections.abc import Iterator
+
+from defusedxml import EntitiesForbidden
+from defusedxml.ElementTree import fromstring as _defused_fromstring
+from defusedxml.ElementTree import iterparse as _defused_iterparse
+
+from tableauserverclient.config import config
+from tableauserverclient.helpers import tracing
+
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+
+DEFUSEDXML = "defusedxml"
+LXML = "lxml"
+AUTO = "auto"
+BACKENDS = (DEFUSEDXML, LXML, AUTO)
+
+_backend: Optional[str] = None
+
+# Time spent in fromstring on each thread, accumulated while the request hooks time a response
+_parse_timing = threading.local()
+
+
+def lxml_available() -> bool:
+    return _lxml_etree is not None
+
+
+def set_backend(name: Optional[str]) -> None:
+    """
+    Choose the parser used to read responses into models. "defusedxml" (the default) is pure
+    Python, "lxml" requires lxml to be installed and "auto" uses lxml when it is installed.
+    Passing None goes back to the TSC_XML_BACKEND environment variable.
+    """
+    if name is not None:
+        _check_backend(name)
+    global _backend
+    _backend = name
+
+
+def get_backend() -> str:
+    name = _backend or config.XML_BACKEND
+    _check_backend(name)
+    if name == AUTO:
+        return LXML if lxml_available() else DEFUSEDXML
+    return name
+
+
+def _check_backend(name: str) -> None:
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown XML backend {name}, expected one of {', '.join(BACKENDS)}")
+    if name == LXML and not lxml_available():
+        raise ImportError("The lxml XML backend was requested but lxml is not installed.")
+
+
+def _lxml_parser():
+    # Equivalent to defusedxml's defaults: no network access, no external DTDs and entities are never
+    # expanded. Documents that declare entities are rejected by _check_docinfo once parsed.
+    return _lxml_etree.XMLParser(resolve_entities=False, no_network=True, load_dtd=False, huge_tree=False)
+
+
+def _check_docinfo(tree) -> None:
+    docinfo = tree.docinfo
+    for dtd in (docinfo.internalDTD, docinfo.externalDTD):
+        if dtd is None:
+            continue
+        for entity in dtd.iterentities():
+            raise EntitiesForbidden(entity.name, entity.content, None, None, None, None)
+
+
+def _lxml_syntax_error(error) -> ET.ParseError:
+    parse_error = ET.ParseError(str(error))
+    parse_error.position = error.position
+    return parse_error
+
+
+def start_parse_timing() -> None:
+    _parse_timing.seconds = 0.0
+
+
+def stop_parse_timing() -> float:
+    """The time spent parsing on this thread since start_parse_timing, in seconds."""
+    seconds = getattr(_parse_timing, "seconds", None)
+    _parse_timing.seconds = None
+    return seconds or 0.0
+
+
+def fromstring(text: Union[bytes, str]) -> Any:
+    """Parse a response with the selected backend. Raises ParseError on malformed XML."""
+    tracer = tracing.active_tracer()
+    if tracer is None:
+        return _timed_fromstring(text)
+    with tracing.parse_span(tracer, len(text)):
+        return _timed_fromstring(text)
+
+
+def _timed_fromstring(text: Union[bytes, str]) -> Any:
+    if getattr(_parse_timing, "seconds", None) is None:
+        return _fromstring(text)
+    start = time.perf_counter()
+    try:
+        return _fromstring(text)
+    finally:
+        _parse_timing.seconds += time.perf_counter() - start
+
+
+def _fromstring(text: Union[bytes, str]) -> Any:
+    if get_backend() == DEFUSEDXML:
+        return _defused_fromstring(text)
+    if isinstance(text, str):
+        # lxml refuses unicode strings that carry an encoding declaration
+        text = text.encode("utf-8")
+    try:
+        root = _lxml_etree.fromstring(text, parser=_lxml_parser())
+    except _lxml_etree.XMLSyntaxError as e:
+        raise _lxml_syntax_error(e) from e
+    _check_docinfo(root.getroottree())
+    return root
+
+
+def iterparse(source: Union[bytes, str], events: tuple[str, ...] = ("end",)) -> Iterator[tuple[str, Any]]:
+    """Incrementally parse a response with the selected backend, as ElementTree's iterparse does."""
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    if get_backend() == DEFUSEDXML:
+        yield from _defused_iterparse(io.BytesIO(source), events=events)
+        return
+
+    parser = _lxml_etree.iterparse(
+        io.BytesIO(source), events=events, resolve_entities=False, no_network=True, load_dtd=False
+    )
+    checked = False
+    try:
+        for event, element in parser:
+            if not checked:
+                # The doctype has been read by the time the first element is reported
+                _check_docinfo(element.getroottree())
+                checked = True
+            yield event, element
+    except _lxml_etree.XMLSyntaxError as e:
+        raise _lxml_syntax_error(e) from e
+
+
+class XPath:
+    """
+    An element lookup used by the model parsers, written in the ElementPath subset of XPath with the
+    usual "t:" prefix (e.g. ".//t:project"). Elements parsed by lxml are searched with an XPath
+    expression compiled once per namespace; ElementTree elements fall back to `find`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._compiled: dict[str, Any] = {}
+
+    def __repr__(self):
+        return f"<XPath {self.path}>"
+
+    def _compile(self, ns: dict[str, str]):
+        namespace = ns["t"]
+        compiled = self._compiled.get(namespace)
+        if compiled is None:
+            compiled = self._compiled[namespace] = _lxml_etree.XPath(self.path, namespaces={"t": namespace})
+        return compiled
+
+    def all(self, element, ns: dict[str, str]) -> list:
+        if _lxml_etree is not None and isinstance(element, _lxml_etree._Element):
+            return self._compile(ns)(element)
+        return element.findall(self.path, namespaces=ns)
+
+    def first(self, element, ns: dict[str, str]):
+        if _lxml_etree is not None and isinstance(element, _lxml_etree._Element):
+            found = self._compile(ns)(element)
+            return found[0] if found else None
+        return element.find(self.path, namespaces=ns)
+
+
+def children_by_tag(element, ns: dict[str, str]) -> dict[str, Any]:
+    """
+    Index the direct children of `element` by tag name (without the namespace), keeping the first
+    child with each tag. Model parsers read all the sub-elements they need from this index, so an
+    item's children are walked once instead of searching its whole subtree for every sub-element.
+    """
+    prefix = "{" + ns["t"] + "}"
+    start = len(prefix)
+    children: dict[str, Any] = {}
+    for child in element:
+        tag = child.tag
+        # lxml reports comments and processing instructions as children with a non-string tag
+        if isinstance(tag, str) and tag.startswith(prefix):
+            children.setdefault(tag[start:], child)
+    return children
@@ -11,6 +11,18 @@ from tableauserverclient.server.filter import Filter
 from tableauserverclient.server.sort import Sort
 from tableauserverclient.server.server import Server
 from tableauserverclient.server.pager import Pager
+from tableauserverclient.server.page_size import AdaptivePageSize
+from tableauserverclient.server.capabilities import Capabilities
+from tableauserverclient.server.checkpoint import PaginationCheckpoint
+from tableauserverclient.server.hooks import Hooks, RequestEvent
+from tableauserverclient.server.metrics import MetricsAggregator
+from tableauserverclient.server.rate_limiter import RateLimiter
+from tableauserverclient.server.effective_permissions import EffectivePermissions
+from tableauserverclient.server.project_tree import ProjectTree
+from tableauserverclient.server.migration import Migration
+from tableauserverclient.server.backup import Backup, ContentStore
+from tableauserverclient.server.view_export import ViewExport
+from tableauserverclient.server.webhook_receiver import WebhookReceiver
 from tableauserverclient.server.endpoint.exceptions import FailedSignInError, NotSignedInError
 
 from tableauserverclient.server.endpoint import (
@@ -23,6 +35,7 @@ from tableauserverclient.server.endpoint import (
     QuerysetEndpoint,
     MissingRequiredFieldError,
     Endpoint,
+    Export,
     Favorites,
     Fileuploads,
     FlowRuns,
@@ -57,6 +70,20 @@ __all__ = [
     "Sort",
     "Server",
     "Pager",
+    "AdaptivePageSize",
+    "PaginationCheckpoint",
+    "Hooks",
+    "MetricsAggregator",
+    "RateLimiter",
+    "EffectivePermissions",
+    "ProjectTree",
+    "Migration",
+    "Backup",
+    "ContentStore",
+    "ViewExport",
+    "WebhookReceiver",
+    "Capabilities",
+    "RequestEvent",
     "FailedSignInError",
     "NotSignedInError",
     "Auth",
@@ -68,6 +95,7 @@ __all__ = [
     "QuerysetEndpoint",
     "MissingRequiredFieldError",
     "Endpoint",
+    "Export",
     "Favorites",
     "Fileuploads",
     "FlowRuns",
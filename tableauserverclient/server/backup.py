@@ -0,0 +1,283 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional
+
+from tableauserverclient.datetime_helpers import format_datetime
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.server.pager import Pager
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+# The content with revisions that can be backed up
+CONTENT = ("workbooks", "datasources")
+
+INDEX_FILE = "index.json"
+
+# Files are read and hashed this many bytes at a time
+_BLOCK_SIZE = 1024 * 1024
+
+# The index is saved after this many revisions are downloaded, as well as at the end of each kind
+_SAVE_INTERVAL = 100
+
+
+def _write_atomic(path: str, write) -> None:
+    # Written to a temporary file next to `path` first, so that readers never see a partial file
+    temp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as f:
+        write(f)
+    os.replace(temp_path, path)
+
+
+class ContentStore:
+    """
+    A directory of files stored under the SHA-256 hash of their bytes, so that each distinct file
+    is stored once however many times it is added.
+
+    With a `chunk_size`, files are split into chunks of that many bytes, each stored under its
+    own hash, and a file is stored as the list of its chunks. Files that share chunks, such as
+    revisions that only add data at the end of an uncompressed file, then share their storage.
+    """
+
+    def __init__(self, root: str, chunk_size: Optional[int] = None) -> None:
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.root = root
+        self.chunk_size = chunk_size
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(root, "files"), exist_ok=True)
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], digest[2:])
+
+    def _chunks_path(self, digest: str) -> str:
+        return os.path.join(self.root, "files", f"{digest}.json")
+
+    def __contains__(self, digest: object) -> bool:
+        return isinstance(digest, str) and (
+            os.path.exists(self._object_path(digest)) or os.path.exists(self._chunks_path(digest))
+        )
+
+    def _put_object(self, digest: str, data: bytes) -> None:
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _write_atomic(path, lambda f: f.write(data))
+
+    def add_file(self, path: str) -> tuple[str, int]:
+        """
+        Store the file at `path`, which is moved into the store or removed. Returns the hash and
+        size of its bytes.
+        """
+        whole = hashlib.sha256()
+        size = 0
+        chunks = []
+        with open(path, "rb") as f:
+            block_size = self.chunk_size or _BLOCK_SIZE
+            while block := f.read(block_size):
+                whole.update(block)
+                size += len(block)
+                if self.chunk_size:
+                    chunk_digest = hashlib.sha256(block).hexdigest()
+                    self._put_object(chunk_digest, block)
+                    chunks.append(chunk_digest)
+        digest = whole.hexdigest()
+        if digest in self:
+            os.remove(path)
+        elif self.chunk_size:
+            content = json.dumps({"size": size, "chunks": chunks}).encode("utf-8")
+            _write_atomic(self._chunks_path(digest), lambda f: f.write(content))
+            os.remove(path)
+        else:
+            os.makedirs(os.path.dirname(self._object_path(digest)), exist_ok=True)
+            os.replace(path, self._object_path(digest))
+        return digest, size
+
+    def read(self, digest: str) -> Iterator[bytes]:
+        """The bytes stored under `digest`, in blocks. Raises KeyError if there are none."""
+        if os.path.exists(self._chunks_path(digest)):
+            with open(self._chunks_path(digest)) as f:
+                paths = [self._object_path(chunk) for chunk in json.load(f)["chunks"]]
+        elif os.path.exists(self._object_path(digest)):
+            paths = [self._object_path(digest)]
+        else:
+            raise KeyError(digest)
+        for path in paths:
+            with open(path, "rb") as f:
+                while block := f.read(_BLOCK_SIZE):
+                    yield block
+
+    def write_to(self, digest: str, file: BinaryIO) -> None:
+        for block in self.read(digest):
+            file.write(block)
+
+
+class Backup:
+    """
+    Backs up every revision of the workbooks and data sources of a site into a ContentStore in
+    the directory `root`, downloading only the revisions that were not backed up before.
+
+    Items that have not been updated since the last run are skipped without a request; for the
+    others, the revisions are listed with `populate_revisions` and the new ones downloaded,
+    `max_workers` at a time. Each revision is stored once under the hash of its bytes, and once
+    per chunk of `chunk_size` bytes when that is given.
+
+    The restore index `root`/index.json records, for each item, its name, project and the hash,
+    size and file name of each revision backed up. Items deleted from the site stay in it, and
+    any revision can be written back to a file with `restore`.
+
+    Example:
+    >>> backup = TSC.Backup(server, "backups").run()
+    >>> backup.restore("workbooks", workbook_id, path="restored")
+    """
+
+    def __init__(
+        self,
+        server: "Server",
+        root: str,
+        content: Iterable[str] = CONTENT,
+        max_workers: int = 4,
+        chunk_size: Optional[int] = None,
+        include_extract: bool = True,
+    ) -> None:
+        self.content = list(content)
+        if unknown := set(self.content) - set(CONTENT):
+            raise ValueError(f"Unknown content {', '.join(sorted(unknown))}, expected any of {', '.join(CONTENT)}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.server = server
+        self.root = root
+        self.max_workers = max_workers
+        self.include_extract = include_extract
+        self.store = ContentStore(root, chunk_size)
+        self.index_path = os.path.join(root, INDEX_FILE)
+        # kind -> item id -> details and revision number -> revision details
+        self.index: dict[str, dict[str, dict[str, Any]]] = {kind: {} for kind in CONTENT}
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                self.index.update(json.load(f))
+        # (kind, item id, revision number) of the revisions stored by the last run
+        self.added: list[tuple[str, str, str]] = []
+        # kind -> item id or "item id/revision number" -> error
+        self.failed: dict[str, dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        items = sum(len(items) for items in self.index.values())
+        return f"<Backup root={self.root} items={items} added={len(self.added)}>"
+
+    def _save_index(self) -> None:
+        # Called with the lock held
+        content = json.dumps(self.index, indent=1, sort_keys=True).encode("utf-8")
+        _write_atomic(self.index_path, lambda f: f.write(content))
+
+    def _fail(self, kind: str, key: str, error: Exception) -> None:
+        logger.warning(f"Failed to back up {kind} {key}: {error}")
+        with self._lock:
+            self.failed.setdefault(kind, {})[key] = str(error)
+
+    def run(self) -> "Backup":
+        self.added = []
+        self.failed = {}
+        work_dir = tempfile.mkdtemp(prefix="tmp-", dir=self.root)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for kind in self.content:
+                    self._back_up(kind, executor, work_dir)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        logger.info(f"Backup finished: {self}")
+        return self
+
+    def _back_up(self, kind: str, executor: ThreadPoolExecutor, work_dir: str) -> None:
+        endpoint = getattr(self.server, kind)
+        entries = self.index.setdefault(kind, {})
+        changed = []
+        for item in Pager(endpoint, stream=True):
+            updated_at = format_datetime(item.updated_at) if item.updated_at else None
+            entry = entries.get(item.id)
+            if entry is not None and updated_at is not None and entry.get("updated_at") == updated_at:
+                continue
+            changed.append(item)
+        logger.info(f"{len(changed)} {kind} changed since the last backup")
+
+        listed = executor.map(lambda item: self._new_revisions(kind, item), changed)
+        downloads = [
+            executor.submit(self._download, kind, item, revision, work_dir)
+            for item, revisions in zip(changed, listed)
+            for revision in revisions
+        ]
+        for done, future in enumerate(downloads, 1):
+            future.result()
+            if done % _SAVE_INTERVAL == 0:
+                # So that a run that is interrupted does not download these revisions again
+                with self._lock:
+                    self._save_index()
+
+        with self._lock:
+            for item in changed:
+                key_prefix = f"{item.id}/"
+                failed = self.failed.get(kind, {})
+                if item.id in failed or any(key.startswith(key_prefix) for key in failed):
+                    # Listed again next time, so that the failed revisions are retried
+                    continue
+                entry = entries.setdefault(item.id, {"revisions": {}})
+                # Renaming or moving an item does not add a revision, so these are updated here
+                entry.update(name=item.name, project_id=item.project_id, project_name=item.project_name)
+                entry["updated_at"] = format_datetime(item.updated_at) if item.updated_at else None
+            self._save_index()
+
+    def _new_revisions(self, kind: str, item: Any) -> list[Any]:
+        try:
+            getattr(self.server, kind).populate_revisions(item)
+            revisions = item.revisions
+        except Exception as e:
+            self._fail(kind, item.id, e)
+            return []
+        known = self.index[kind].get(item.id, {}).get("revisions", {})
+        return [r for r in revisions if not r.deleted and r.revision_number not in known]
+
+    def _download(self, kind: str, item: Any, revision: Any, work_dir: str) -> None:
+        try:
+            directory = tempfile.mkdtemp(dir=work_dir)
+            path = getattr(self.server, kind).download_revision(
+                item.id, revision.revision_number, directory, include_extract=self.include_extract
+            )
+            filename = os.path.basename(path)
+            digest, size = self.store.add_file(path)
+            os.rmdir(directory)
+        except Exception as e:
+            self._fail(kind, f"{item.id}/{revision.revision_number}", e)
+            return
+        with self._lock:
+            entry = self.index[kind].setdefault(item.id, {"revisions": {}})
+            entry["revisions"][revision.revision_number] = {
+                "sha256": digest,
+                "size": size,
+                "filename": filename,
+                "published_at": format_datetime(revision.created_at) if revision.created_at else None,
+                "publisher_id": revision.user_id,
+            }
+            self.added.append((kind, item.id, revision.revision_number))
+
+    def restore(self, kind: str, item_id: str, revision: Optional[str] = None, path: str = ".") -> str:
+        """
+        Write a revision of an item, the latest one backed up by default, to a file in the
+        directory `path` named as it was downloaded. Returns the path of the file.
+        """
+        revisions = self.index.get(kind, {}).get(item_id, {}).get("revisions", {})
+        if not revisions:
+            raise KeyError(f"No revisions of {kind} {item_id} were backed up")
+        number = revision if revision is not None else max(revisions, key=int)
+        details = revisions[number]
+        os.makedirs(path, exist_ok=True)
+        file_path = os.path.join(path, details["filename"])
+        with open(file_path, "wb") as f:
+            self.store.write_to(details["sha256"], f)
+        return file_path
@@ -0,0 +1,68 @@
+from typing import Optional
+
+from packaging.version import InvalidVersion, Version
+
+from tableauserverclient.helpers.logging import logger
+
+# The API version each feature was added in, registered by the `api` and `parameter_added_in`
+# decorators as the endpoints are defined: "Groups.add_users" for an endpoint method, and
+# "Workbooks.download.include_extract" for a parameter of one.
+FEATURES: dict[str, str] = {}
+
+
+def register_feature(name: str, version: str) -> None:
+    FEATURES[name] = version
+
+
+class Capabilities:
+    """
+    What a server can do at an API version, worked out once when the server's version is set.
+
+    Each version named by an endpoint decorator is compared with the server's version up front,
+    so the checks made on every call are dictionary lookups. Other versions are compared the
+    first time they are asked about and remembered.
+
+    Scripts can ask about features by name before choosing how to do something, or list them
+    all with `features`.
+
+    Example:
+    >>> if server.capabilities.supports("Groups.add_users"):
+    >>>     server.groups.add_users(group, user_ids)
+    >>> server.capabilities.at_least("3.21")
+    """
+
+    def __init__(self, version: Optional[str]) -> None:
+        self.version = version
+        self._at_least: dict[str, bool] = {}
+        self._version: Optional[Version] = None
+        try:
+            self._version = Version(version or "2.4")
+        except InvalidVersion:
+            # A server that does not report its version can still be used; checking it raises
+            logger.debug(f"Server version {version!r} cannot be compared")
+            return
+        for required in set(FEATURES.values()):
+            self.at_least(required)
+
+    def __repr__(self):
+        return f"<Capabilities version={self.version} features={sum(self.features().values())}/{len(FEATURES)}>"
+
+    def at_least(self, version: str) -> bool:
+        """Whether the server's API version is `version` or later."""
+        try:
+            return self._at_least[version]
+        except KeyError:
+            server_version = self._version if self._version is not None else Version(self.version or "2.4")
+            supported = self._at_least[version] = server_version >= Version(version)
+            return supported
+
+    def supports(self, feature: str) -> bool:
+        """Whether the server has `feature`, named as in `features`. Raises KeyError for unknown features."""
+        return self.at_least(FEATURES[feature])
+
+    def __contains__(self, feature: object) -> bool:
+        return isinstance(feature, str) and feature in FEATURES and self.supports(feature)
+
+    def features(self) -> dict[str, bool]:
+        """Every feature known, and whether the server has it."""
+        return {feature: self.at_least(required) for feature, required in sorted(FEATURES.items())}
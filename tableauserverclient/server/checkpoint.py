@@ -0,0 +1,146 @@
+import json
+from typing import Any, Optional, TypeVar
+from collections.abc import Iterable
+
+from tableauserverclient.config import config
+from tableauserverclient.server.filter import Filter
+from tableauserverclient.server.request_options import RequestOptions
+from tableauserverclient.server.sort import Sort
+
+T = TypeVar("T")
+
+
+class PaginationCheckpoint:
+    """
+    The position of a Pager or QuerySet crawl, which can be saved as JSON and used
+    to resume the crawl where it stopped.
+
+    `page_number` and `page_size` identify the page being read, `page_offset` is the
+    number of items of that page that have already been returned and `watermark` is
+    the id of the last item returned. When resuming, items up to the watermark are
+    skipped if it is found on the page, otherwise the first `page_offset` items are.
+
+    Example:
+    >>> pager = TSC.Pager(server.workbooks)
+    >>> for workbook in pager:
+    >>>     save(workbook)
+    >>>     state = pager.checkpoint.to_json()
+    >>> ...
+    >>> for workbook in TSC.Pager.from_checkpoint(server, TSC.PaginationCheckpoint.from_json(state)):
+    >>>     save(workbook)
+    """
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        page_number: int = 1,
+        page_size: Optional[int] = None,
+        filters: Optional[list[tuple[str, str, Any]]] = None,
+        sort: Optional[list[tuple[str, str]]] = None,
+        parameters: Optional[dict[str, Any]] = None,
+        watermark: Optional[str] = None,
+        page_offset: int = 0,
+        all_fields: bool = False,
+    ) -> None:
+        self.endpoint = endpoint
+        self.page_number = page_number
+        self.page_size = page_size or config.PAGE_SIZE
+        self.filters = [tuple(f) for f in filters or []]
+        self.sort = [tuple(s) for s in sort or []]
+        self.parameters = parameters or {}
+        self.watermark = watermark
+        self.page_offset = page_offset
+        self.all_fields = all_fields
+
+    def __repr__(self):
+        return (
+            f"<PaginationCheckpoint endpoint={self.endpoint} page_number={self.page_number} "
+            f"page_size={self.page_size} page_offset={self.page_offset} watermark={self.watermark}>"
+        )
+
+    def __eq__(self, other):
+        return isinstance(other, PaginationCheckpoint) and self.to_dict() == other.to_dict()
+
+    @classmethod
+    def from_request_options(
+        cls, options: RequestOptions, endpoint: Optional[str] = None, parameters: Optional[dict[str, Any]] = None
+    ) -> "PaginationCheckpoint":
+        return cls(
+            endpoint=endpoint,
+            page_number=options.pagenumber,
+            page_size=options.pagesize,
+            filters=sorted(((f.field, f.operator, f.value) for f in options.filter), key=str),
+            sort=sorted(((s.field, s.direction) for s in options.sort), key=str),
+            parameters=parameters,
+            all_fields=options._all_fields,
+        )
+
+    def request_options(self) -> RequestOptions:
+        options = RequestOptions(self.page_number, self.page_size)
+        for field, operator, value in self.filters:
+            options.filter.add(Filter(field, operator, value))
+        for field, direction in self.sort:
+            options.sort.add(Sort(field, direction))
+        options._all_fields = self.all_fields
+        return options
+
+    def advance(self, item: Any) -> None:
+        self.page_offset += 1
+        self.watermark = getattr(item, "id", None)
+
+    def next_page(self, page_number: int, page_size: int) -> None:
+        self.page_number = page_number
+        self.page_size = page_size
+        self.page_offset = 0
+        self.watermark = None
+
+    def resume_page(self, resume_from: "PaginationCheckpoint", items: Iterable[T]) -> list[T]:
+        """Skip the items of a freshly fetched page that `resume_from` had already returned."""
+        items = list(items)
+        remaining = resume_from.skip_seen(items)
+        self.page_offset = len(items) - len(remaining)
+        self.watermark = resume_from.watermark
+        return remaining
+
+    def skip_seen(self, items: list[T]) -> list[T]:
+        """Drop the items of the current page that were returned before the checkpoint was taken."""
+        if self.watermark is not None:
+            for index, item in enumerate(items):
+                if getattr(item, "id", None) == self.watermark:
+                    return items[index + 1 :]
+        return items[self.page_offset :]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "page_number": self.page_number,
+            "page_size": self.page_size,
+            "filters": [list(f) for f in self.filters],
+            "sort": [list(s) for s in self.sort],
+            "parameters": self.parameters,
+            "watermark": self.watermark,
+            "page_offset": self.page_offset,
+            "all_fields": self.all_fields,
+        }
+
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> "PaginationCheckpoint":
+        return cls(**values)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text: str) -> "PaginationCheckpoint":
+        return cls.from_dict(json.loads(text))
+
+
+def endpoint_name(endpoint: Any) -> Optional[str]:
+    # Endpoints don't know the attribute they are stored under, so look for them on their server
+    server = getattr(endpoint, "parent_srv", None)
+    if server is None:
+        return None
+    for name, value in vars(server).items():
+        if value is endpoint:
+            return name
+    return None
@@ -0,0 +1,367 @@
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.models import GroupItem, PermissionsRule, ProjectItem, UserItem
+from tableauserverclient.models.permissions_item import Permission
+from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldError
+from tableauserverclient.server.pager import Pager
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+# A grantee as (tag name, id), e.g. ("group", "5e5e1978-...")
+Grantee = tuple[str, str]
+Rules = tuple[tuple[Grantee, dict[str, str]], ...]
+
+ALL_CAPABILITIES = frozenset(
+    value for name, value in vars(Permission.Capability).items() if not name.startswith("_") and isinstance(value, str)
+)
+
+# The most a viewer can be allowed, whatever the permissions rules say
+VIEWER_CAPABILITIES = frozenset(
+    {
+        Permission.Capability.Read,
+        Permission.Capability.Filter,
+        Permission.Capability.ViewComments,
+        Permission.Capability.AddComment,
+        Permission.Capability.ExportImage,
+        Permission.Capability.ExportData,
+        Permission.Capability.ShareView,
+        Permission.Capability.RunExplainData,
+    }
+)
+
+ADMINISTRATOR_ROLES = frozenset(
+    {
+        UserItem.Roles.ServerAdministrator,
+        UserItem.Roles.SiteAdministrator,
+        UserItem.Roles.SiteAdministratorCreator,
+        UserItem.Roles.SiteAdministratorExplorer,
+    }
+)
+VIEWER_ROLES = frozenset({UserItem.Roles.Viewer, UserItem.Roles.ReadOnly, UserItem.Roles.Guest})
+UNLICENSED_ROLES = frozenset({UserItem.Roles.Unlicensed, UserItem.Roles.UnlicensedWithPublish})
+
+LOCKED = frozenset(
+    {ProjectItem.ContentPermissions.LockedToProject, ProjectItem.ContentPermissions.LockedToProjectWithoutNested}
+)
+
+# The content kinds that can be indexed besides projects, with the name used for their project default permissions
+CONTENT_DEFAULTS = {"workbooks": "workbook", "datasources": "datasource", "flows": "flow"}
+
+
+def _id(item: Any) -> str:
+    if not item.id:
+        error = f"{item.__class__.__name__} is missing ID. Item must be retrieved from server first."
+        raise MissingRequiredFieldError(error)
+    return item.id
+
+
+def _rules(rules: Iterable[PermissionsRule]) -> Rules:
+    return tuple(((rule.grantee.tag_name, rule.grantee.id), dict(rule.capabilities)) for rule in rules)
+
+
+def _evaluate(user: Grantee, groups: frozenset[Grantee], rules: Rules) -> set[str]:
+    # A rule for the user wins over the rules of their groups; among groups a Deny wins over an Allow
+    user_modes: dict[str, str] = {}
+    group_modes: dict[str, set[str]] = {}
+    for grantee, capabilities in rules:
+        if grantee == user:
+            user_modes = capabilities
+        elif grantee in groups:
+            for capability, mode in capabilities.items():
+                group_modes.setdefault(capability, set()).add(mode)
+    allowed = {capability for capability, mode in user_modes.items() if mode == Permission.Mode.Allow}
+    for capability, modes in group_modes.items():
+        if capability not in user_modes and Permission.Mode.Deny not in modes:
+            allowed.add(capability)
+    return allowed
+
+
+class EffectivePermissions:
+    """
+    Answers "what can this user do on that item" locally, from a snapshot of the site's users,
+    groups, group sets, projects, content and permissions loaded once with `load`.
+
+    The evaluation follows the Tableau permissions model:
+    - administrators can do everything and unlicensed users nothing;
+    - the owner of an item, and the owner or a project leader of the project it is in or of any
+      project above, can do everything on it;
+    - otherwise the item's rules apply, or the default permissions of the project that locks
+      them when it is in a locked project. A rule for the user wins over the rules of their
+      groups and group sets, and among those a Deny wins over an Allow. A user belongs to a group
+      set when they belong to all of its groups;
+    - viewers are never allowed more than VIEWER_CAPABILITIES.
+
+    Loading takes one request per page of each list, plus one per group for its members, one per
+    item for its permissions and one per locked project and content kind for its defaults. These
+    run `max_workers` at a time. After a change, the affected entries can be reloaded with the
+    `refresh_*` methods instead of loading everything again.
+
+    Example:
+    >>> permissions = TSC.EffectivePermissions(server, content=["workbooks"]).load()
+    >>> permissions.allows(user.id, "workbooks", workbook.id, TSC.Permission.Capability.Write)
+    """
+
+    def __init__(
+        self, server: "Server", content: Iterable[str] = ("workbooks", "datasources"), max_workers: int = 8
+    ) -> None:
+        self.content = list(content)
+        unknown = [kind for kind in self.content if kind not in CONTENT_DEFAULTS]
+        if unknown:
+            raise ValueError(f"Unknown content {', '.join(unknown)}, expected any of {', '.join(CONTENT_DEFAULTS)}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.server = server
+        self.max_workers = max_workers
+
+        self._site_roles: dict[str, Optional[str]] = {}
+        self._members: dict[str, frozenset[str]] = {}
+        self._user_groups: dict[str, set[str]] = {}
+        self._group_sets: dict[str, frozenset[str]] = {}
+        self._parents: dict[str, Optional[str]] = {}
+        self._locks: dict[str, Optional[str]] = {}
+        # (kind, id) -> (project id, owner id), projects included
+        self._items: dict[tuple[str, str], tuple[Optional[str], Optional[str]]] = {}
+        self._rules: dict[tuple[str, str], Rules] = {}
+        # (project id, kind) -> default rules, only for projects that lock the permissions of their content
+        self._defaults: dict[tuple[str, str], Rules] = {}
+
+        self._grantees: dict[str, frozenset[Grantee]] = {}
+        self._led: dict[str, frozenset[str]] = {}
+
+    def __repr__(self):
+        return f"<EffectivePermissions users={len(self._site_roles)} items={len(self._items)}>"
+
+    def _map(self, function: Callable[[Any], Any], items: Iterable[Any]) -> list[Any]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(function, items))
+
+    def load(self) -> "EffectivePermissions":
+        """Fetch everything needed for the evaluation, replacing what was loaded before."""
+        server = self.server
+        lists: list[Callable[[], list]] = [
+            lambda: list(Pager(server.users)),
+            lambda: list(Pager(server.groups)),
+            lambda: list(Pager(server.projects)),
+        ]
+        lists.extend((lambda kind=kind: list(Pager(getattr(server, kind)))) for kind in self.content)
+        if server.check_at_least_version("3.22"):
+            lists.append(lambda: list(Pager(server.group_sets, result_level="members")))
+        users, groups, projects, *content = self._map(lambda fetch: fetch(), lists)
+        group_sets = content.pop() if len(content) > len(self.content) else []
+
+        self._site_roles = {user.id: user.site_role for user in users}
+        self._group_sets = {group_set.id: frozenset(g.id for g in group_set.groups) for group_set in group_sets}
+        self._parents = {}
+        self._locks = {}
+        self._items = {}
+        for project in projects:
+            self._set_project(project)
+        for kind, items in zip(self.content, content):
+            for item in items:
+                self._items[(kind, item.id)] = (item.project_id, item.owner_id)
+
+        members = self._map(self._fetch_members, groups)
+        self._members = {group.id: group_members for group, group_members in zip(groups, members)}
+        self._index_members()
+
+        resources = [("projects", project) for project in projects]
+        resources.extend((kind, item) for kind, items in zip(self.content, content) for item in items)
+        rules = self._map(lambda resource: self._fetch_rules(*resource), resources)
+        self._rules = {(kind, item.id): item_rules for (kind, item), item_rules in zip(resources, rules)}
+
+        anchors = [project for project in projects if self._locks_content(project.id)]
+        self._defaults = {}
+        self._load_defaults(anchors)
+        self._clear_caches()
+
+        logger.info(f"Loaded permissions of {len(self._items)} items for {len(self._site_roles)} users")
+        return self
+
+    def _fetch_members(self, group: GroupItem) -> frozenset[str]:
+        self.server.groups.populate_users(group)
+        return frozenset(user.id for user in group.users)
+
+    def _fetch_rules(self, kind: str, item: Any) -> Rules:
+        getattr(self.server, kind).populate_permissions(item)
+        return _rules(item.permissions)
+
+    def _load_defaults(self, projects: list[ProjectItem]) -> None:
+        def fetch(task: tuple[ProjectItem, str]) -> Rules:
+            project, kind = task
+            name = CONTENT_DEFAULTS[kind]
+            getattr(self.server.projects, f"populate_{name}_default_permissions")(project)
+            return _rules(getattr(project, f"default_{name}_permissions"))
+
+        tasks = [(project, kind) for project in projects for kind in self.content]
+        for (project, kind), rules in zip(tasks, self._map(fetch, tasks)):
+            self._defaults[(_id(project), kind)] = rules
+
+    def _set_project(self, project: ProjectItem) -> None:
+        project_id = _id(project)
+        self._parents[project_id] = project.parent_id
+        self._locks[project_id] = project.content_permissions
+        self._items[("projects", project_id)] = (project.parent_id, project.owner_id)
+
+    def _index_members(self) -> None:
+        user_groups: dict[str, set[str]] = {}
+        for group_id, members in self._members.items():
+            for user_id in members:
+                user_groups.setdefault(user_id, set()).add(group_id)
+        self._user_groups = user_groups
+
+    def _clear_caches(self) -> None:
+        self._grantees = {}
+        self._led = {}
+
+    def _ancestors(self, project_id: Optional[str]) -> list[str]:
+        """The project and those above it, from the top level down."""
+        chain: list[str] = []
+        while project_id is not None and project_id not in chain:
+            chain.append(project_id)
+            project_id = self._parents.get(project_id)
+        return chain[::-1]
+
+    def _lock_anchor(self, project_id: Optional[str], include_self: bool = True) -> Optional[str]:
+        """The project whose permissions apply to the content of this one, if they are locked."""
+        chain = self._ancestors(project_id)
+        # A project locked with nested projects locks everything below it
+        for ancestor in chain[:-1]:
+            if self._locks.get(ancestor) == ProjectItem.ContentPermissions.LockedToProject:
+                return ancestor
+        if include_self and chain and self._locks.get(chain[-1]) in LOCKED:
+            return chain[-1]
+        return None
+
+    def _locks_content(self, project_id: str) -> bool:
+        return self._lock_anchor(project_id) == project_id
+
+    def _effective_rules(self, kind: str, resource_id: str) -> Rules:
+        if kind == "projects":
+            anchor = self._lock_anchor(resource_id, include_self=False)
+            return self._rules.get(("projects", anchor or resource_id), ())
+        project_id, _ = self._items[(kind, resource_id)]
+        anchor = self._lock_anchor(project_id)
+        if anchor is not None:
+            return self._defaults.get((anchor, kind), ())
+        return self._rules.get((kind, resource_id), ())
+
+    def _grantees_of(self, user_id: str) -> frozenset[Grantee]:
+        grantees = self._grantees.get(user_id)
+        if grantees is None:
+            groups = self._user_groups.get(user_id, set())
+            keys = {(GroupItem.tag_name, group_id) for group_id in groups}
+            keys.update(
+                ("groupSet", group_set_id)
+                for group_set_id, group_ids in self._group_sets.items()
+                if group_ids and group_ids <= groups
+            )
+            grantees = self._grantees[user_id] = frozenset(keys)
+        return grantees
+
+    def _led_projects(self, user_id: str) -> frozenset[str]:
+        """The projects the user owns or leads, directly or through a project above them."""
+        led = self._led.get(user_id)
+        if led is None:
+            user = (UserItem.tag_name, user_id)
+            groups = self._grantees_of(user_id)
+            covered: dict[str, bool] = {}
+            for project_id in self._parents:
+                for ancestor in self._ancestors(project_id):
+                    if ancestor in covered:
+                        continue
+                    parent = self._parents.get(ancestor)
+                    _, owner_id = self._items.get(("projects", ancestor), (None, None))
+                    covered[ancestor] = (
+                        covered.get(parent, False) if parent is not None else False
+                    ) or owner_id == user_id
+                    if not covered[ancestor]:
+                        rules = self._effective_rules("projects", ancestor)
+                        covered[ancestor] = Permission.Capability.ProjectLeader in _evaluate(user, groups, rules)
+            led = self._led[user_id] = frozenset(project_id for project_id, is_led in covered.items() if is_led)
+        return led
+
+    def capabilities(self, user_id: str, kind: str, resource_id: str) -> set[str]:
+        """The capabilities the user is allowed on an item. Raises KeyError for an item that was not loaded."""
+        if kind != "projects" and kind not in self.content:
+            raise ValueError(f"{kind} are not indexed, expected one of projects, {', '.join(self.content)}")
+        project_id, owner_id = self._items[(kind, resource_id)]
+        role = self._site_roles.get(user_id)
+        if role is None or role in UNLICENSED_ROLES:
+            return set()
+        if role in ADMINISTRATOR_ROLES:
+            return set(ALL_CAPABILITIES)
+
+        container = resource_id if kind == "projects" else project_id
+        if owner_id == user_id or (container is not None and container in self._led_projects(user_id)):
+            allowed = set(ALL_CAPABILITIES)
+        else:
+            allowed = _evaluate(
+                (UserItem.tag_name, user_id), self._grantees_of(user_id), self._effective_rules(kind, resource_id)
+            )
+        if role in VIEWER_ROLES:
+            allowed &= VIEWER_CAPABILITIES
+        return allowed
+
+    def allows(self, user_id: str, kind: str, resource_id: str, capability: str) -> bool:
+        return capability in self.capabilities(user_id, kind, resource_id)
+
+    def refresh_user(self, user: UserItem) -> None:
+        """Reload the site role and the groups of a user, e.g. after they were added or changed."""
+        user_id = _id(user)
+        self.server.users.populate_groups(user)
+        self._site_roles[user_id] = user.site_role
+        groups = {_id(group) for group in user.groups}
+        for group_id, members in self._members.items():
+            if (group_id in groups) != (user_id in members):
+                self._members[group_id] = members ^ {user_id}
+        for group_id in groups - self._members.keys():
+            self._members[group_id] = frozenset({user_id})
+        self._user_groups[user_id] = groups
+        self._grantees.pop(user_id, None)
+        self._led.pop(user_id, None)
+
+    def refresh_group(self, group: GroupItem) -> None:
+        """Reload the members of a group."""
+        self._members[_id(group)] = self._fetch_members(group)
+        self._index_members()
+        self._clear_caches()
+
+    def refresh_group_sets(self) -> None:
+        self._group_sets = {
+            group_set.id: frozenset(g.id for g in group_set.groups)
+            for group_set in Pager(self.server.group_sets, result_level="members")
+        }
+        self._clear_caches()
+
+    def refresh_item(self, kind: str, item: Any) -> None:
+        """
+        Reload the permissions of an item, taking its project and owner from `item`. For a project
+        this also reloads its default permissions when it locks the permissions of its content.
+        """
+        item_id = _id(item)
+        if kind == "projects":
+            self._set_project(item)
+            for key in [key for key in self._defaults if key[0] == item_id]:
+                del self._defaults[key]
+            if self._locks_content(item_id):
+                self._load_defaults([item])
+        elif kind in self.content:
+            self._items[(kind, item_id)] = (item.project_id, item.owner_id)
+        else:
+            raise ValueError(f"{kind} are not indexed, expected one of projects, {', '.join(self.content)}")
+        self._rules[(kind, item_id)] = self._fetch_rules(kind, item)
+        self._clear_caches()
+
+    def remove_item(self, kind: str, item_id: str) -> None:
+        self._items.pop((kind, item_id), None)
+        self._rules.pop((kind, item_id), None)
+        if kind == "projects":
+            self._parents.pop(item_id, None)
+            self._locks.pop(item_id, None)
+            for key in [key for key in self._defaults if key[0] == item_id]:
+                del self._defaults[key]
+        self._clear_caches()
@@ -6,6 +6,7 @@ from tableauserverclient.server.endpoint.databases_endpoint import Databases
 from tableauserverclient.server.endpoint.datasources_endpoint import Datasources
 from tableauserverclient.server.endpoint.endpoint import Endpoint, QuerysetEndpoint
 from tableauserverclient.server.endpoint.exceptions import ServerResponseError, MissingRequiredFieldError
+from tableauserverclient.server.endpoint.export_endpoint import Export
 from tableauserverclient.server.endpoint.favorites_endpoint import Favorites
 from tableauserverclient.server.endpoint.fileuploads_endpoint import Fileuploads
 from tableauserverclient.server.endpoint.flow_runs_endpoint import FlowRuns
@@ -41,6 +42,7 @@ __all__ = [
     "QuerysetEndpoint",
     "MissingRequiredFieldError",
     "Endpoint",
+    "Export",
     "Favorites",
     "Fileuploads",
     "FlowRuns",
@@ -99,6 +99,14 @@ class Databases(Endpoint, TaggingMixin):
     def delete_permission(self, item, rules):
         self._permissions.delete(item, rules)
 
+    @api(version="3.5")
+    def reconcile_permissions(self, item, rules, dry_run=False, max_workers=4):
+        return self._permissions.reconcile(item, rules, dry_run, max_workers)
+
+    @api(version="3.5")
+    def reconcile_permissions_many(self, items, dry_run=False, max_workers=4):
+        return self._permissions.reconcile_many(items, dry_run, max_workers)
+
     @api(version="3.5")
     def populate_table_default_permissions(self, item):
         self._default_permissions.populate_default_permissions(item, Resource.Table)
@@ -7,9 +7,10 @@ import os
 from contextlib import closing
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING, Union
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 
 from tableauserverclient.helpers.headers import fix_filename
+from tableauserverclient.server.page_size import PageSize
 from tableauserverclient.server.query import QuerySet
 
 if TYPE_CHECKING:
@@ -20,7 +21,7 @@ if TYPE_CHECKING:
 from tableauserverclient.server.endpoint.dqw_endpoint import _DataQualityWarningEndpoint
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api, parameter_added_in
 from tableauserverclient.server.endpoint.exceptions import InternalServerError, MissingRequiredFieldError
-from tableauserverclient.server.endpoint.permissions_endpoint import _PermissionsEndpoint
+from tableauserverclient.server.endpoint.permissions_endpoint import PermissionsChanges, _PermissionsEndpoint
 from tableauserverclient.server.endpoint.resource_tagger import TaggingMixin
 
 from tableauserverclient.config import ALLOWED_FILE_EXTENSIONS, BYTES_PER_MB, config
@@ -78,6 +79,16 @@ class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]
         all_datasource_items = DatasourceItem.from_response(server_response.content, self.parent_srv.namespace)
         return all_datasource_items, pagination_item
 
+    # Get all datasources, building each item as it is read from the response
+    @api(version="2.0")
+    def get_stream(
+        self, req_options: Optional[RequestOptions] = None
+    ) -> tuple[Iterator[DatasourceItem], PaginationItem]:
+        logger.info("Streaming all datasources on site")
+        url = self.baseurl
+        server_response = self.get_request(url, req_options)
+        return DatasourceItem.stream_response(server_response.content, self.parent_srv.namespace)
+
     # Get 1 datasource by id
     @api(version="2.0")
     def get_by_id(self, datasource_id: str) -> DatasourceItem:
@@ -362,6 +373,25 @@ class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]
     def delete_permission(self, item: DatasourceItem, capability_item: "PermissionsRule") -> None:
         self._permissions.delete(item, capability_item)
 
+    @api(version="2.0")
+    def reconcile_permissions(
+        self,
+        item: DatasourceItem,
+        rules: Iterable["PermissionsRule"],
+        dry_run: bool = False,
+        max_workers: int = 4,
+    ) -> PermissionsChanges:
+        return self._permissions.reconcile(item, rules, dry_run, max_workers)
+
+    @api(version="2.0")
+    def reconcile_permissions_many(
+        self,
+        items: Iterable[tuple[DatasourceItem, Iterable["PermissionsRule"]]],
+        dry_run: bool = False,
+        max_workers: int = 4,
+    ) -> list[PermissionsChanges]:
+        return self._permissions.reconcile_many(items, dry_run, max_workers)
+
     @api(version="3.5")
     def populate_dqw(self, item):
         self._data_quality_warnings.populate(item)
@@ -467,7 +497,7 @@ class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]
     def update_tags(self, item: DatasourceItem) -> None:
         return super().update_tags(item)
 
-    def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[DatasourceItem]:
+    def filter(self, *invalid, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[DatasourceItem]:
         """
         Queries the Tableau Server for items using the specified filters. Page
         size can be specified to limit the number of items returned in a single
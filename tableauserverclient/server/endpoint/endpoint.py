@@ -2,7 +2,7 @@ from typing_extensions import Concatenate, ParamSpec
 from tableauserverclient import datetime_helpers as datetime
 
 import abc
-from packaging.version import Version
+import time
 from functools import wraps
 from xml.etree.ElementTree import ParseError
 from typing import (
@@ -27,8 +27,14 @@ from tableauserverclient.server.endpoint.exceptions import (
 )
 from tableauserverclient.server.exceptions import EndpointUnavailableError
 
+from tableauserverclient.server.capabilities import register_feature
+from tableauserverclient.server.checkpoint import PaginationCheckpoint
+from tableauserverclient.server.hooks import Hooks, RequestEvent, url_template
+from tableauserverclient.server.rate_limiter import parse_retry_after
+from tableauserverclient.server.page_size import PageSize
 from tableauserverclient.server.query import QuerySet
 from tableauserverclient import helpers, get_versions
+from tableauserverclient.helpers import tracing
 
 from tableauserverclient.helpers.logging import logger
 
@@ -115,6 +121,35 @@ class Endpoint:
             self.parent_srv.http_options, auth_token, content, content_type, parameters
         )
 
+        tracer = self.parent_srv.tracer
+        if tracer is None:
+            return self._send_request(method, url, content, content_type, parameters)
+        with tracing.request_span(tracer, method.__name__.upper(), url, parameters["headers"], content) as span:
+            server_response = self._send_request(method, url, content, content_type, parameters)
+            tracing.set_response_attributes(span, server_response, bool(parameters.get("stream")))
+            return server_response
+
+    def _send_request(
+        self,
+        method: Callable[..., "Response"],
+        url: str,
+        content: Optional[bytes],
+        content_type: Optional[str],
+        parameters: dict[str, Any],
+    ) -> "Response":
+        hooks = self.parent_srv.hooks
+        event = None
+        if hooks:
+            hooks.flush()
+            event = RequestEvent(
+                method.__name__.upper(),
+                self.__class__.__name__,
+                url,
+                url_template(url, self.parent_srv.site_id),
+                len(content) if isinstance(content, (bytes, str)) else None,
+            )
+            hooks.emit(Hooks.BeforeRequest, event)
+
         logger.debug(f"request method {method.__name__}, url: {url}")
         if content:
             redacted = helpers.strings.redact_xml(content[:200])
@@ -124,6 +159,55 @@ class Endpoint:
         # a request can, for stuff like publishing, spin for ages waiting for a response.
         # we need some user-facing activity so they know it's not dead.
         request_timeout = self.parent_srv.http_options.get("timeout") or 0
+        limiter = self.parent_srv.rate_limiter
+        cost = limiter.cost(url_template(url, self.parent_srv.site_id)) if limiter is not None else 0.0
+        throttled = 0
+        start = time.perf_counter()
+        try:
+            while True:
+                if limiter is not None:
+                    limiter.acquire(cost)
+                    start = time.perf_counter()
+                server_response = self._send_once(method, url, parameters, request_timeout, hooks, event)
+                if limiter is None:
+                    break
+                if server_response.status_code == 429:
+                    limiter.throttled(parse_retry_after(server_response.headers.get("Retry-After")))
+                    if throttled < limiter.max_retries:
+                        throttled += 1
+                        logger.debug(f"[{datetime.timestamp()}] Request throttled: retrying")
+                        if event is not None:
+                            hooks.emit(Hooks.OnRetry, event)
+                            event.attempt += 1
+                        continue
+                else:
+                    limiter.succeeded()
+                break
+            if event is not None:
+                self._record_response(event, server_response, start, parameters)
+            self._check_status(server_response, url)
+        except Exception as e:
+            if event is not None:
+                event.error = e
+                if event.latency is None:
+                    event.latency = time.perf_counter() - start
+                hooks.emit(Hooks.OnError, event)
+            raise
+        if event is not None:
+            hooks.pending(event)
+
+        loggable_response = self.log_response_safely(server_response)
+        logger.debug(f"Server response from {url}")
+        # uncomment the following to log full responses in debug mode
+        # BE CAREFUL WHEN SHARING THESE RESULTS - MAY CONTAIN YOUR SENSITIVE DATA
+        # logger.debug(loggable_response)
+
+        if content_type == "application/xml":
+            self.parent_srv._namespace.detect(server_response.content)
+
+        return server_response
+
+    def _send_once(self, method, url, parameters, request_timeout, hooks, event) -> "Response":
         server_response: Optional[Union["Response", Exception]] = self.send_request_while_show_progress_threaded(
             method, url, parameters, request_timeout
         )
@@ -132,25 +216,31 @@ class Endpoint:
         if server_response is None:
             logger.debug(server_response)
             logger.debug(f"[{datetime.timestamp()}] Async request failed: retrying")
+            if event is not None:
+                hooks.emit(Hooks.OnRetry, event)
+                event.attempt += 1
             server_response = self._blocking_request(method, url, parameters)
         if server_response is None:
             logger.debug(f"[{datetime.timestamp()}] Request failed")
             raise RuntimeError
         if isinstance(server_response, Exception):
             raise server_response
-        self._check_status(server_response, url)
-
-        loggable_response = self.log_response_safely(server_response)
-        logger.debug(f"Server response from {url}")
-        # uncomment the following to log full responses in debug mode
-        # BE CAREFUL WHEN SHARING THESE RESULTS - MAY CONTAIN YOUR SENSITIVE DATA
-        # logger.debug(loggable_response)
-
-        if content_type == "application/xml":
-            self.parent_srv._namespace.detect(server_response.content)
-
         return server_response
 
+    @staticmethod
+    def _record_response(event: RequestEvent, server_response: "Response", start: float, parameters) -> None:
+        event.latency = time.perf_counter() - start
+        event.status = server_response.status_code
+        elapsed = getattr(server_response, "elapsed", None)
+        if elapsed is not None:
+            event.time_to_first_byte = elapsed.total_seconds()
+        if parameters.get("stream"):
+            # Reading the content would consume the stream, so rely on the declared length
+            length = server_response.headers.get("Content-Length")
+            event.bytes_received = int(length) if length else None
+        else:
+            event.bytes_received = len(server_response.content)
+
     def _check_status(self, server_response: "Response", url: Optional[str] = None):
         logger.debug(f"Response status: {server_response}")
         if not hasattr(server_response, "status_code"):
@@ -193,12 +283,11 @@ class Endpoint:
 
     def get_request(self, url, request_object=None, parameters=None):
         if request_object is not None:
-            try:
-                # Query param delimiters don't need to be encoded for versions before 3.7 (2020.1)
-                self.parent_srv.assert_at_least_version("3.7", "Query param encoding")
+            # Query param delimiters don't need to be encoded for versions before 3.7 (2020.1)
+            if self.parent_srv.check_at_least_version("3.7"):
                 parameters = parameters or {}
                 parameters["params"] = request_object.get_query_params()
-            except EndpointUnavailableError:
+            else:
                 url = request_object.apply_query_params(url)
 
         return self._make_request(
@@ -268,16 +357,52 @@ def api(version: str) -> Callable[[Callable[Concatenate[E, P], R]], Callable[Con
     """
 
     def _decorator(func: Callable[Concatenate[E, P], R]) -> Callable[Concatenate[E, P], R]:
+        register_feature(func.__qualname__, version)
+
         @wraps(func)
         def wrapper(self: E, *args: P.args, **kwargs: P.kwargs) -> R:
             self.parent_srv.assert_at_least_version(version, self.__class__.__name__)
-            return func(self, *args, **kwargs)
+            try:
+                tracer = self.parent_srv.tracer
+                if tracer is None:
+                    return func(self, *args, **kwargs)
+                with tracing.endpoint_span(tracer, self, func.__name__, args) as span:
+                    result = func(self, *args, **kwargs)
+                    tracing.set_result_attributes(span, result)
+                    return result
+            finally:
+                # The call has parsed its responses, so the last request made can be reported
+                hooks = self.parent_srv.hooks
+                if hooks:
+                    hooks.flush()
 
         return wrapper
 
     return _decorator
 
 
+def traced(func: Callable[Concatenate[E, P], R]) -> Callable[Concatenate[E, P], R]:
+    """Trace an endpoint method that is not annotated with `api`, when the server has a tracer.
+
+    Example:
+    >>> @traced
+    >>> def wait_for_job(self, job_id, *, timeout=None):
+    >>>     ...
+    """
+
+    @wraps(func)
+    def wrapper(self: E, *args: P.args, **kwargs: P.kwargs) -> R:
+        tracer = self.parent_srv.tracer
+        if tracer is None:
+            return func(self, *args, **kwargs)
+        with tracing.endpoint_span(tracer, self, func.__name__, args) as span:
+            result = func(self, *args, **kwargs)
+            tracing.set_result_attributes(span, result)
+            return result
+
+    return wrapper
+
+
 def parameter_added_in(**params: str) -> Callable[[Callable[Concatenate[E, P], R]], Callable[Concatenate[E, P], R]]:
     """Annotate minimum versions for new parameters or request options on an endpoint.
 
@@ -302,16 +427,18 @@ def parameter_added_in(**params: str) -> Callable[[Callable[Concatenate[E, P], R
     """
 
     def _decorator(func: Callable[Concatenate[E, P], R]) -> Callable[Concatenate[E, P], R]:
+        for param, version in params.items():
+            register_feature(f"{func.__qualname__}.{param}", str(version))
+
         @wraps(func)
         def wrapper(self: E, *args: P.args, **kwargs: P.kwargs) -> R:
             import warnings
 
-            server_ver = Version(self.parent_srv.version or "0.0")
-            params_to_check = set(params) & set(kwargs)
-            for p in params_to_check:
-                min_ver = Version(str(params[p]))
-                if server_ver < min_ver:
-                    error = f"{p!r} not available in {server_ver}, it will be ignored. Added in {min_ver}"
+            for p in kwargs:
+                if p in params and not self.parent_srv.check_at_least_version(str(params[p])):
+                    error = (
+                        f"{p!r} not available in {self.parent_srv.version}, it will be ignored. Added in {params[p]}"
+                    )
                     warnings.warn(error)
             return func(self, *args, **kwargs)
 
@@ -324,15 +451,19 @@ T = TypeVar("T")
 
 
 class QuerysetEndpoint(Endpoint, Generic[T]):
+    # Default page size for QuerySets and Pagers over this endpoint, an int or an AdaptivePageSize.
+    # When None, config.PAGE_SIZE is used.
+    page_size: Optional[PageSize] = None
+
     @api(version="2.0")
-    def all(self, *args, page_size: Optional[int] = None, **kwargs) -> QuerySet[T]:
+    def all(self, *args, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[T]:
         if args or kwargs:
             raise ValueError(".all method takes no arguments.")
         queryset = QuerySet(self, page_size=page_size)
         return queryset
 
     @api(version="2.0")
-    def filter(self, *_, page_size: Optional[int] = None, **kwargs) -> QuerySet[T]:
+    def filter(self, *_, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[T]:
         if _:
             raise RuntimeError("Only keyword arguments accepted.")
         queryset = QuerySet(self, page_size=page_size).filter(**kwargs)
@@ -350,6 +481,11 @@ class QuerysetEndpoint(Endpoint, Generic[T]):
         queryset = QuerySet(self).paginate(**kwargs)
         return queryset
 
+    @api(version="2.0")
+    def from_checkpoint(self, checkpoint: PaginationCheckpoint, page_size: Optional[PageSize] = None) -> QuerySet[T]:
+        queryset = QuerySet.from_checkpoint(self, checkpoint, page_size=page_size)
+        return queryset
+
     @abc.abstractmethod
     def get(self, request_options: Optional[RequestOptions] = None) -> tuple[list[T], PaginationItem]:
         raise NotImplementedError(f".get has not been implemented for {self.__class__.__qualname__}")
@@ -0,0 +1,123 @@
+import math
+import os
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+from tableauserverclient.config import config
+from tableauserverclient.helpers.export import FORMATS, INVENTORY, Columns, InventoryWriter, to_columns
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.server.endpoint.endpoint import Endpoint, api
+from tableauserverclient.server.request_options import RequestOptions
+
+
+class Export(Endpoint):
+    """
+    Bulk export of site content to files. Items are read into per-column buffers a page at a
+    time and each page is written out as soon as it is its turn, so memory stays bounded by the
+    pages in flight rather than by the size of the site.
+    """
+
+    @api(version="2.0")
+    def inventory(
+        self,
+        content: Iterable[str] = ("workbooks", "views", "datasources", "flows", "projects", "users"),
+        fmt: str = "ndjson",
+        path: str = ".",
+        page_size: Optional[int] = None,
+        max_workers: int = 4,
+    ) -> dict[str, str]:
+        """
+        Write an inventory of the site to one file per kind of content, named after the content
+        (e.g. "workbooks.csv") in the directory `path`.
+
+        Parameters
+        ----------
+        content : Iterable[str]
+            The kinds of content to export, any of "workbooks", "views", "datasources", "flows",
+            "projects" and "users".
+
+        fmt : str
+            "ndjson", "csv" or "parquet". Parquet files are written with pyarrow, which must be
+            installed separately.
+
+        path : str
+            The directory to write the files to.
+
+        page_size : int, optional
+            Items requested per page, defaults to the TSC_MAX_PAGE_SIZE setting.
+
+        max_workers : int
+            Pages fetched concurrently after the first one. Pass 1 to fetch pages one at a time.
+
+        Returns
+        -------
+        dict[str, str]
+            The path of the file written for each kind of content.
+
+        Examples
+        --------
+        >>> server.export.inventory(["workbooks", "views"], fmt="parquet", path="inventory")
+        """
+        content = list(content)
+        unknown = [name for name in content if name not in INVENTORY]
+        if unknown:
+            raise ValueError(f"Unknown content {', '.join(unknown)}, expected any of {', '.join(INVENTORY)}")
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown export format {fmt}, expected one of {', '.join(FORMATS)}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        os.makedirs(path, exist_ok=True)
+        page_size = page_size or config.MAX_PAGE_SIZE
+        written = {}
+        for name in content:
+            file_path = os.path.join(path, f"{name}.{fmt}")
+            endpoint_name, kwargs, columns = INVENTORY[name]
+            endpoint = getattr(self.parent_srv, endpoint_name)
+            writer = InventoryWriter.create(fmt, file_path, columns)
+            try:
+                self._export(endpoint, kwargs, columns, writer, page_size, max_workers)
+            finally:
+                writer.close()
+            logger.info(f"Exported {writer.rows} {name} to {file_path}")
+            written[name] = file_path
+        return written
+
+    def _export(
+        self,
+        endpoint: Any,
+        kwargs: dict[str, Any],
+        columns: Columns,
+        writer: InventoryWriter,
+        page_size: int,
+        max_workers: int,
+    ) -> None:
+        # The first page tells us how many pages there are
+        batch, total = _fetch_page(endpoint, kwargs, columns, 1, page_size)
+        writer.write(batch)
+        pages = math.ceil(total / page_size) if total else 1
+        if pages <= 1:
+            return
+
+        # Keep a bounded window of pages in flight and write them in page order as they complete
+        window = 2 * max_workers
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: deque[Future] = deque()
+            next_page = 2
+            while next_page <= pages or pending:
+                while next_page <= pages and len(pending) < window:
+                    pending.append(executor.submit(_fetch_page, endpoint, kwargs, columns, next_page, page_size))
+                    next_page += 1
+                batch, _ = pending.popleft().result()
+                writer.write(batch)
+
+
+def _fetch_page(
+    endpoint: Any, kwargs: dict[str, Any], columns: Columns, page_number: int, page_size: int
+) -> tuple[dict[str, list[Any]], int]:
+    req_options = RequestOptions(pagenumber=page_number, pagesize=page_size)
+    get = getattr(endpoint, "get_stream", endpoint.get)
+    items, pagination = get(req_options, **kwargs)
+    return to_columns(items, columns), pagination.total_available
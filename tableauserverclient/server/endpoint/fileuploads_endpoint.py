@@ -1,4 +1,4 @@
-from .endpoint import Endpoint, api
+from .endpoint import Endpoint, api, traced
 from tableauserverclient import datetime_helpers as datetime
 from tableauserverclient.helpers.logging import logger
 
@@ -49,6 +49,7 @@ class Fileuploads(Endpoint):
             if file_opened:
                 file_content.close()
 
+    @traced
     def upload(self, file):
         upload_id = self.initiate()
         for chunk in self._read_chunks(file):
@@ -7,6 +7,7 @@ from tableauserverclient.models import FlowRunItem
 from tableauserverclient.exponential_backoff import ExponentialBackoffTimer
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.server.page_size import PageSize
 from tableauserverclient.server.query import QuerySet
 
 if TYPE_CHECKING:
@@ -82,7 +83,7 @@ class FlowRuns(QuerysetEndpoint[FlowRunItem]):
         else:
             raise AssertionError("Unexpected status in flow_run", flow_run)
 
-    def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[FlowRunItem]:
+    def filter(self, *invalid, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[FlowRunItem]:
         """
         Queries the Tableau Server for items using the specified filters. Page
         size can be specified to limit the number of items returned in a single
@@ -6,14 +6,14 @@ import os
 from contextlib import closing
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING, Union
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 
 from tableauserverclient.helpers.headers import fix_filename
 
 from tableauserverclient.server.endpoint.dqw_endpoint import _DataQualityWarningEndpoint
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
 from tableauserverclient.server.endpoint.exceptions import InternalServerError, MissingRequiredFieldError
-from tableauserverclient.server.endpoint.permissions_endpoint import _PermissionsEndpoint
+from tableauserverclient.server.endpoint.permissions_endpoint import PermissionsChanges, _PermissionsEndpoint
 from tableauserverclient.server.endpoint.resource_tagger import _ResourceTagger, TaggingMixin
 from tableauserverclient.models import FlowItem, PaginationItem, ConnectionItem, JobItem
 from tableauserverclient.server import RequestFactory
@@ -23,6 +23,7 @@ from tableauserverclient.filesys_helpers import (
     get_file_type,
     get_file_object_size,
 )
+from tableauserverclient.server.page_size import PageSize
 from tableauserverclient.server.query import QuerySet
 
 io_types_r = (io.BytesIO, io.BufferedReader)
@@ -73,6 +74,14 @@ class Flows(QuerysetEndpoint[FlowItem], TaggingMixin[FlowItem]):
         all_flow_items = FlowItem.from_response(server_response.content, self.parent_srv.namespace)
         return all_flow_items, pagination_item
 
+    # Get all flows, building each item as it is read from the response
+    @api(version="3.3")
+    def get_stream(self, req_options: Optional["RequestOptions"] = None) -> tuple[Iterator[FlowItem], PaginationItem]:
+        logger.info("Streaming all flows on site")
+        url = self.baseurl
+        server_response = self.get_request(url, req_options)
+        return FlowItem.stream_response(server_response.content, self.parent_srv.namespace)
+
     # Get 1 flow by id
     @api(version="3.3")
     def get_by_id(self, flow_id: str) -> FlowItem:
@@ -275,6 +284,25 @@ class Flows(QuerysetEndpoint[FlowItem], TaggingMixin[FlowItem]):
     def delete_permission(self, item: FlowItem, capability_item: "PermissionsRule") -> None:
         self._permissions.delete(item, capability_item)
 
+    @api(version="3.3")
+    def reconcile_permissions(
+        self,
+        item: FlowItem,
+        rules: Iterable["PermissionsRule"],
+        dry_run: bool = False,
+        max_workers: int = 4,
+    ) -> PermissionsChanges:
+        return self._permissions.reconcile(item, rules, dry_run, max_workers)
+
+    @api(version="3.3")
+    def reconcile_permissions_many(
+        self,
+        items: Iterable[tuple[FlowItem, Iterable["PermissionsRule"]]],
+        dry_run: bool = False,
+        max_workers: int = 4,
+    ) -> list[PermissionsChanges]:
+        return self._permissions.reconcile_many(items, dry_run, max_workers)
+
     @api(version="3.5")
     def populate_dqw(self, item: FlowItem) -> None:
         self._data_quality_warnings.populate(item)
@@ -298,7 +326,7 @@ class Flows(QuerysetEndpoint[FlowItem], TaggingMixin[FlowItem]):
     ) -> list["AddResponse"]:  # actually should return a task
         return self.parent_srv.schedules.add_to_schedule(schedule_id, flow=item)
 
-    def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[FlowItem]:
+    def filter(self, *invalid, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[FlowItem]:
         """
         Queries the Tableau Server for items using the specified filters. Page
         size can be specified to limit the number of items returned in a single
@@ -5,18 +5,37 @@ from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldE
 from tableauserverclient.server import RequestFactory
 from tableauserverclient.models import GroupItem, UserItem, PaginationItem, JobItem
 from tableauserverclient.server.pager import Pager
+from tableauserverclient.config import config
 
 from tableauserverclient.helpers.logging import logger
 
-from typing import Optional, TYPE_CHECKING, Union
-from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional, TYPE_CHECKING, Union
+from collections.abc import Iterable, Iterator
 
+from tableauserverclient.server.page_size import PageSize
 from tableauserverclient.server.query import QuerySet
 
 if TYPE_CHECKING:
     from tableauserverclient.server.request_options import RequestOptions
 
 
+class MembershipChanges:
+    """The ids of the users added to and removed from a group by `Groups.sync_members`."""
+
+    def __init__(self, group: GroupItem, add: list[str], remove: list[str]) -> None:
+        self.group = group
+        self.add = add
+        self.remove = remove
+
+    def __repr__(self):
+        return f"<MembershipChanges group={self.group.id} add={len(self.add)} remove={len(self.remove)}>"
+
+    def __bool__(self) -> bool:
+        return bool(self.add or self.remove)
+
+
 class Groups(QuerysetEndpoint[GroupItem]):
     @property
     def baseurl(self) -> str:
@@ -59,6 +78,70 @@ class Groups(QuerysetEndpoint[GroupItem]):
         logger.info(f"Populated users for group (ID: {group_item.id})")
         return user_item, pagination_item
 
+    def _get_users_for_group_stream(
+        self, group_item: GroupItem, req_options: Optional["RequestOptions"] = None
+    ) -> tuple[Iterator[UserItem], PaginationItem]:
+        url = f"{self.baseurl}/{group_item.id}/users"
+        server_response = self.get_request(url, req_options)
+        return UserItem.stream_response(server_response.content, self.parent_srv.namespace)
+
+    def _member_ids(self, group_item):
+        # Only the ids are kept, so the members are read as a stream a page at a time
+        pager = Pager(
+            lambda options: self._get_users_for_group_stream(group_item, options), page_size=config.MAX_PAGE_SIZE
+        )
+        return {user.id for user in pager}
+
+    @api(version="2.0")
+    def sync_members(
+        self,
+        group_item: GroupItem,
+        users: Iterable[Union[str, UserItem]],
+        chunk_size: int = 1000,
+        max_workers: int = 4,
+        dry_run: bool = False,
+    ) -> MembershipChanges:
+        """
+        Make the members of a group exactly `users`, given as ids or UserItems.
+
+        The current members are read a page of up to TSC_MAX_PAGE_SIZE users at a time and
+        compared with `users`. From API version 3.21 the users to add and to remove are sent
+        in bulk requests of `chunk_size` users; on older servers they are added and removed
+        one at a time. Either way `max_workers` requests run at once. With `dry_run`, nothing
+        is changed and the returned MembershipChanges tells what would be.
+        """
+        if not group_item.id:
+            error = "Group item missing ID. Group must be retrieved from server first."
+            raise MissingRequiredFieldError(error)
+        if chunk_size < 1 or max_workers < 1:
+            raise ValueError("chunk_size and max_workers must be at least 1")
+
+        desired = set()
+        for user in users:
+            if not (user_id := user.id if isinstance(user, UserItem) else user):
+                raise ValueError("User ID must be populated")
+            desired.add(user_id)
+        current = self._member_ids(group_item)
+        changes = MembershipChanges(group_item, sorted(desired - current), sorted(current - desired))
+        logger.info(f"Membership changes for group (ID: {group_item.id}) (dry run: {dry_run}): {changes}")
+        if dry_run or not changes:
+            return changes
+
+        requests: list[Callable[[], object]]
+        if self.parent_srv.check_at_least_version("3.21"):
+            requests = [
+                partial(update, group_item, ids[i : i + chunk_size])
+                for update, ids in ((self.add_users, changes.add), (self.remove_users, changes.remove))
+                for i in range(0, len(ids), chunk_size)
+            ]
+        else:
+            requests = [partial(self.add_user, group_item, user_id) for user_id in changes.add]
+            requests.extend(partial(self.remove_user, group_item, user_id) for user_id in changes.remove)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+            for future in [executor.submit(request) for request in requests]:
+                future.result()
+        return changes
+
     @api(version="2.0")
     def delete(self, group_id: str) -> None:
         """Deletes 1 group by id"""
@@ -166,7 +249,7 @@ class Groups(QuerysetEndpoint[GroupItem]):
         logger.info(f"Added users to group (ID: {group_item.id})")
         return users
 
-    def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[GroupItem]:
+    def filter(self, *invalid, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[GroupItem]:
         """
         Queries the Tableau Server for items using the specified filters. Page
         size can be specified to limit the number of items returned in a single
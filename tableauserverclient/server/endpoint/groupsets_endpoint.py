@@ -5,6 +5,7 @@ from tableauserverclient.models.group_item import GroupItem
 from tableauserverclient.models.groupset_item import GroupSetItem
 from tableauserverclient.models.pagination_item import PaginationItem
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint
+from tableauserverclient.server.page_size import PageSize
 from tableauserverclient.server.query import QuerySet
 from tableauserverclient.server.request_options import RequestOptions
 from tableauserverclient.server.request_factory import RequestFactory
@@ -87,7 +88,7 @@ class GroupSets(QuerysetEndpoint[GroupSetItem]):
         updated_groupset = GroupSetItem.from_response(server_response.content, self.parent_srv.namespace)
         return updated_groupset[0]
 
-    def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[GroupSetItem]:
+    def filter(self, *invalid, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[GroupSetItem]:
         """
         Queries the Tableau Server for items using the specified filters. Page
         size can be specified to limit the number of items returned in a single
@@ -3,8 +3,9 @@ from typing_extensions import Self, overload
 
 
 from tableauserverclient.models import JobItem, BackgroundJobItem, PaginationItem
-from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
+from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api, traced
 from tableauserverclient.server.endpoint.exceptions import JobCancelledException, JobFailedException
+from tableauserverclient.server.page_size import PageSize
 from tableauserverclient.server.query import QuerySet
 from tableauserverclient.server.request_options import RequestOptionsBase
 from tableauserverclient.exponential_backoff import ExponentialBackoffTimer
@@ -64,6 +65,7 @@ class Jobs(QuerysetEndpoint[BackgroundJobItem]):
         new_job = JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
         return new_job
 
+    @traced
     def wait_for_job(self, job_id: Union[str, JobItem], *, timeout: Optional[float] = None) -> JobItem:
         if isinstance(job_id, JobItem):
             job_id = job_id.id
@@ -77,7 +79,12 @@ class Jobs(QuerysetEndpoint[BackgroundJobItem]):
             job = self.get_by_id(job_id)
             logger.debug(f"\tJob {job_id} progress={job.progress}")
 
-        logger.info(f"Job {job_id} Completed: Finish Code: {job.finish_code} - Notes:{job.notes}")
+        return self._finished(job)
+
+    @staticmethod
+    def _finished(job: JobItem) -> JobItem:
+        # Returns a completed job, or raises the exception for how it finished
+        logger.info(f"Job {job.id} Completed: Finish Code: {job.finish_code} - Notes:{job.notes}")
 
         if job.finish_code == JobItem.FinishCode.Success:
             return job
@@ -88,7 +95,7 @@ class Jobs(QuerysetEndpoint[BackgroundJobItem]):
         else:
             raise AssertionError("Unexpected finish_code in job", job)
 
-    def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[BackgroundJobItem]:
+    def filter(self, *invalid, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[BackgroundJobItem]:
         """
         Queries the Tableau Server for items using the specified filters. Page
         size can be specified to limit the number of items returned in a single
@@ -1,7 +1,10 @@
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 from tableauserverclient.server import RequestFactory
 from tableauserverclient.models import TableauItem, PermissionsRule
+from tableauserverclient.models.reference_item import ResourceReference
 
 from .endpoint import Endpoint
 from .exceptions import MissingRequiredFieldError
@@ -15,6 +18,62 @@ if TYPE_CHECKING:
     from ..request_options import RequestOptions
 
 
+def _by_grantee(rules: Iterable[PermissionsRule]) -> dict[tuple[str, str], PermissionsRule]:
+    merged: dict[tuple[str, str], PermissionsRule] = {}
+    for rule in rules:
+        key = (rule.grantee.tag_name, rule.grantee.id)
+        if key in merged:
+            existing = merged[key]
+            conflicts = [c for c, mode in rule.capabilities.items() if existing.capabilities.get(c, mode) != mode]
+            if conflicts:
+                raise ValueError(f"Conflicting modes for {', '.join(conflicts)} in the rules for {rule.grantee}")
+            rule = existing | rule
+        merged[key] = rule
+    return merged
+
+
+class PermissionsChanges:
+    """
+    What it takes to make the permissions of a resource match a list of rules: `add` holds the
+    capabilities to grant, sent in one request, and `remove` the capabilities to delete, which
+    take one request each. A capability whose mode changes is in both.
+    """
+
+    def __init__(self, resource: TableauItem, add: list[PermissionsRule], remove: list[PermissionsRule]) -> None:
+        self.resource = resource
+        self.add = add
+        self.remove = remove
+
+    def __repr__(self):
+        return f"<PermissionsChanges resource={self.resource.id} add={self.add} remove={self.remove}>"
+
+    def __bool__(self) -> bool:
+        return bool(self.add or self.remove)
+
+    @property
+    def calls(self) -> int:
+        """The number of requests needed to apply the changes."""
+        return (1 if self.add else 0) + sum(len(rule.capabilities) for rule in self.remove)
+
+    @classmethod
+    def between(
+        cls, resource: TableauItem, current: Iterable[PermissionsRule], desired: Iterable[PermissionsRule]
+    ) -> "PermissionsChanges":
+        current_rules = _by_grantee(current)
+        desired_rules = _by_grantee(desired)
+        add = []
+        for key, rule in desired_rules.items():
+            missing = rule - current_rules[key] if key in current_rules else rule
+            if missing.capabilities:
+                add.append(missing)
+        remove = []
+        for key, rule in current_rules.items():
+            extra = rule - desired_rules[key] if key in desired_rules else rule
+            if extra.capabilities:
+                remove.append(extra)
+        return cls(resource, add, remove)
+
+
 class _PermissionsEndpoint(Endpoint):
     """Adds permission model to another endpoint
 
@@ -53,22 +112,76 @@ class _PermissionsEndpoint(Endpoint):
 
         for rule in rules:
             for capability, mode in rule.capabilities.items():
-                "/permissions/groups/group-id/capability-name/capability-mode"
-                url = "{}/{}/permissions/{}/{}/{}/{}".format(
-                    self.owner_baseurl(),
-                    resource.id,
-                    rule.grantee.tag_name + "s",
-                    rule.grantee.id,
-                    capability,
-                    mode,
-                )
-
-                logger.debug(f"Removing {mode} permission for capability {capability}")
-
-                self.delete_request(url)
+                self._delete_capability(resource, rule.grantee, capability, mode)
 
             logger.info(f"Deleted permission for {rule.grantee.tag_name} {rule.grantee.id} item {resource.id}")
 
+    def _delete_capability(self, resource: TableauItem, grantee: ResourceReference, capability: str, mode: str) -> None:
+        "/permissions/groups/group-id/capability-name/capability-mode"
+        url = "{}/{}/permissions/{}/{}/{}/{}".format(
+            self.owner_baseurl(),
+            resource.id,
+            grantee.tag_name + "s",
+            grantee.id,
+            capability,
+            mode,
+        )
+
+        logger.debug(f"Removing {mode} permission for capability {capability}")
+
+        self.delete_request(url)
+
+    def reconcile(
+        self, resource: TableauItem, rules: Iterable[PermissionsRule], dry_run: bool = False, max_workers: int = 4
+    ) -> PermissionsChanges:
+        """
+        Make the permissions of a resource exactly `rules`: capabilities that are missing are
+        added, and capabilities that are not in `rules`, including those of grantees that do not
+        appear in them at all, are deleted. The current permissions are fetched once, the
+        additions are sent in a single request and the deletions `max_workers` at a time.
+
+        With `dry_run`, nothing is changed and the returned PermissionsChanges tells what would be.
+        """
+        if not resource.id:
+            error = "Server item is missing ID. Item must be retrieved from server first."
+            raise MissingRequiredFieldError(error)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        changes = PermissionsChanges.between(resource, self._get_permissions(resource), rules)
+        if dry_run or not changes:
+            logger.info(f"Permissions changes for resource {resource.id} (dry run: {dry_run}): {changes}")
+            return changes
+
+        # Deletions go first: a capability changing mode has to be removed before the other mode can be added
+        deletions = [(rule.grantee, c, mode) for rule in changes.remove for c, mode in rule.capabilities.items()]
+        if max_workers > 1 and len(deletions) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(deletions))) as executor:
+                list(executor.map(lambda deletion: self._delete_capability(resource, *deletion), deletions))
+        else:
+            for deletion in deletions:
+                self._delete_capability(resource, *deletion)
+        if changes.add:
+            self.update(resource, changes.add)
+        logger.info(f"Reconciled permissions for resource {resource.id} in {changes.calls + 1} requests")
+        return changes
+
+    def reconcile_many(
+        self,
+        resources: Iterable[tuple[TableauItem, Iterable[PermissionsRule]]],
+        dry_run: bool = False,
+        max_workers: int = 4,
+    ) -> list[PermissionsChanges]:
+        """
+        Reconcile the permissions of many resources, given as (resource, rules) pairs, `max_workers`
+        resources at a time. Each resource's deletions then run one after another, so no more than
+        `max_workers` requests are in flight.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda pair: self.reconcile(pair[0], pair[1], dry_run, 1), resources))
+
     def populate(self, item: TableauItem):
         if not item.id:
             error = "Server item is missing ID. Item must be retrieved from server first."
@@ -8,7 +8,10 @@ from tableauserverclient.server import RequestFactory, RequestOptions
 from tableauserverclient.models import ProjectItem, PaginationItem, Resource
 
 from typing import Optional, TYPE_CHECKING
+from collections.abc import Iterator
 
+from tableauserverclient.server.page_size import PageSize
+from tableauserverclient.server.project_tree import ProjectTree
 from tableauserverclient.server.query import QuerySet
 
 if TYPE_CHECKING:
@@ -38,6 +41,23 @@ class Projects(QuerysetEndpoint[ProjectItem]):
         all_project_items = ProjectItem.from_response(server_response.content, self.parent_srv.namespace)
         return all_project_items, pagination_item
 
+    @api(version="2.0")
+    def get_stream(
+        self, req_options: Optional["RequestOptions"] = None
+    ) -> tuple[Iterator[ProjectItem], PaginationItem]:
+        logger.info("Streaming all projects on site")
+        url = self.baseurl
+        server_response = self.get_request(url, req_options)
+        return ProjectItem.stream_response(server_response.content, self.parent_srv.namespace)
+
+    @api(version="2.0")
+    def tree(self, page_size: Optional[int] = None) -> ProjectTree:
+        """
+        Load all the projects of the site into a ProjectTree, for lookups by path and queries
+        on the content of a project and the projects below it.
+        """
+        return ProjectTree.load(self.parent_srv, page_size)
+
     @api(version="2.0")
     def delete(self, project_id: str) -> None:
         if not project_id:
@@ -85,6 +105,14 @@ class Projects(QuerysetEndpoint[ProjectItem]):
     def delete_permission(self, item, rules):
         self._permissions.delete(item, rules)
 
+    @api(version="2.0")
+    def reconcile_permissions(self, item, rules, dry_run=False, max_workers=4):
+        return self._permissions.reconcile(item, rules, dry_run, max_workers)
+
+    @api(version="2.0")
+    def reconcile_permissions_many(self, items, dry_run=False, max_workers=4):
+        return self._permissions.reconcile_many(items, dry_run, max_workers)
+
     @api(version="2.1")
     def populate_workbook_default_permissions(self, item):
         self._default_permissions.populate_default_permissions(item, Resource.Workbook)
@@ -157,7 +185,7 @@ class Projects(QuerysetEndpoint[ProjectItem]):
     def delete_lens_default_permissions(self, item, rule):
         self._default_permissions.delete_default_permission(item, rule, Resource.Lens)
 
-    def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[ProjectItem]:
+    def filter(self, *invalid, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[ProjectItem]:
         """
         Queries the Tableau Server for items using the specified filters. Page
         size can be specified to limit the number of items returned in a single
@@ -1,7 +1,9 @@
 import abc
 import copy
-from typing import Generic, Optional, Protocol, TypeVar, Union, TYPE_CHECKING, runtime_checkable
-from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Generic, Optional, Protocol, TypeVar, Union, TYPE_CHECKING, runtime_checkable
+from collections.abc import Iterable, Mapping
 import urllib.parse
 
 from tableauserverclient.server.endpoint.endpoint import Endpoint, api
@@ -149,6 +151,17 @@ class TaggingMixin(abc.ABC, Generic[T]):
 
 content = Iterable[Union["ColumnItem", "DatabaseItem", "DatasourceItem", "FlowItem", "TableItem", "WorkbookItem"]]
 
+# The endpoints that update the tags of each kind of item one at a time
+_TAGGING_ENDPOINTS = {
+    "DatasourceItem": "datasources",
+    "FlowItem": "flows",
+    "ViewItem": "views",
+    "WorkbookItem": "workbooks",
+}
+
+# The content types accepted by the batch requests
+_BATCH_CONTENT_TYPES = {"column", "database", "datasource", "flow", "table", "view", "workbook"}
+
 
 class Tags(Endpoint):
     def __init__(self, parent_srv: "Server"):
@@ -182,3 +195,71 @@ class Tags(Endpoint):
         batch_delete_req = RequestFactory.Tag.batch_create(tag_set, content)
         server_response = self.put_request(url, batch_delete_req)
         return TagItem.from_response(server_response.content, self.parent_srv.namespace)
+
+    @api(version="2.0")
+    def bulk_update(
+        self,
+        items: Union[Mapping[Any, Iterable[str]], Iterable[tuple[Any, Iterable[str]]]],
+        chunk_size: int = 100,
+        max_workers: int = 4,
+    ) -> list[Any]:
+        """
+        Set the tags of many items at once. `items` maps each item to the tags it should have, or
+        is a sequence of (item, tags) pairs; the changes are found by comparing them with the tags
+        the items were fetched with, as `update_tags` does.
+
+        From API version 3.9, the items that gain (or lose) the same tags are tagged together with
+        batch requests of up to `chunk_size` items. On older servers the items are updated one at a
+        time like `update_tags`, which tables, databases and columns cannot be. Either way
+        `max_workers` requests run at once. Returns the items that were changed, with their tags
+        updated.
+        """
+        if chunk_size < 1 or max_workers < 1:
+            raise ValueError("chunk_size and max_workers must be at least 1")
+
+        batched = self.parent_srv.check_at_least_version("3.9")
+        additions: dict[frozenset[str], list[Any]] = {}
+        deletions: dict[frozenset[str], list[Any]] = {}
+        requests: list[Callable[[], object]] = []
+        # Checked before any item is changed, so that an invalid item leaves them all as they were
+        updates: list[tuple[Any, set[str], bool]] = []
+        for item, tags in items.items() if isinstance(items, Mapping) else items:
+            if (initial_tags := getattr(item, "_initial_tags", None)) is None:
+                raise ValueError(f"{item} does not have initial tags.")
+            if not getattr(item, "id", None):
+                raise ValueError(f"Item {item} must have an ID to be tagged.")
+            tags = {tags} if isinstance(tags, str) else set(tags)
+            if tags == initial_tags:
+                continue
+            in_batch = batched and type(item).__name__.removesuffix("Item").lower() in _BATCH_CONTENT_TYPES
+            if not in_batch and type(item).__name__ not in _TAGGING_ENDPOINTS:
+                raise ValueError(f"{item} can only be tagged with batch requests, which need API version 3.9.")
+            updates.append((item, tags, in_batch))
+
+        changed = []
+        for item, tags, in_batch in updates:
+            item.tags = tags
+            changed.append(item)
+            if in_batch:
+                if add_set := frozenset(tags - item._initial_tags):
+                    additions.setdefault(add_set, []).append(item)
+                if remove_set := frozenset(item._initial_tags - tags):
+                    deletions.setdefault(remove_set, []).append(item)
+            else:
+                endpoint = getattr(self.parent_srv, _TAGGING_ENDPOINTS[type(item).__name__])
+                requests.append(partial(endpoint.update_tags, item))
+
+        for batch, groups in ((self.batch_add, additions), (self.batch_delete, deletions)):
+            for tag_set, group in groups.items():
+                requests.extend(
+                    partial(batch, tag_set, group[i : i + chunk_size]) for i in range(0, len(group), chunk_size)
+                )
+        logger.info(f"Updating the tags of {len(changed)} items with {len(requests)} requests")
+        if requests:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+                for future in [executor.submit(request) for request in requests]:
+                    future.result()
+
+        for item in changed:
+            item._initial_tags = copy.copy(item.tags)
+        return changed
@@ -112,6 +112,14 @@ class Tables(Endpoint, TaggingMixin[TableItem]):
     def delete_permission(self, item, rules):
         return self._permissions.delete(item, rules)
 
+    @api(version="3.5")
+    def reconcile_permissions(self, item, rules, dry_run=False, max_workers=4):
+        return self._permissions.reconcile(item, rules, dry_run, max_workers)
+
+    @api(version="3.5")
+    def reconcile_permissions_many(self, items, dry_run=False, max_workers=4):
+        return self._permissions.reconcile_many(items, dry_run, max_workers)
+
     @api(version="3.5")
     def populate_dqw(self, item):
         self._data_quality_warnings.populate(item)
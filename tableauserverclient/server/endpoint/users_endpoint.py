@@ -1,7 +1,13 @@
+import contextlib
 import copy
+import json
 import logging
-from typing import Optional
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Optional
+from collections.abc import Iterator
 
+from tableauserverclient.server.page_size import PageSize
 from tableauserverclient.server.query import QuerySet
 
 from .endpoint import QuerysetEndpoint, api
@@ -33,6 +39,19 @@ class Users(QuerysetEndpoint[UserItem]):
         all_user_items = UserItem.from_response(server_response.content, self.parent_srv.namespace)
         return all_user_items, pagination_item
 
+    # Gets all users, building each item as it is read from the response
+    @api(version="2.0")
+    def get_stream(self, req_options: Optional[RequestOptions] = None) -> tuple[Iterator[UserItem], PaginationItem]:
+        logger.info("Streaming all users on site")
+
+        if req_options is None:
+            req_options = RequestOptions()
+        req_options._all_fields = True
+
+        url = self.baseurl
+        server_response = self.get_request(url, req_options)
+        return UserItem.stream_response(server_response.content, self.parent_srv.namespace)
+
     # Gets 1 user by id
     @api(version="2.0")
     def get_by_id(self, user_id: str) -> UserItem:
@@ -96,28 +115,169 @@ class Users(QuerysetEndpoint[UserItem]):
         return created, failed
 
     # helping the user by parsing a file they could have used to add users through the UI
-    # line format: Username [required], password, display name, license, admin, publish
+    # line format: Username [required], password, display name, license, admin, publish, email, auth
     @api(version="2.0")
-    def create_from_file(self, filepath: str) -> tuple[list[UserItem], list[tuple[UserItem, ServerResponseError]]]:
-        created = []
-        failed = []
+    def create_from_file(
+        self,
+        filepath: str,
+        max_workers: int = 4,
+        group: Optional[GroupItem] = None,
+        report_path: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> tuple[list[UserItem], list[tuple[UserItem, Exception]]]:
+        """
+        Adds the users in a CSV file in the user import format to the site, and returns the users
+        created and the users that failed with their errors.
+
+        The file is read a line at a time and each line checked with UserItem.CSVImport; invalid
+        lines are not sent, and are returned as failed with a user named as on the line.
+        `max_workers` users are added at once, each followed by an update when the line sets a
+        display name, email or password. With a `group`, the users created are added to it,
+        `chunk_size` at a time from API version 3.21.
+
+        With a `report_path`, a JSON line is appended to that file for each line of the CSV file,
+        with its line number, user name, status ("created", "failed" or "invalid"), and the user
+        id or error, and one for each set of users added to the group. When the report exists, an
+        import started again skips the users it records as created, so an import that stopped
+        can be run again with the same report.
+        """
         if not filepath.find("csv"):
             raise ValueError("Only csv files are accepted")
+        if max_workers < 1 or chunk_size < 1:
+            raise ValueError("max_workers and chunk_size must be at least 1")
+        if group is not None and not group.id:
+            raise MissingRequiredFieldError("Group item missing ID. Group must be retrieved from server first.")
+
+        previous, grouped = self._read_import_report(report_path)
+        ungrouped: list[str] = []
+        if group is not None:
+            ungrouped = [
+                user_id
+                for status, user_id in previous.values()
+                if status == "created" and user_id and user_id not in grouped
+            ]
+        created: list[tuple[int, UserItem]] = []
+        failed: list[tuple[int, UserItem, Exception]] = []
+        with contextlib.ExitStack() as stack:
+            report = stack.enter_context(open(report_path, "a")) if report_path else None
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+
+            def record(entry: dict[str, Any]) -> None:
+                if report is not None:
+                    report.write(json.dumps(entry) + "\n")
+                    report.flush()
 
-        with open(filepath) as csv_file:
-            csv_file.seek(0)  # set to start of file in case it has been read earlier
-            line: str = csv_file.readline()
-            while line and line != "":
-                user: UserItem = UserItem.CSVImport.create_user_from_line(line)
+            def add_to_group(ids: list[str]) -> None:
+                if group is None or not ids:
+                    return
+                if self.parent_srv.check_at_least_version("3.21"):
+                    for i in range(0, len(ids), chunk_size):
+                        self.parent_srv.groups.add_users(group, ids[i : i + chunk_size])
+                        record({"status": "grouped", "group": group.id, "ids": ids[i : i + chunk_size]})
+                else:
+                    for user_id in ids:
+                        self.parent_srv.groups.add_user(group, user_id)
+                        record({"status": "grouped", "group": group.id, "ids": [user_id]})
+                ids.clear()
+
+            def finish(future: Future) -> None:
+                number, user = pending.pop(future)
+                entry = {"line": number, "name": user.name}
                 try:
-                    print(user)
-                    result = self.add(user)
-                    created.append(result)
-                except ServerResponseError as serverError:
-                    print("failed")
-                    failed.append((user, serverError))
-                line = csv_file.readline()
-        return created, failed
+                    new_user = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to add user {user.name} from line {number}: {e}")
+                    failed.append((number, user, e))
+                    record({**entry, "status": "failed", "id": user.id, "error": str(e)})
+                    return
+                created.append((number, new_user))
+                if group is not None and new_user.id:
+                    ungrouped.append(new_user.id)
+                record({**entry, "status": "created", "id": new_user.id})
+                if len(ungrouped) >= chunk_size:
+                    add_to_group(ungrouped)
+
+            pending: dict[Future, tuple[int, UserItem]] = {}
+            with open(filepath) as csv_file:
+                for number, line in enumerate(csv_file, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        UserItem.CSVImport._validate_import_line_or_throw(line, logger)
+                        user = UserItem.CSVImport.create_user_from_line(line)
+                    except (AttributeError, ValueError) as e:
+                        logger.warning(f"Skipping invalid line {number} of {filepath}: {e}")
+                        failed.append((number, UserItem(line.split(",")[0].strip() or None), e))
+                        record({"line": number, "status": "invalid", "error": str(e)})
+                        continue
+                    status, user_id = previous.get(user.name or "", (None, None))
+                    if status == "created":
+                        continue
+                    # When an earlier run added the user but failed to update it, only the update is retried
+                    user._id = user_id
+                    user.site_role = user.site_role or "Unlicensed"
+                    future = executor.submit(self._import_user, user, self._password_from_line(line))
+                    pending[future] = (number, user)
+                    # Only a few lines are read ahead of the requests, however long the file is
+                    if len(pending) >= max_workers * 2:
+                        for done in wait(pending, return_when=FIRST_COMPLETED).done:
+                            finish(done)
+            for done in list(pending):
+                finish(done)
+            add_to_group(ungrouped)
+
+        logger.info(f"Imported users from {filepath}: {len(created)} created, {len(failed)} failed")
+        return [user for _, user in sorted(created, key=lambda c: c[0])], [
+            (user, error) for _, user, error in sorted(failed, key=lambda f: f[0])
+        ]
+
+    def _import_user(self, user: UserItem, password: Optional[str]) -> UserItem:
+        if user.id is None:
+            new_user = self.add(user)
+            # Kept on the user read from the file, so that a failed update is reported with it
+            user._id = new_user.id
+        else:
+            new_user = copy.copy(user)
+        # Adding a user only sets its name, site role and authentication
+        if user.fullname or user.email or password:
+            new_user.fullname, new_user.email = user.fullname, user.email
+            new_user = self.update(new_user, password)
+        return new_user
+
+    @staticmethod
+    def _password_from_line(line: str) -> Optional[str]:
+        # Read from the line as it was written, CSVImport ignores case
+        values = [value.strip() for value in line.split(",")]
+        if len(values) > UserItem.CSVImport.ColumnType.PASS:
+            return values[UserItem.CSVImport.ColumnType.PASS] or None
+        return None
+
+    @staticmethod
+    def _read_import_report(
+        report_path: Optional[str],
+    ) -> tuple[dict[str, tuple[str, Optional[str]]], set[str]]:
+        # The last status and id of each user name, and the ids of the users added to the group
+        previous: dict[str, tuple[str, Optional[str]]] = {}
+        grouped: set[str] = set()
+        if report_path is None or not os.path.exists(report_path):
+            return previous, grouped
+        with open(report_path) as report:
+            line = ""
+            for line in report:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # The last line is cut short when an import is interrupted while writing it
+                    continue
+                if entry["status"] in ("created", "failed"):
+                    previous[entry["name"]] = (entry["status"], entry.get("id"))
+                elif entry["status"] == "grouped":
+                    grouped.update(entry["ids"])
+        if line and not line.endswith("\n"):
+            # Ended, so that the entries written next start on a line of their own
+            with open(report_path, "a") as report:
+                report.write("\n")
+        return previous, grouped
 
     # Get workbooks for user
     @api(version="2.0")
@@ -169,7 +329,7 @@ class Users(QuerysetEndpoint[UserItem]):
         pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
         return group_item, pagination_item
 
-    def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[UserItem]:
+    def filter(self, *invalid, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[UserItem]:
         """
         Queries the Tableau Server for items using the specified filters. Page
         size can be specified to limit the number of items returned in a single
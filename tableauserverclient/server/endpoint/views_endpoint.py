@@ -1,17 +1,30 @@
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
 
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
 from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldError
 from tableauserverclient.server.endpoint.permissions_endpoint import _PermissionsEndpoint
 from tableauserverclient.server.endpoint.resource_tagger import TaggingMixin
+from tableauserverclient.server.page_size import PageSize
 from tableauserverclient.server.query import QuerySet
+from tableauserverclient.server.view_export import ExportOptions, ExportSink, ViewExport, write_export
 
 from tableauserverclient.models import ViewItem, PaginationItem
 
+from tableauserverclient.helpers.export import (
+    CSV,
+    STRING,
+    InventoryWriter,
+    convert_csv_row,
+    csv_converters,
+    read_csv_rows,
+)
 from tableauserverclient.helpers.logging import logger
 
-from typing import Optional, TYPE_CHECKING, Union
+from typing import Any, Optional, TYPE_CHECKING, Union
 from collections.abc import Iterable, Iterator
 
 if TYPE_CHECKING:
@@ -51,6 +64,17 @@ class Views(QuerysetEndpoint[ViewItem], TaggingMixin[ViewItem]):
         all_view_items = ViewItem.from_response(server_response.content, self.parent_srv.namespace)
         return all_view_items, pagination_item
 
+    @api(version="2.2")
+    def get_stream(
+        self, req_options: Optional["RequestOptions"] = None, usage: bool = False
+    ) -> tuple[Iterator[ViewItem], PaginationItem]:
+        logger.info("Streaming all views on site")
+        url = self.baseurl
+        if usage:
+            url += "?includeUsageStatistics=true"
+        server_response = self.get_request(url, req_options)
+        return ViewItem.stream_response(server_response.content, self.parent_srv.namespace)
+
     @api(version="3.1")
     def get_by_id(self, view_id: str, usage: bool = False) -> ViewItem:
         if not view_id:
@@ -131,9 +155,88 @@ class Views(QuerysetEndpoint[ViewItem], TaggingMixin[ViewItem]):
 
     def _get_view_csv(self, view_item: ViewItem, req_options: Optional["CSVRequestOptions"]) -> Iterator[bytes]:
         url = f"{self.baseurl}/{view_item.id}/data"
+        return self._stream_content(url, req_options)
 
+    @api(version="2.7")
+    def iter_csv_rows(
+        self,
+        view_item: ViewItem,
+        req_options: Optional["CSVRequestOptions"] = None,
+        as_dicts: bool = False,
+        types: Optional[dict[str, str]] = None,
+        buffer_size: int = 64 * 1024,
+        encoding: str = "utf-8-sig",
+    ) -> Iterator[Any]:
+        """
+        Iterate over the rows of a view's data as they are downloaded, so that memory use does not
+        grow with the size of the data. The response is read and decoded `buffer_size` bytes at a
+        time.
+
+        Rows are lists of strings, starting with the header. With `as_dicts`, or when `types` is
+        given, rows are dicts keyed by column name instead, with empty cells read as None and the
+        columns named in `types` read as "int", "float" or "bool" values.
+
+        Example:
+        >>> for row in server.views.iter_csv_rows(view, types={"Sales": "float"}):
+        ...     total += row["Sales"] or 0
+        """
+        if not view_item.id:
+            error = "View item missing ID."
+            raise MissingRequiredFieldError(error)
+        url = f"{self.baseurl}/{view_item.id}/data"
+        rows = read_csv_rows(self._stream_content(url, req_options, buffer_size), encoding, buffer_size)
+        if not as_dicts and types is None:
+            return rows
+        return self._csv_dicts(rows, types or {})
+
+    @staticmethod
+    def _csv_dicts(rows: Iterator[list[str]], types: dict[str, str]) -> Iterator[dict[str, Any]]:
+        if (header := next(rows, None)) is None:
+            return
+        converters = csv_converters(header, types)
+        for row in rows:
+            yield dict(zip(header, convert_csv_row(row, converters)))
+
+    @api(version="2.7")
+    def write_csv_rows(
+        self,
+        view_item: ViewItem,
+        path: str,
+        fmt: str = CSV,
+        req_options: Optional["CSVRequestOptions"] = None,
+        types: Optional[dict[str, str]] = None,
+        batch_size: int = 10000,
+    ) -> int:
+        """
+        Write a view's data to `path` as "csv", "ndjson" or "parquet" while it is downloaded, with
+        the columns named in `types` read as "int", "float" or "bool" values as in `iter_csv_rows`.
+        Rows are written `batch_size` at a time, which is all that is held in memory. Parquet
+        files are written with pyarrow, which must be installed separately.
+
+        Returns the number of rows written.
+        """
+        types = types or {}
+        rows = self.iter_csv_rows(view_item, req_options)
+        if (header := next(rows, None)) is None:
+            return 0
+        converters = csv_converters(header, types)
+        writer = InventoryWriter.create(fmt, path, [(name, types.get(name, STRING)) for name in header])
+        try:
+            batch: list[list[Any]] = []
+            for row in rows:
+                batch.append(convert_csv_row(row, converters))
+                if len(batch) == batch_size:
+                    writer.write({name: [values[i] for values in batch] for i, name in enumerate(header)})
+                    batch = []
+            writer.write({name: [values[i] for values in batch] for i, name in enumerate(header)})
+        finally:
+            writer.close()
+        logger.info(f"Wrote {writer.rows} rows of view (ID: {view_item.id}) to {path}")
+        return writer.rows
+
+    def _stream_content(self, url: str, req_options, chunk_size: int = 1024) -> Iterator[bytes]:
         with closing(self.get_request(url, request_object=req_options, parameters={"stream": True})) as server_response:
-            yield from server_response.iter_content(1024)
+            yield from server_response.iter_content(chunk_size)
 
     @api(version="3.8")
     def populate_excel(self, view_item: ViewItem, req_options: Optional["ExcelRequestOptions"] = None) -> None:
@@ -149,9 +252,75 @@ class Views(QuerysetEndpoint[ViewItem], TaggingMixin[ViewItem]):
 
     def _get_view_excel(self, view_item: ViewItem, req_options: Optional["ExcelRequestOptions"]) -> Iterator[bytes]:
         url = f"{self.baseurl}/{view_item.id}/crosstab/excel"
+        return self._stream_content(url, req_options)
 
-        with closing(self.get_request(url, request_object=req_options, parameters={"stream": True})) as server_response:
-            yield from server_response.iter_content(1024)
+    @api(version="2.5")
+    def export_many(
+        self,
+        exports: Iterable[tuple[ViewItem, ExportOptions]],
+        destination: Union[str, os.PathLike, ExportSink],
+        max_workers: int = 4,
+        chunk_size: int = 64 * 1024,
+    ) -> list[ViewExport]:
+        """
+        Export many views as images, PDFs, CSV or Excel files, depending on the type of the options
+        given with each view, e.g. (view, ImageRequestOptions().vf("Region", "West")).
+
+        Each export is streamed in chunks of `chunk_size` bytes into a file in the `destination`
+        directory, named after the view id and a hash of the options, or passed to `destination`
+        if it is a callable taking the ViewExport and an iterator over the chunks. The same view
+        with the same options is only exported once. `max_workers` exports run at once, and
+        are throttled by the server's rate limiter if it has one.
+
+        A failed export does not stop the others. Returns a ViewExport for each of `exports`,
+        in order, with where it was written, its size, how long it took or the error it failed
+        with; duplicates share one.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        unique: dict[tuple, ViewExport] = {}
+        results = []
+        for view_item, req_options in exports:
+            export = ViewExport(view_item, req_options)
+            if export.key in unique:
+                export = unique[export.key]
+                export.requested += 1
+            else:
+                unique[export.key] = export
+            results.append(export)
+        if not unique:
+            return results
+        if not callable(destination):
+            os.makedirs(destination, exist_ok=True)
+
+        logger.info(f"Exporting {len(unique)} views ({len(results) - len(unique)} duplicates skipped)")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+            for future in [executor.submit(self._export, e, destination, chunk_size) for e in unique.values()]:
+                future.result()
+        failed = sum(not export.ok for export in unique.values())
+        logger.info(f"Exported {len(unique) - failed} views, {failed} failed")
+        return results
+
+    def _export(self, export: ViewExport, destination, chunk_size: int) -> None:
+        start = time.perf_counter()
+
+        def counted(chunks: Iterator[bytes]) -> Iterator[bytes]:
+            for chunk in chunks:
+                export.bytes_written += len(chunk)
+                yield chunk
+
+        try:
+            self.parent_srv.assert_at_least_version(export.version, f"Exporting views as {export.extension}")
+            url = f"{self.baseurl}/{export.view.id}/{export.path_suffix}"
+            chunks = counted(self._stream_content(url, export.options, chunk_size))
+            if callable(destination):
+                destination(export, chunks)
+            else:
+                write_export(export, chunks, destination)
+        except Exception as e:
+            logger.warning(f"Failed to export view (ID: {export.view.id}): {e}")
+            export.error = e
+        export.elapsed = time.perf_counter() - start
 
     @api(version="3.2")
     def populate_permissions(self, item: ViewItem) -> None:
@@ -165,6 +334,14 @@ class Views(QuerysetEndpoint[ViewItem], TaggingMixin[ViewItem]):
     def delete_permission(self, item, capability_item):
         return self._permissions.delete(item, capability_item)
 
+    @api(version="3.2")
+    def reconcile_permissions(self, item, rules, dry_run=False, max_workers=4):
+        return self._permissions.reconcile(item, rules, dry_run, max_workers)
+
+    @api(version="3.2")
+    def reconcile_permissions_many(self, items, dry_run=False, max_workers=4):
+        return self._permissions.reconcile_many(items, dry_run, max_workers)
+
     # Update view. Currently only tags can be updated
     def update(self, view_item: ViewItem) -> ViewItem:
         if not view_item.id:
@@ -188,7 +365,7 @@ class Views(QuerysetEndpoint[ViewItem], TaggingMixin[ViewItem]):
     def update_tags(self, item: ViewItem) -> None:
         return super().update_tags(item)
 
-    def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[ViewItem]:
+    def filter(self, *invalid, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[ViewItem]:
         """
         Queries the Tableau Server for items using the specified filters. Page
         size can be specified to limit the number of items returned in a single
@@ -157,6 +157,14 @@ class VirtualConnections(QuerysetEndpoint[VirtualConnectionItem], TaggingMixin):
     def delete_permission(self, item, capability_item):
         return self._permissions.delete(item, capability_item)
 
+    @api(version="3.22")
+    def reconcile_permissions(self, item, rules, dry_run=False, max_workers=4):
+        return self._permissions.reconcile(item, rules, dry_run, max_workers)
+
+    @api(version="3.22")
+    def reconcile_permissions_many(self, items, dry_run=False, max_workers=4):
+        return self._permissions.reconcile_many(items, dry_run, max_workers)
+
     @api(version="3.23")
     def add_tags(
         self, virtual_connection: Union[VirtualConnectionItem, str], tags: Union[Iterable[str], str]
@@ -7,6 +7,7 @@ from contextlib import closing
 from pathlib import Path
 
 from tableauserverclient.helpers.headers import fix_filename
+from tableauserverclient.server.page_size import PageSize
 from tableauserverclient.server.query import QuerySet
 
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api, parameter_added_in
@@ -29,7 +30,7 @@ from typing import (
     TYPE_CHECKING,
     Union,
 )
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 
 if TYPE_CHECKING:
     from tableauserverclient.server import Server
@@ -76,6 +77,16 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
         all_workbook_items = WorkbookItem.from_response(server_response.content, self.parent_srv.namespace)
         return all_workbook_items, pagination_item
 
+    # Get all workbooks, building each item as it is read from the response
+    @api(version="2.0")
+    def get_stream(
+        self, req_options: Optional["RequestOptions"] = None
+    ) -> tuple[Iterator[WorkbookItem], PaginationItem]:
+        logger.info("Streaming all workbooks on site")
+        url = self.baseurl
+        server_response = self.get_request(url, req_options)
+        return WorkbookItem.stream_response(server_response.content, self.parent_srv.namespace)
+
     # Get 1 workbook
     @api(version="2.0")
     def get_by_id(self, workbook_id: str) -> WorkbookItem:
@@ -300,6 +311,14 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
     def delete_permission(self, item, capability_item):
         return self._permissions.delete(item, capability_item)
 
+    @api(version="2.0")
+    def reconcile_permissions(self, item, rules, dry_run=False, max_workers=4):
+        return self._permissions.reconcile(item, rules, dry_run, max_workers)
+
+    @api(version="2.0")
+    def reconcile_permissions_many(self, items, dry_run=False, max_workers=4):
+        return self._permissions.reconcile_many(items, dry_run, max_workers)
+
     @api(version="2.0")
     @parameter_added_in(as_job="3.0")
     @parameter_added_in(connections="2.8")
@@ -505,7 +524,7 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
     def update_tags(self, item: WorkbookItem) -> None:
         return super().update_tags(item)
 
-    def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[WorkbookItem]:
+    def filter(self, *invalid, page_size: Optional[PageSize] = None, **kwargs) -> QuerySet[WorkbookItem]:
         """
         Queries the Tableau Server for items using the specified filters. Page
         size can be specified to limit the number of items returned in a single
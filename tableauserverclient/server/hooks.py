@@ -0,0 +1,136 @@
+import re
+import threading
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
+
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.models import xml_backend
+
+# Path segments that name an item rather than a resource: luids, numbers (e.g. revisions) and upload session ids
+_ID_SEGMENT = re.compile(r"^(?:[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}|[0-9a-fA-F]{32}|\d+|[^/]*:[^/]*)$")
+_API_PREFIX = re.compile(r"^.*?/api/(?:\d+\.\d+|exp)(?=/)")
+
+
+def url_template(url: str, site_id: Optional[str] = None) -> str:
+    """
+    The route of a request URL, without the server address, API version, query and ids, so that
+    requests for different items of the same resource can be counted together. For example
+    ".../api/3.22/sites/<site id>/workbooks/<workbook id>/content?includeExtract=False" becomes
+    "/sites/{site_id}/workbooks/{id}/content".
+    """
+    path = _API_PREFIX.sub("", urlsplit(url).path)
+    segments = []
+    for segment in path.split("/"):
+        if site_id and segment == site_id:
+            segment = "{site_id}"
+        elif _ID_SEGMENT.match(segment):
+            segment = "{id}"
+        segments.append(segment)
+    return "/".join(segments)
+
+
+class RequestEvent:
+    """
+    A request made by an endpoint, as passed to the hooks. Timings are in seconds and sizes in
+    bytes. Fields describing the response are None until it has been received.
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "url",
+        "url_template",
+        "status",
+        "bytes_sent",
+        "bytes_received",
+        "time_to_first_byte",
+        "latency",
+        "parse_time",
+        "attempt",
+        "error",
+    )
+
+    def __init__(self, method: str, endpoint: str, url: str, template: str, bytes_sent: Optional[int] = None) -> None:
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.url_template = template
+        self.status: Optional[int] = None
+        self.bytes_sent = bytes_sent
+        self.bytes_received: Optional[int] = None
+        self.time_to_first_byte: Optional[float] = None
+        self.latency: Optional[float] = None
+        self.parse_time: Optional[float] = None
+        self.attempt = 1
+        self.error: Optional[BaseException] = None
+
+    def __repr__(self):
+        return f"<RequestEvent {self.endpoint} {self.method} {self.url_template} status={self.status}>"
+
+
+Hook = Callable[[RequestEvent], Any]
+
+
+class Hooks:
+    """
+    Callbacks run around every request a server's endpoints make, registered with `add`:
+
+    before_request: the request is about to be sent.
+    after_response: a successful response has been handled. This runs once the endpoint call
+        that made the request has returned (or the next request starts), so that the time
+        spent parsing the response is known.
+    on_retry: the request failed without a response, or was throttled by the server's rate
+        limits (see RateLimiter), and is being sent again.
+    on_error: the request failed, either without a response or with an error status.
+
+    Callbacks receive a RequestEvent. An exception raised by a callback is logged and does not
+    fail the request.
+
+    Example:
+    >>> server.hooks.add("after_response", lambda event: print(event.url_template, event.latency))
+    """
+
+    BeforeRequest = "before_request"
+    AfterResponse = "after_response"
+    OnRetry = "on_retry"
+    OnError = "on_error"
+    Events = (BeforeRequest, AfterResponse, OnRetry, OnError)
+
+    def __init__(self) -> None:
+        self._callbacks: dict[str, list[Hook]] = {}
+        self._local = threading.local()
+
+    def __bool__(self) -> bool:
+        return bool(self._callbacks)
+
+    def add(self, event: str, callback: Hook) -> None:
+        if event not in self.Events:
+            raise ValueError(f"Unknown hook {event}, expected one of {', '.join(self.Events)}")
+        # Copy on write, so requests running on other threads can keep iterating the old list
+        self._callbacks = {**self._callbacks, event: [*self._callbacks.get(event, []), callback]}
+
+    def remove(self, event: str, callback: Hook) -> None:
+        callbacks = [c for c in self._callbacks.get(event, []) if c != callback]
+        self._callbacks = {name: c for name, c in {**self._callbacks, event: callbacks}.items() if c}
+
+    def emit(self, event: str, request: RequestEvent) -> None:
+        for callback in self._callbacks.get(event, []):
+            try:
+                callback(request)
+            except Exception:
+                logger.exception(f"The {event} hook {callback} failed")
+
+    def pending(self, request: RequestEvent) -> None:
+        """Hold a successful request until its response has been parsed, see `flush`."""
+        self.flush()
+        self._local.pending = request
+        xml_backend.start_parse_timing()
+
+    def flush(self) -> None:
+        """Run after_response for the request held on this thread, if any."""
+        request = getattr(self._local, "pending", None)
+        if request is None:
+            return
+        self._local.pending = None
+        request.parse_time = xml_backend.stop_parse_timing()
+        self.emit(self.AfterResponse, request)
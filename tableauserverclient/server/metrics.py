@@ -0,0 +1,123 @@
+import bisect
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Optional
+from collections.abc import Sequence
+
+from tableauserverclient.server.hooks import Hooks, RequestEvent
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class _RouteMetrics:
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.statuses: Counter = Counter()
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.time_to_first_byte_sum = 0.0
+        self.parse_time_sum = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        # One count per bucket, plus one for latencies above the last bound
+        self.histogram = [0] * (len(buckets) + 1)
+
+    def to_dict(self, buckets: Sequence[float]) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "latency": {
+                "sum": self.latency_sum,
+                "mean": self.latency_sum / self.count if self.count else 0.0,
+                "max": self.latency_max,
+                "histogram": {
+                    **{str(bound): count for bound, count in zip(buckets, self.histogram)},
+                    "+Inf": self.histogram[-1],
+                },
+            },
+            "time_to_first_byte_sum": self.time_to_first_byte_sum,
+            "parse_time_sum": self.parse_time_sum,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+        }
+
+
+class MetricsAggregator:
+    """
+    Collects request counts, statuses, latency histograms, parse times and transferred bytes
+    per endpoint and route from a server's request hooks. The histogram counts are per bucket,
+    not cumulative. Safe to share between threads and servers.
+
+    Example:
+    >>> metrics = TSC.MetricsAggregator()
+    >>> metrics.attach(server)
+    >>> list(TSC.Pager(server.workbooks))
+    >>> print(json.dumps(metrics.snapshot(), indent=2))
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._routes: dict[tuple[str, str, str], _RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, server: "Server") -> None:
+        server.hooks.add(Hooks.AfterResponse, self.record)
+        server.hooks.add(Hooks.OnError, self.record)
+        server.hooks.add(Hooks.OnRetry, self.record_retry)
+
+    def detach(self, server: "Server") -> None:
+        server.hooks.remove(Hooks.AfterResponse, self.record)
+        server.hooks.remove(Hooks.OnError, self.record)
+        server.hooks.remove(Hooks.OnRetry, self.record_retry)
+
+    def _route(self, event: RequestEvent) -> _RouteMetrics:
+        key = (event.endpoint, event.method, event.url_template)
+        route = self._routes.get(key)
+        if route is None:
+            route = self._routes[key] = _RouteMetrics(self.buckets)
+        return route
+
+    def record(self, event: RequestEvent) -> None:
+        with self._lock:
+            route = self._route(event)
+            route.count += 1
+            if event.error is not None:
+                route.errors += 1
+            if event.status is not None:
+                route.statuses[event.status] += 1
+            if event.latency is not None:
+                route.latency_sum += event.latency
+                route.latency_max = max(route.latency_max, event.latency)
+                route.histogram[bisect.bisect_left(self.buckets, event.latency)] += 1
+            route.time_to_first_byte_sum += event.time_to_first_byte or 0.0
+            route.parse_time_sum += event.parse_time or 0.0
+            route.bytes_sent += event.bytes_sent or 0
+            route.bytes_received += event.bytes_received or 0
+
+    def record_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._route(event).retries += 1
+
+    def snapshot(self, endpoint: Optional[str] = None) -> dict[str, Any]:
+        """
+        The metrics collected so far, as JSON-serializable dicts keyed by endpoint class name and
+        then by "<method> <route>", e.g. snapshot()["Workbooks"]["GET /sites/{site_id}/workbooks"].
+        """
+        with self._lock:
+            result: dict[str, Any] = {}
+            for (name, method, template), route in sorted(self._routes.items()):
+                if endpoint is None or name == endpoint:
+                    result.setdefault(name, {})[f"{method} {template}"] = route.to_dict(self.buckets)
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
@@ -0,0 +1,320 @@
+import json
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, Any, Callable, Optional
+
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.models import (
+    DatasourceItem,
+    FlowItem,
+    GroupItem,
+    PermissionsRule,
+    ProjectItem,
+    UserItem,
+    WorkbookItem,
+)
+from tableauserverclient.server.pager import Pager
+from tableauserverclient.server.project_tree import ProjectTree
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+# The content that can be migrated, in the order it is published: workbooks and flows can
+# connect to published data sources, so those come first.
+CONTENT = ("datasources", "workbooks", "flows")
+
+# Marks the end of the downloads for the publishing threads
+_DONE = object()
+
+
+def _new_item(kind: str, item: Any, project_id: str) -> Any:
+    new_item: Any
+    if kind == "datasources":
+        new_item = DatasourceItem(project_id, item.name)
+    elif kind == "workbooks":
+        new_item = WorkbookItem(project_id, item.name, show_tabs=item.show_tabs)
+    else:
+        new_item = FlowItem(project_id, item.name)
+    new_item.description = item.description
+    return new_item
+
+
+class Migration:
+    """
+    Copies the projects, data sources, workbooks and flows of one site to another, with their
+    tags, owners and permissions.
+
+    Projects are matched by path, and the missing ones are created on the target site. Owners
+    and permissions are carried over to the users and groups with the same names on the target
+    site; permissions for users or groups it does not have are left out. Data sources are
+    published before workbooks and flows, which can connect to them.
+
+    The content is listed with paged requests and downloaded by `download_workers` threads into
+    a queue of at most `queue_size` files, from which `upload_workers` threads publish it, so
+    no more than that many downloads are on disk at once. Existing items with the same name are
+    overwritten.
+
+    A JSON line is appended to the manifest at `manifest_path` for each item, with its kind, id,
+    and its id on the target site, error or reason for being skipped. When the manifest exists,
+    a migration started again carries on where it stopped, skipping everything already migrated.
+    Items that fail are reported in `failed` and tried again the next time.
+
+    Workbooks in a Personal Space have no project to publish them to on the target site. They
+    are reported in `skipped`.
+
+    Embedded credentials, project default permissions and the connections of workbooks to data
+    sources are not migrated.
+
+    Example:
+    >>> migration = TSC.Migration(source_server, target_server, "migration.jsonl").run()
+    >>> print(migration.failed)
+    """
+
+    def __init__(
+        self,
+        source: "Server",
+        target: "Server",
+        manifest_path: Optional[str] = None,
+        content: Iterable[str] = CONTENT,
+        download_workers: int = 4,
+        upload_workers: int = 2,
+        queue_size: int = 8,
+        include_extract: bool = True,
+        work_dir: Optional[str] = None,
+    ) -> None:
+        self.content = [kind for kind in CONTENT if kind in set(content)]
+        if unknown := set(content) - set(CONTENT):
+            raise ValueError(f"Unknown content {', '.join(sorted(unknown))}, expected any of {', '.join(CONTENT)}")
+        if min(download_workers, upload_workers, queue_size) < 1:
+            raise ValueError("download_workers, upload_workers and queue_size must be at least 1")
+        self.source = source
+        self.target = target
+        self.manifest_path = manifest_path
+        self.download_workers = download_workers
+        self.upload_workers = upload_workers
+        self.queue_size = queue_size
+        self.include_extract = include_extract
+        self.work_dir = work_dir
+
+        # kind -> source id -> target id, for projects and the content kinds
+        self.migrated: dict[str, dict[str, str]] = {kind: {} for kind in ("projects", *CONTENT)}
+        # kind -> source id -> error
+        self.failed: dict[str, dict[str, str]] = {}
+        # kind -> source id -> reason
+        self.skipped: dict[str, dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._manifest: Optional[IO[str]] = None
+        self._users: dict[str, str] = {}
+        self._groups: dict[str, str] = {}
+
+    def __repr__(self):
+        migrated = ", ".join(f"{kind}={len(ids)}" for kind, ids in self.migrated.items())
+        failed = sum(map(len, self.failed.values()))
+        skipped = sum(map(len, self.skipped.values()))
+        return f"<Migration {migrated} failed={failed} skipped={skipped}>"
+
+    def run(self) -> "Migration":
+        self._load_manifest()
+        self.failed = {}
+        self.skipped = {}
+        if self.manifest_path is not None:
+            self._manifest = open(self.manifest_path, "a")
+        try:
+            self._map_principals()
+            self._migrate_projects()
+            for kind in self.content:
+                self._migrate_content(kind)
+        finally:
+            if self._manifest is not None:
+                self._manifest.close()
+                self._manifest = None
+        logger.info(f"Migration finished: {self}")
+        return self
+
+    def _load_manifest(self) -> None:
+        if self.manifest_path is None or not os.path.exists(self.manifest_path):
+            return
+        with open(self.manifest_path) as f:
+            line = ""
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # The last line is cut short when a migration is interrupted while writing it
+                    continue
+                if "target_id" in entry:
+                    self.migrated.setdefault(entry["kind"], {})[entry["id"]] = entry["target_id"]
+        if line and not line.endswith("\n"):
+            # Ended, so that the entries written next start on a line of their own
+            with open(self.manifest_path, "a") as f:
+                f.write("\n")
+        logger.info(f"Resuming migration from {self.manifest_path}: {self}")
+
+    def _record(
+        self,
+        kind: str,
+        source_id: str,
+        target_id: Optional[str] = None,
+        error: Optional[str] = None,
+        skipped: Optional[str] = None,
+    ) -> None:
+        entry: dict[str, str] = {"kind": kind, "id": source_id}
+        with self._lock:
+            if target_id is not None:
+                self.migrated[kind][source_id] = target_id
+                self.failed.get(kind, {}).pop(source_id, None)
+                entry["target_id"] = target_id
+            elif skipped is not None:
+                self.skipped.setdefault(kind, {})[source_id] = skipped
+                entry["skipped"] = skipped
+            else:
+                self.failed.setdefault(kind, {})[source_id] = error or ""
+                entry["error"] = error or ""
+            if self._manifest is not None:
+                self._manifest.write(json.dumps(entry) + "\n")
+                self._manifest.flush()
+
+    def _map_principals(self) -> None:
+        # Users and groups are matched by name, users ignoring case as sign in does
+        target_users = {(user.name or "").lower(): user.id for user in Pager(self.target.users, stream=True)}
+        self._users = {
+            user.id: target_users[name]
+            for user in Pager(self.source.users, stream=True)
+            if (name := (user.name or "").lower()) in target_users
+        }
+        target_groups = {group.name: group.id for group in Pager(self.target.groups)}
+        self._groups = {
+            group.id: target_groups[group.name] for group in Pager(self.source.groups) if group.name in target_groups
+        }
+
+    def _migrate_projects(self) -> None:
+        # Parents before children, so that the parent of each project exists when it is created
+        source_tree = ProjectTree.load(self.source)
+        target_tree = ProjectTree.load(self.target)
+        project_ids = [
+            project.id
+            for top in source_tree.children()
+            for project in source_tree.descendants(top.id or "", include_self=True)
+            if project.id and project.id not in self.migrated["projects"]
+        ]
+        for project_id in project_ids:
+            try:
+                target_project = self._migrate_project(source_tree, target_tree, source_tree.get(project_id))
+            except Exception as e:
+                logger.warning(f"Failed to migrate project (ID: {project_id}): {e}")
+                self._record("projects", project_id, error=str(e))
+                continue
+            self._record("projects", project_id, target_project.id)
+
+    def _migrate_project(self, source_tree: ProjectTree, target_tree: ProjectTree, project):
+        path = source_tree.path(project.id)
+        try:
+            return target_tree.by_path([p.name or "" for p in reversed([project, *source_tree.ancestors(project.id)])])
+        except KeyError:
+            pass
+        parent_id = None
+        if project.parent_id in source_tree:
+            parent_id = self.migrated["projects"].get(project.parent_id)
+            if parent_id is None:
+                raise ValueError(f"The project above {path} was not migrated")
+        new_project = ProjectItem(project.name, project.description, project.content_permissions, parent_id)
+        new_project = self.target.projects.create(new_project)
+        if (owner_id := self._users.get(project.owner_id)) and owner_id != new_project.owner_id:
+            new_project.owner_id = owner_id
+            new_project = self.target.projects.update(new_project)
+        self._copy_permissions("projects", project, new_project)
+        target_tree.add(new_project)
+        logger.info(f"Created project {path} (ID: {new_project.id})")
+        return new_project
+
+    def _copy_permissions(self, kind: str, item: Any, new_item: Any) -> None:
+        getattr(self.source, kind).populate_permissions(item)
+        references: dict[str, tuple[dict[str, str], Callable[[str], Any]]] = {
+            UserItem.tag_name: (self._users, UserItem.as_reference),
+            GroupItem.tag_name: (self._groups, GroupItem.as_reference),
+        }
+        rules = []
+        for rule in item.permissions:
+            principals, reference = references.get(rule.grantee.tag_name, ({}, str))
+            if rule.grantee.id in principals:
+                rules.append(PermissionsRule(reference(principals[rule.grantee.id]), dict(rule.capabilities)))
+            else:
+                logger.debug(f"No {rule.grantee.tag_name} matches {rule.grantee.id} on the target site")
+        getattr(self.target, kind).reconcile_permissions(new_item, rules)
+
+    def _migrate_content(self, kind: str) -> None:
+        downloads: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        work_dir = tempfile.mkdtemp(prefix="tsc-migration-", dir=self.work_dir)
+        uploaders = [
+            threading.Thread(target=self._upload, args=(kind, downloads), daemon=True)
+            for _ in range(self.upload_workers)
+        ]
+        for thread in uploaders:
+            thread.start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+                for item in Pager(getattr(self.source, kind), stream=True):
+                    if item.id in self.migrated[kind]:
+                        continue
+                    if item.project_id is None:
+                        logger.info(f"Skipping {kind} (ID: {item.id}) in a Personal Space")
+                        self._record(kind, item.id, skipped="In a Personal Space, which cannot be migrated")
+                        continue
+                    executor.submit(self._download, kind, item, work_dir, downloads)
+        finally:
+            for _ in uploaders:
+                downloads.put(_DONE)
+            for thread in uploaders:
+                thread.join()
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _download(self, kind: str, item: Any, work_dir: str, downloads: queue.Queue) -> None:
+        try:
+            if item.project_id not in self.migrated["projects"]:
+                raise ValueError(f"Project {item.project_id} was not migrated")
+            # Each item gets a directory of its own, as items in different projects can share names
+            directory = tempfile.mkdtemp(dir=work_dir)
+            endpoint = getattr(self.source, kind)
+            if kind == "flows":
+                path = endpoint.download(item.id, directory)
+            else:
+                path = endpoint.download(item.id, directory, include_extract=self.include_extract)
+        except Exception as e:
+            logger.warning(f"Failed to download {kind} (ID: {item.id}): {e}")
+            self._record(kind, item.id, error=str(e))
+            return
+        # Blocks while the queue is full, which holds back the downloads until publishing catches up
+        downloads.put((item, path))
+
+    def _upload(self, kind: str, downloads: queue.Queue) -> None:
+        while (download := downloads.get()) is not _DONE:
+            item, path = download
+            try:
+                new_item = self._publish(kind, item, path)
+            except Exception as e:
+                logger.warning(f"Failed to publish {kind} (ID: {item.id}): {e}")
+                self._record(kind, item.id, error=str(e))
+            else:
+                self._record(kind, item.id, new_item.id)
+            finally:
+                shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+
+    def _publish(self, kind: str, item: Any, path: str) -> Any:
+        endpoint = getattr(self.target, kind)
+        new_item = _new_item(kind, item, self.migrated["projects"][item.project_id])
+        new_item = endpoint.publish(new_item, path, self.target.PublishMode.Overwrite)
+        new_item.tags = set(item.tags)
+        if (owner_id := self._users.get(item.owner_id)) and owner_id != new_item.owner_id:
+            # Updating the item updates its tags too
+            new_item.owner_id = owner_id
+            new_item = endpoint.update(new_item)
+        else:
+            endpoint.update_tags(new_item)
+        self._copy_permissions(kind, item, new_item)
+        logger.info(f"Migrated {kind} {item.name} (ID: {item.id} -> {new_item.id})")
+        return new_item
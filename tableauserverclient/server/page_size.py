@@ -0,0 +1,124 @@
+import math
+import time
+from typing import Callable, NamedTuple, Optional, TypeVar, Union
+from collections.abc import Sized
+
+from requests.exceptions import Timeout
+
+from tableauserverclient.config import config
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.server.endpoint.exceptions import InternalServerError
+from tableauserverclient.server.request_options import RequestOptions
+
+R = TypeVar("R")
+
+GATEWAY_TIMEOUT = 504
+
+
+class PageTiming(NamedTuple):
+    page_number: int
+    page_size: int
+    item_count: Optional[int]
+    seconds: float
+    timed_out: bool = False
+
+
+class AdaptivePageSize:
+    """
+    Picks the page size for each request made by a Pager or QuerySet. Paging starts at the
+    server maximum and the page size is halved whenever a page takes longer than
+    `target_seconds` or times out (the timed out page is requested again at the smaller
+    size). Once pages come back quickly the size grows again, up to `maximum` but never
+    back to a size that has timed out.
+
+    Every page fetched is recorded in `history` so the chosen sizes and latencies can be
+    inspected and used to tune per-endpoint settings. An instance can be passed as
+    `page_size` to Pager and QuerySet, or assigned to an endpoint's `page_size` to be used
+    by default for that endpoint.
+
+    Example:
+    >>> views_pager = TSC.Pager(server.views, usage=True, page_size=TSC.AdaptivePageSize(target_seconds=5))
+    """
+
+    def __init__(
+        self,
+        maximum: Optional[int] = None,
+        minimum: int = 10,
+        target_seconds: float = 10.0,
+        initial: Optional[int] = None,
+    ) -> None:
+        self.maximum = maximum or config.MAX_PAGE_SIZE
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.target_seconds = target_seconds
+        self.current = min(initial or self.maximum, self.maximum)
+        self.ceiling = self.maximum
+        self.history: list[PageTiming] = []
+
+    def __repr__(self):
+        return f"<AdaptivePageSize current={self.current} min={self.minimum} max={self.maximum}>"
+
+    def next_page(self, offset: int) -> tuple[int, int]:
+        # Page numbers are only meaningful relative to a page size, so the size used must
+        # divide the number of items already read or the next page would skip or repeat items.
+        page_size = self.current
+        if offset % page_size:
+            # The largest divisor that is at most one step of growth above the current size,
+            # and only smaller than the minimum when the offset has no divisor above it
+            upper = min(self.ceiling, 2 * self.current)
+            divisors = _divisors(offset)
+            page_size = max((d for d in divisors if self.minimum <= d <= upper), default=0) or max(
+                d for d in divisors if d <= self.current
+            )
+        return offset // page_size + 1, page_size
+
+    def record(self, page_number: int, page_size: int, item_count: Optional[int], seconds: float) -> None:
+        self.history.append(PageTiming(page_number, page_size, item_count, seconds))
+        if seconds > self.target_seconds:
+            self.current = max(self.minimum, page_size // 2)
+        elif seconds < self.target_seconds / 4 and page_size >= self.current:
+            self.current = min(self.ceiling, page_size * 2)
+
+    def record_timeout(self, page_number: int, page_size: int, seconds: float) -> bool:
+        """Record a page that timed out. Returns True if it is worth retrying at a smaller size."""
+        self.history.append(PageTiming(page_number, page_size, 0, seconds, True))
+        if page_size <= self.minimum:
+            return False
+        self.ceiling = max(self.minimum, min(self.ceiling, page_size - 1))
+        self.current = max(self.minimum, page_size // 2)
+        logger.info(f"Page {page_number} timed out at page size {page_size}, retrying with {self.current}")
+        return True
+
+    def fetch(self, fetch_page: Callable[[RequestOptions], R], options: RequestOptions, offset: int) -> R:
+        """Fetch the page starting at `offset`, setting the page number and size on `options`."""
+        while True:
+            options.pagenumber, options.pagesize = self.next_page(offset)
+            start = time.perf_counter()
+            try:
+                response = fetch_page(options)
+            except (Timeout, InternalServerError) as e:
+                elapsed = time.perf_counter() - start
+                if not is_timeout(e) or not self.record_timeout(options.pagenumber, options.pagesize, elapsed):
+                    raise
+                continue
+            items = response[0] if isinstance(response, tuple) else response
+            # Streamed pages are still being parsed, so their size is not known yet
+            item_count = len(items) if isinstance(items, Sized) else None
+            self.record(options.pagenumber, options.pagesize, item_count, time.perf_counter() - start)
+            return response
+
+
+PageSize = Union[int, AdaptivePageSize]
+
+
+def _divisors(number: int) -> list[int]:
+    divisors = []
+    for i in range(1, math.isqrt(number) + 1):
+        if number % i == 0:
+            divisors.extend((i, number // i))
+    return divisors
+
+
+def is_timeout(error: Exception) -> bool:
+    if isinstance(error, InternalServerError):
+        return error.code == GATEWAY_TIMEOUT
+    return isinstance(error, Timeout)
@@ -1,9 +1,11 @@
 import copy
 from functools import partial
-from typing import Optional, Protocol, TypeVar, Union, runtime_checkable
+from typing import Any, Optional, Protocol, TypeVar, Union, runtime_checkable
 from collections.abc import Iterable, Iterator
 
 from tableauserverclient.models.pagination_item import PaginationItem
+from tableauserverclient.server.checkpoint import PaginationCheckpoint, endpoint_name
+from tableauserverclient.server.page_size import AdaptivePageSize, PageSize
 from tableauserverclient.server.request_options import RequestOptions
 
 
@@ -27,15 +29,37 @@ class Pager(Iterable[T]):
     (users in a group, views in a workbook, etc) by passing a different endpoint.
 
     Will loop over anything that returns (list[ModelItem], PaginationItem).
+
+    With `stream=True` the endpoint's `get_stream` is used, so each page is parsed
+    incrementally and items are yielded while the rest of the page is still being read.
+
+    `page_size` overrides the page size of `request_opts`. Passing an `AdaptivePageSize`
+    lets the page size follow the server's response times. If neither is given, the
+    endpoint's own `page_size` setting is used when it has one.
+
+    While iterating, `checkpoint` holds the position of the crawl. It can be saved as JSON
+    and passed to `Pager.from_checkpoint` to continue from the same item later.
     """
 
     def __init__(
         self,
         endpoint: Union[CallableEndpoint[T], Endpoint[T]],
         request_opts: Optional[RequestOptions] = None,
+        page_size: Optional[PageSize] = None,
+        stream: bool = False,
         **kwargs,
     ) -> None:
-        if isinstance(endpoint, Endpoint):
+        if page_size is None and request_opts is None:
+            page_size = getattr(endpoint, "page_size", None)
+        self._endpoint_name = endpoint_name(endpoint)
+        self._parameters = kwargs
+        self._resume_from: Optional[PaginationCheckpoint] = None
+
+        if stream:
+            if not hasattr(endpoint, "get_stream"):
+                raise ValueError("Pager can only stream endpoints that have a get_stream method.")
+            self._endpoint = partial(endpoint.get_stream, **kwargs)
+        elif isinstance(endpoint, Endpoint):
             # The simpliest case is to take an Endpoint and call its get
             endpoint = partial(endpoint.get, **kwargs)
             self._endpoint = endpoint
@@ -48,23 +72,67 @@ class Pager(Iterable[T]):
             raise ValueError("Pager needs a server endpoint to page through.")
 
         self._options = request_opts or RequestOptions()
+        self._adaptive_page_size: Optional[AdaptivePageSize] = None
+        if isinstance(page_size, AdaptivePageSize):
+            self._adaptive_page_size = page_size
+        elif page_size:
+            self._options = copy.deepcopy(self._options).page_size(page_size)
+        self.checkpoint = PaginationCheckpoint.from_request_options(
+            self._options, self._endpoint_name, self._parameters
+        )
+
+    @classmethod
+    def from_checkpoint(
+        cls,
+        source: Any,
+        checkpoint: PaginationCheckpoint,
+        page_size: Optional[PageSize] = None,
+        stream: bool = False,
+    ) -> "Pager":
+        """
+        Create a Pager that continues the crawl recorded in `checkpoint`. `source` is either
+        the endpoint to page through or the Server, in which case the endpoint named in the
+        checkpoint is used.
+        """
+        endpoint = source
+        if not isinstance(source, (Endpoint, CallableEndpoint)):
+            if checkpoint.endpoint is None:
+                raise ValueError("Checkpoint does not name an endpoint, pass the endpoint to resume instead.")
+            endpoint = getattr(source, checkpoint.endpoint)
+        pager = cls(endpoint, checkpoint.request_options(), page_size, stream, **checkpoint.parameters)
+        pager._resume_from = checkpoint
+        return pager
 
     def __iter__(self) -> Iterator[T]:
         options = copy.deepcopy(self._options)
+        offset = (options.pagenumber - 1) * options.pagesize
+        resume_from = self._resume_from
+        self.checkpoint = PaginationCheckpoint.from_request_options(options, self._endpoint_name, self._parameters)
         while True:
             # Fetch the first page
-            current_item_list, pagination_item = self._endpoint(options)
+            if self._adaptive_page_size is None:
+                current_item_list, pagination_item = self._endpoint(options)
+            else:
+                current_item_list, pagination_item = self._adaptive_page_size.fetch(self._endpoint, options, offset)
+
+            self.checkpoint.next_page(options.pagenumber, options.pagesize)
+            if resume_from is not None:
+                current_item_list = self.checkpoint.resume_page(resume_from, current_item_list)
+                resume_from = None
+
+            for item in current_item_list:
+                self.checkpoint.advance(item)
+                yield item
 
             if pagination_item.total_available is None:
-                # This endpoint does not support pagination, drain the list and return
-                yield from current_item_list
+                # This endpoint does not support pagination, the list has been drained
                 return
-            yield from current_item_list
 
             if pagination_item.page_size * pagination_item.page_number >= pagination_item.total_available:
                 # Last page, exit
                 return
 
             # Update the options to fetch the next page
+            offset = pagination_item.page_number * pagination_item.page_size
             options.pagenumber = pagination_item.page_number + 1
             options.pagesize = pagination_item.page_size
@@ -0,0 +1,201 @@
+import datetime
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from tableauserverclient.datetime_helpers import format_datetime
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.models import ProjectItem
+from tableauserverclient.server.filter import Filter
+from tableauserverclient.server.pager import Pager
+from tableauserverclient.server.request_options import RequestOptions
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+# Characters that cannot be sent in a projectName:in:[...] filter value
+_UNFILTERABLE = set(",'\"[]:")
+
+# Margin for clock differences between this machine and the server when refreshing
+_REFRESH_MARGIN = datetime.timedelta(minutes=5)
+
+Path = Union[str, Sequence[str]]
+
+Field = RequestOptions.Field
+Operator = RequestOptions.Operator
+
+
+def _name_filter(names: list[str]) -> RequestOptions:
+    options = RequestOptions()
+    options.filter.add(Filter(Field.ProjectName, Operator.In, names))
+    return options
+
+
+class _IdOptions(RequestOptions):
+    """Lists only the ids of the projects, to find the ones that were deleted."""
+
+    def get_query_params(self):
+        params = super().get_query_params()
+        params["fields"] = "id"
+        return params
+
+
+class ProjectTree:
+    """
+    The projects of a site as a tree, loaded with one paged crawl of the projects endpoint.
+    Projects can be looked up by id or by path, e.g. "Finance/EMEA/Reports" (pass a sequence of
+    names for names that contain "/"), and the workbooks, data sources and flows of a subtree can
+    be listed with a few batched requests.
+
+    Example:
+    >>> tree = server.projects.tree()
+    >>> reports = tree.by_path("Finance/EMEA/Reports")
+    >>> for workbook in tree.workbooks(reports.id):
+    ...     print(tree.path(workbook.project_id), workbook.name)
+    """
+
+    def __init__(self, projects: Iterable[ProjectItem] = ()) -> None:
+        self.refreshed_at: Optional[datetime.datetime] = None
+        self._server: Optional["Server"] = None
+        self._index(projects)
+
+    def __repr__(self):
+        return f"<ProjectTree projects={len(self._projects)}>"
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def __contains__(self, project_id: object) -> bool:
+        return project_id in self._projects
+
+    def __iter__(self) -> Iterator[ProjectItem]:
+        return iter(self._projects.values())
+
+    @classmethod
+    def load(cls, server: "Server", page_size: Optional[int] = None) -> "ProjectTree":
+        started = datetime.datetime.now(datetime.timezone.utc)
+        tree = cls(Pager(server.projects, page_size=page_size, stream=True))
+        tree._server = server
+        tree.refreshed_at = started
+        logger.info(f"Loaded a tree of {len(tree)} projects")
+        return tree
+
+    def _index(self, projects: Iterable[ProjectItem]) -> None:
+        self._projects: dict[str, ProjectItem] = {}
+        self._children: dict[Optional[str], list[str]] = {}
+        for project in projects:
+            if project.id is not None:
+                self._projects[project.id] = project
+        for project_id, project in self._projects.items():
+            parent_id = project.parent_id if project.parent_id in self._projects else None
+            self._children.setdefault(parent_id, []).append(project_id)
+        self._paths: dict[tuple[str, ...], str] = {}
+        self._index_paths(None, ())
+
+    def _index_paths(self, parent_id: Optional[str], prefix: tuple[str, ...]) -> None:
+        for project_id in self._children.get(parent_id, []):
+            path = prefix + (self._projects[project_id].name or "",)
+            self._paths[path] = project_id
+            self._index_paths(project_id, path)
+
+    def get(self, project_id: str) -> ProjectItem:
+        return self._projects[project_id]
+
+    def by_path(self, path: Path) -> ProjectItem:
+        """The project at a path of names from the top level. Raises KeyError if there is none."""
+        names = tuple(path.strip("/").split("/")) if isinstance(path, str) else tuple(path)
+        return self._projects[self._paths[names]]
+
+    def path(self, project_id: str) -> str:
+        return "/".join(project.name or "" for project in reversed([self.get(project_id), *self.ancestors(project_id)]))
+
+    def parent(self, project_id: str) -> Optional[ProjectItem]:
+        parent_id = self.get(project_id).parent_id
+        return self._projects.get(parent_id) if parent_id is not None else None
+
+    def children(self, project_id: Optional[str] = None) -> list[ProjectItem]:
+        """The projects directly in a project, or the top level projects without one."""
+        return [self._projects[child] for child in self._children.get(project_id, [])]
+
+    def ancestors(self, project_id: str) -> Iterator[ProjectItem]:
+        """The projects above a project, nearest first."""
+        parent = self.parent(project_id)
+        while parent is not None and parent.id is not None:
+            yield parent
+            parent = self.parent(parent.id)
+
+    def descendants(self, project_id: str, include_self: bool = False) -> Iterator[ProjectItem]:
+        """The projects below a project, depth first."""
+        if include_self:
+            yield self.get(project_id)
+        for child_id in self._children.get(project_id, []):
+            yield from self.descendants(child_id, include_self=True)
+
+    def subtree_ids(self, project_id: str) -> set[str]:
+        return {project.id for project in self.descendants(project_id, include_self=True) if project.id}
+
+    def workbooks(self, project_id: str, recursive: bool = True, chunk_size: int = 100) -> Iterator[Any]:
+        return self._content("workbooks", project_id, recursive, chunk_size)
+
+    def datasources(self, project_id: str, recursive: bool = True, chunk_size: int = 100) -> Iterator[Any]:
+        return self._content("datasources", project_id, recursive, chunk_size)
+
+    def flows(self, project_id: str, recursive: bool = True, chunk_size: int = 100) -> Iterator[Any]:
+        return self._content("flows", project_id, recursive, chunk_size)
+
+    def _content(self, kind: str, project_id: str, recursive: bool, chunk_size: int) -> Iterator[Any]:
+        # Project names are only unique among siblings, so the items are filtered by name in
+        # batches on the server and then by project id here
+        server = self._require_server()
+        ids = self.subtree_ids(project_id) if recursive else {self.get(project_id).id or project_id}
+        names = sorted({name for i in ids if (name := self._projects[i].name)})
+        endpoint = getattr(server, kind)
+        if any(_UNFILTERABLE.intersection(name) for name in names):
+            logger.debug(f"Project names cannot be used as a filter, listing all {kind}")
+            queries = [Pager(endpoint)]
+        else:
+            queries = [
+                Pager(endpoint, _name_filter(names[i : i + chunk_size])) for i in range(0, len(names), chunk_size)
+            ]
+        for query in queries:
+            for item in query:
+                if item.project_id in ids:
+                    yield item
+
+    def _require_server(self) -> "Server":
+        if self._server is None:
+            raise ValueError("The tree was not loaded from a server, use ProjectTree.load")
+        return self._server
+
+    def add(self, project: ProjectItem) -> None:
+        """Add a project, or update it after it was changed or moved."""
+        self._index([*(p for p in self._projects.values() if p.id != project.id), project])
+
+    def remove(self, project_id: str) -> None:
+        """Remove a project and the projects below it, as deleting it on the server does."""
+        removed = self.subtree_ids(project_id)
+        self._index(p for p in self._projects.values() if p.id not in removed)
+
+    def refresh(self) -> int:
+        """
+        Update the tree with the projects changed since it was loaded or last refreshed, and drop
+        the ones that were deleted. Deleted projects cannot be queried, so they are found by
+        listing the ids of the projects on the site. If a project turns up that is neither in the
+        tree nor changed, the whole tree is loaded again. Returns the number of projects updated
+        or removed.
+        """
+        server = self._require_server()
+        started = datetime.datetime.now(datetime.timezone.utc)
+        since = (self.refreshed_at or started) - _REFRESH_MARGIN
+        options = RequestOptions()
+        options.filter.add(Filter(Field.UpdatedAt, Operator.GreaterThanOrEqual, format_datetime(since)))
+        changed = list(Pager(server.projects, options))
+        current = {project.id for project in Pager(server.projects, _IdOptions(), stream=True)}
+        projects = {project_id: project for project_id, project in self._projects.items() if project_id in current}
+        removed = len(self._projects) - len(projects)
+        projects.update((project.id, project) for project in changed)
+        if not current.issubset(projects):
+            logger.info("Projects were missed by the refresh, loading the whole tree again")
+            projects = {project.id: project for project in Pager(server.projects, stream=True)}
+        self._index(projects.values())
+        self.refreshed_at = started
+        return len(changed) + removed
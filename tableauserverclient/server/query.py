@@ -3,9 +3,11 @@ from itertools import count
 from typing import Optional, Protocol, TYPE_CHECKING, TypeVar, overload
 import sys
 from tableauserverclient.config import config
+from tableauserverclient.server.checkpoint import PaginationCheckpoint, endpoint_name
 from tableauserverclient.models.pagination_item import PaginationItem
 from tableauserverclient.server.endpoint.exceptions import ServerResponseError
 from tableauserverclient.server.filter import Filter
+from tableauserverclient.server.page_size import AdaptivePageSize, PageSize
 from tableauserverclient.server.request_options import RequestOptions
 from tableauserverclient.server.sort import Sort
 import math
@@ -60,23 +62,64 @@ class QuerySet(Iterable[T], Sized):
     QuerySets are also indexable, and can be sliced. If you try to access an
     index that has not been fetched, the QuerySet will fetch the page that
     contains the item you are looking for.
+
+    The page size can be an `AdaptivePageSize`, in which case iterating adjusts
+    the page size to the server's response times. If no page size is given the
+    endpoint's `page_size` setting is used, falling back to config.PAGE_SIZE.
+
+    While iterating, `checkpoint` holds the position reached. It can be saved as
+    JSON and passed to `QuerySet.from_checkpoint` to continue from the same item.
     """
 
-    def __init__(self, model: "QuerysetEndpoint[T]", page_size: Optional[int] = None) -> None:
+    def __init__(self, model: "QuerysetEndpoint[T]", page_size: Optional[PageSize] = None) -> None:
         self.model = model
-        self.request_options = RequestOptions(pagesize=page_size or config.PAGE_SIZE)
+        self.request_options = RequestOptions()
+        self._adaptive_page_size: Optional[AdaptivePageSize] = None
+        self._set_page_size(page_size or getattr(model, "page_size", None) or config.PAGE_SIZE)
         self._result_cache: list[T] = []
         self._pagination_item = PaginationItem()
+        self._resume_from: Optional[PaginationCheckpoint] = None
+        self.checkpoint = PaginationCheckpoint.from_request_options(self.request_options, endpoint_name(model))
+
+    @classmethod
+    def from_checkpoint(
+        cls, model: "QuerysetEndpoint[T]", checkpoint: PaginationCheckpoint, page_size: Optional[PageSize] = None
+    ) -> "QuerySet[T]":
+        # A fixed page size has to match the checkpoint for its page number to point at the same items
+        if not isinstance(page_size, AdaptivePageSize):
+            page_size = checkpoint.page_size
+        queryset = cls(model, page_size=page_size)
+        options = checkpoint.request_options()
+        queryset.request_options.filter = options.filter
+        queryset.request_options.sort = options.sort
+        queryset.request_options._all_fields = options._all_fields
+        queryset._resume_from = checkpoint
+        return queryset
 
     def __iter__(self: Self) -> Iterator[T]:
-        # Not built to be re-entrant. Starts back at page 1, and empties
-        # the result cache. Ensure the result_cache is empty to not yield
-        # items from prior usage.
+        # Not built to be re-entrant. Starts back at page 1 (or the page of the
+        # checkpoint it was created from), and empties the result cache. Ensure
+        # the result_cache is empty to not yield items from prior usage.
         self._result_cache = []
-
-        for page in count(1):
-            self.request_options.pagenumber = page
+        resume_from = self._resume_from
+        offset = 0
+        first_page = 1
+        if resume_from is not None:
+            first_page = resume_from.page_number
+            if self._adaptive_page_size is None:
+                self.request_options.pagesize = resume_from.page_size
+            # The checkpoint's page number counts pages of the size it was written with,
+            # which an adaptive page size will not be using now
+            offset = (first_page - 1) * resume_from.page_size
+        self.checkpoint = PaginationCheckpoint.from_request_options(self.request_options, endpoint_name(self.model))
+
+        for page in count(first_page):
             self._result_cache = []
+            if self._adaptive_page_size is None:
+                self.request_options.pagenumber = page
+            else:
+                page_number, page_size = self._adaptive_page_size.next_page(offset)
+                self.request_options.page_number(page_number).page_size(page_size)
             try:
                 self._fetch_all()
             except ServerResponseError as e:
@@ -85,12 +128,20 @@ class QuerySet(Iterable[T], Sized):
                     # up overrunning the total number of pages. Catch the
                     # error and break out of the loop.
                     raise StopIteration
-            yield from self._result_cache
+            self.checkpoint.next_page(self.request_options.pagenumber, self.request_options.pagesize)
+            items = self._result_cache
+            if resume_from is not None:
+                items = self.checkpoint.resume_page(resume_from, items)
+                resume_from = None
+            for item in items:
+                self.checkpoint.advance(item)
+                yield item
             # If the length of the QuerySet is unknown, continue fetching until
             # the result cache is empty.
             if (size := len(self)) == 0:
                 continue
-            if (page * self.page_size) >= size:
+            offset += self.page_size
+            if offset >= size:
                 return
 
     @overload
@@ -151,12 +202,27 @@ class QuerySet(Iterable[T], Sized):
         Retrieve the data and store result and pagination item in cache
         """
         if not self._result_cache:
-            response = self.model.get(self.request_options)
-            if isinstance(response, tuple):
-                self._result_cache, self._pagination_item = response
+            if self._adaptive_page_size is None:
+                response = self.model.get(self.request_options)
             else:
-                self._result_cache = response
-                self._pagination_item = PaginationItem()
+                offset = (self.request_options.pagenumber - 1) * self.request_options.pagesize
+                response = self._adaptive_page_size.fetch(self.model.get, self.request_options, offset)
+            self._cache_response(response)
+
+    def _cache_response(self: Self, response) -> None:
+        if isinstance(response, tuple):
+            self._result_cache, self._pagination_item = response
+        else:
+            self._result_cache = response
+            self._pagination_item = PaginationItem()
+
+    def _set_page_size(self: Self, page_size: PageSize) -> None:
+        if isinstance(page_size, AdaptivePageSize):
+            self._adaptive_page_size = page_size
+            self.request_options.pagesize = page_size.current
+        else:
+            self._adaptive_page_size = None
+            self.request_options.pagesize = page_size
 
     def __len__(self: Self) -> int:
         return self.total_available or sys.maxsize
@@ -180,7 +246,7 @@ class QuerySet(Iterable[T], Sized):
         # pagesize from the RequestOptions.
         return self._pagination_item.page_size or self.request_options.pagesize
 
-    def filter(self: Self, *invalid, page_size: Optional[int] = None, **kwargs) -> Self:
+    def filter(self: Self, *invalid, page_size: Optional[PageSize] = None, **kwargs) -> Self:
         if invalid:
             raise RuntimeError("Only accepts keyword arguments.")
         for kwarg_key, value in kwargs.items():
@@ -188,7 +254,7 @@ class QuerySet(Iterable[T], Sized):
             self.request_options.filter.add(Filter(field_name, operator, value))
 
         if page_size:
-            self.request_options.pagesize = page_size
+            self._set_page_size(page_size)
         return self
 
     def order_by(self: Self, *args) -> Self:
@@ -201,7 +267,7 @@ class QuerySet(Iterable[T], Sized):
         if "page_number" in kwargs:
             self.request_options.pagenumber = kwargs["page_number"]
         if "page_size" in kwargs:
-            self.request_options.pagesize = kwargs["page_size"]
+            self._set_page_size(kwargs["page_size"])
         return self
 
     @staticmethod
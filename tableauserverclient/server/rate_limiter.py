@@ -0,0 +1,130 @@
+import email.utils
+import math
+import threading
+import time
+from typing import Callable, Optional
+
+from tableauserverclient.helpers.logging import logger
+
+# Relative cost of requests that are expensive to serve, keyed by the end of their URL template
+# (see hooks.url_template). Requests that match none of them cost 1.
+DEFAULT_WEIGHTS = {
+    "/views/{id}/pdf": 5.0,
+    "/views/{id}/image": 5.0,
+    "/views/{id}/previewImage": 2.0,
+    "/views/{id}/crosstab/excel": 5.0,
+    "/views/{id}/data": 2.0,
+}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """The seconds to wait given by a Retry-After header, either a number of seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RateLimiter:
+    """
+    A token bucket that keeps the requests made through a server under `rate` requests per second,
+    allowing bursts of up to `burst` requests. Set it on a server with `server.rate_limiter = ...`;
+    it is then shared by every endpoint and thread using that server.
+
+    Each request takes tokens according to its weight: `weights` maps the end of a URL template
+    to a cost, on top of DEFAULT_WEIGHTS, so e.g. {"/views/{id}/pdf": 10} makes PDF exports count
+    as ten requests.
+
+    When the server answers 429, every request waits for its Retry-After (or one second), the rate
+    is halved, and the throttled request is sent again up to `max_retries` times. The rate then
+    climbs back to `rate` by a twentieth of it for each successful request.
+
+    Example:
+    >>> server.rate_limiter = TSC.RateLimiter(10, burst=20)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        weights: Optional[dict[str, float]] = None,
+        max_retries: int = 3,
+        min_rate: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, math.ceil(rate))
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.max_retries = max_retries
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._current_rate = rate
+        self._tokens = self.burst
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def __repr__(self):
+        return f"<RateLimiter rate={self.rate} burst={self.burst} current_rate={self.current_rate}>"
+
+    @property
+    def current_rate(self) -> float:
+        """The rate allowed now, lower than `rate` while recovering from throttling."""
+        return self._current_rate
+
+    def cost(self, template: str) -> float:
+        for suffix, weight in self.weights.items():
+            if template.endswith(suffix):
+                return weight
+        return 1.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._current_rate)
+        self._updated = now
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """Wait until `cost` tokens are available and take them. Returns the seconds waited."""
+        # A request can never need more than a full bucket
+        cost = min(cost, self.burst)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill(now)
+                    # Allow for rounding, which can leave the tokens just short of the cost after waiting for them
+                    if self._tokens >= cost - 1e-9:
+                        self._tokens -= cost
+                        return waited
+                    wait = (cost - self._tokens) / self._current_rate
+            self._sleep(wait)
+            waited += wait
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """The server refused a request for exceeding its limits: pause and slow down."""
+        with self._lock:
+            now = self._clock()
+            self._paused_until = max(self._paused_until, now + (retry_after if retry_after is not None else 1.0))
+            self._current_rate = max(self.min_rate, self._current_rate / 2)
+            # Refilling starts when the pause ends, so that the waiting requests do not all go at once then
+            self._tokens = 0.0
+            self._updated = self._paused_until
+        logger.info(f"Throttled by the server, pausing requests and slowing down to {self._current_rate:.2f}/s")
+
+    def succeeded(self) -> None:
+        if self._current_rate < self.rate:
+            with self._lock:
+                self._current_rate = min(self.rate, self._current_rate + self.rate / 20)
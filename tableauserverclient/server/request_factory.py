@@ -869,7 +869,9 @@ class TableRequest:
         return ET.tostring(xml_request)
 
 
-content_types = Iterable[Union["ColumnItem", "DatabaseItem", "DatasourceItem", "FlowItem", "TableItem", "WorkbookItem"]]
+content_types = Iterable[
+    Union["ColumnItem", "DatabaseItem", "DatasourceItem", "FlowItem", "TableItem", "ViewItem", "WorkbookItem"]
+]
 
 
 class TagRequest:
@@ -894,6 +896,7 @@ class TagRequest:
             if item.id is None:
                 raise ValueError(f"Item {item} must have an ID to be tagged.")
             content_element.attrib["id"] = item.id
+            content_element.attrib["contentType"] = type(item).__name__.removesuffix("Item").lower()
 
         return ET.tostring(element)
 
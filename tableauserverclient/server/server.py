@@ -1,10 +1,11 @@
 from tableauserverclient.helpers.logging import logger
 
+from typing import Optional
+
 import requests
 import urllib3
 
 from defusedxml.ElementTree import fromstring, ParseError
-from packaging.version import Version
 from tableauserverclient.server.endpoint import (
     Sites,
     Views,
@@ -26,6 +27,7 @@ from tableauserverclient.server.endpoint import (
     FlowTasks,
     Webhooks,
     DataAccelerationReport,
+    Export,
     Favorites,
     DataAlerts,
     Fileuploads,
@@ -43,7 +45,9 @@ from tableauserverclient.server.exceptions import (
     EndpointUnavailableError,
 )
 from tableauserverclient.server.endpoint.exceptions import NotSignedInError
+from tableauserverclient.server.capabilities import Capabilities
 from tableauserverclient.namespace import Namespace
+from tableauserverclient.server.hooks import Hooks
 
 
 _PRODUCT_TO_REST_VERSION = {
@@ -85,6 +89,7 @@ class Server:
         self.workbooks = Workbooks(self)
         self.datasources = Datasources(self)
         self.favorites = Favorites(self)
+        self.export = Export(self)
         self.flows = Flows(self)
         self.flow_tasks = FlowTasks(self)
         self.projects = Projects(self)
@@ -110,6 +115,9 @@ class Server:
 
         self._session = self._session_factory()
         self._http_options = dict()  # must set this before making a server call
+        self.hooks = Hooks()
+        self.tracer = None
+        self.rate_limiter = None
         if http_options:
             self.add_http_options(http_options)
 
@@ -194,10 +202,18 @@ class Server:
         self.use_server_version()
         logger.info("use use_server_version instead", DeprecationWarning)
 
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    @version.setter
+    def version(self, value: Optional[str]) -> None:
+        # The capabilities are worked out here, so that version checks made on each call are lookups
+        self._version = value
+        self.capabilities = Capabilities(value)
+
     def check_at_least_version(self, target: str):
-        server_version = Version(self.version or "2.4")
-        target_version = Version(target)
-        return server_version >= target_version
+        return self.capabilities.at_least(target)
 
     def assert_at_least_version(self, comparison: str, reason: str):
         if not self.check_at_least_version(comparison):
@@ -0,0 +1,87 @@
+import hashlib
+import os
+import urllib.parse
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldError
+from tableauserverclient.server.request_options import (
+    CSVRequestOptions,
+    ExcelRequestOptions,
+    ImageRequestOptions,
+    PDFRequestOptions,
+)
+
+if TYPE_CHECKING:
+    from tableauserverclient.models import ViewItem
+
+ExportOptions = Union[CSVRequestOptions, ExcelRequestOptions, ImageRequestOptions, PDFRequestOptions]
+
+# What each kind of export is requested from: (path after the view URL, file extension, API version)
+EXPORT_KINDS: dict[type, tuple[str, str, str]] = {
+    ImageRequestOptions: ("image", "png", "2.5"),
+    PDFRequestOptions: ("pdf", "pdf", "2.7"),
+    CSVRequestOptions: ("data", "csv", "2.7"),
+    ExcelRequestOptions: ("crosstab/excel", "xlsx", "3.8"),
+}
+
+
+class ViewExport:
+    """
+    One export of a view with a set of options by `Views.export_many`, and how it went: where
+    it was written, how many bytes it took and how long, or the error it failed with.
+    """
+
+    def __init__(self, view: "ViewItem", options: ExportOptions) -> None:
+        if type(options) not in EXPORT_KINDS:
+            raise ValueError(f"Views cannot be exported with {options!r}")
+        if not view.id:
+            raise MissingRequiredFieldError("View item missing ID.")
+        self.view = view
+        self.options = options
+        # Sorted, so that the order the filters were added in does not matter
+        self.params = sorted((str(k), str(v)) for k, v in options.get_query_params().items())
+        self.path_suffix, self.extension, self.version = EXPORT_KINDS[type(options)]
+        self.requested = 1
+        self.path: Optional[str] = None
+        self.bytes_written = 0
+        self.elapsed: Optional[float] = None
+        self.error: Optional[Exception] = None
+
+    def __repr__(self):
+        state = f"error={self.error!r}" if self.error else f"bytes={self.bytes_written} elapsed={self.elapsed}"
+        return f"<ViewExport view={self.view.id} {self.path_suffix} {state}>"
+
+    @property
+    def key(self) -> tuple[Any, ...]:
+        return self.view.id, type(self.options), tuple(self.params)
+
+    @property
+    def ok(self) -> bool:
+        return self.elapsed is not None and self.error is None
+
+    @property
+    def filename(self) -> str:
+        if not self.params:
+            return f"{self.view.id}.{self.extension}"
+        digest = hashlib.sha1(urllib.parse.urlencode(self.params).encode("utf-8")).hexdigest()[:12]
+        return f"{self.view.id}-{digest}.{self.extension}"
+
+
+# Receives each export and the chunks of its content, which it must consume
+ExportSink = Callable[[ViewExport, Iterator[bytes]], None]
+
+
+def write_export(export: ViewExport, chunks: Iterator[bytes], directory: Union[str, os.PathLike]) -> None:
+    # Written under a temporary name first, so that a failed export leaves no partial file behind
+    path = os.path.join(directory, export.filename)
+    partial_path = f"{path}.part"
+    try:
+        with open(partial_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(partial_path, path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    export.path = path
@@ -0,0 +1,192 @@
+import json
+import threading
+import uuid
+from collections.abc import Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Optional, Union
+from urllib.parse import urlsplit
+
+from tableauserverclient.exponential_backoff import ExponentialBackoffTimer
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.models import JobItem, WebhookItem
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+# The webhook events sent when an extract refresh finishes
+REFRESH_EVENTS = (
+    "datasource-refresh-succeeded",
+    "datasource-refresh-failed",
+    "workbook-refresh-succeeded",
+    "workbook-refresh-failed",
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    receiver: "WebhookReceiver"
+
+    def log_message(self, format, *args) -> None:
+        logger.debug(f"Webhook receiver: {format % args}")
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if urlsplit(self.path).path != self.receiver.path:
+            return self._reply(404)
+        try:
+            event = json.loads(body)
+            resource_id = event["resource_luid"]
+        except (ValueError, KeyError, TypeError):
+            return self._reply(400)
+        # Answered first, as the site does not wait long for webhooks to be answered
+        self._reply(200)
+        self.receiver.notify(resource_id, event.get("event_type"))
+
+    def _reply(self, status: int) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class WebhookReceiver:
+    """
+    Waits for jobs to finish by receiving the webhook events the site sends when extract
+    refreshes finish, instead of only polling the job.
+
+    `start` serves an HTTP receiver on `host` and `port` and registers a webhook for each of
+    `events` that posts to it, reusing any webhooks on the site that already do. `wait_for_job`
+    checks the job again as soon as an event arrives for the data source or workbook it
+    refreshes, and otherwise polls it with the same backoff as `Jobs.wait_for_job`, so jobs
+    without events, or events that do not arrive, still end the wait.
+
+    The site must be able to reach the receiver: give the address it is reached at, such as
+    the https address of a proxy in front of it, as `public_url`. Only events posted to the
+    path of that address are accepted. The webhooks created are deleted by `stop` unless
+    `keep_webhooks` is set, so that a receiver at a lasting address can reuse them.
+
+    Example:
+    >>> with TSC.WebhookReceiver(server, public_url="https://events.example.com/tableau") as receiver:
+    >>>     job = server.datasources.refresh(datasource)
+    >>>     receiver.wait_for_job(job)
+    """
+
+    def __init__(
+        self,
+        server: "Server",
+        public_url: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        events: Iterable[str] = REFRESH_EVENTS,
+        name: str = "tsc-job-events",
+        keep_webhooks: bool = False,
+    ) -> None:
+        self.server = server
+        self.public_url = public_url
+        self.host = host
+        self.port = port
+        self.events = list(events)
+        self.name = name
+        self.keep_webhooks = keep_webhooks
+        self.webhooks: list[WebhookItem] = []
+        # The number of events received
+        self.received = 0
+        self._created: list[str] = []
+        # Without a public address, a random path keeps other local requests from passing as events
+        self._token = uuid.uuid4().hex
+        self._waiters: dict[str, list[threading.Event]] = {}
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+
+    def __repr__(self):
+        return f"<WebhookReceiver url={self.url if self._httpd else None} webhooks={len(self.webhooks)}>"
+
+    def __enter__(self) -> "WebhookReceiver":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        if self.public_url is not None:
+            return self.public_url
+        if self._httpd is None:
+            raise RuntimeError("The webhook receiver has not been started.")
+        return f"http://{self.host}:{self._httpd.server_port}/{self._token}"
+
+    @property
+    def path(self) -> str:
+        return urlsplit(self.url).path or "/"
+
+    def start(self) -> "WebhookReceiver":
+        handler = type("Handler", (_Handler,), {"receiver": self})
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self._httpd.daemon_threads = True
+        threading.Thread(target=self._httpd.serve_forever, args=(0.1,), daemon=True).start()
+        try:
+            self._register()
+        except Exception:
+            self.stop()
+            raise
+        logger.info(f"Receiving webhook events at {self.url}")
+        return self
+
+    def _register(self) -> None:
+        existing = {webhook.event: webhook for webhook in self.server.webhooks.get()[0] if webhook.url == self.url}
+        self.webhooks = []
+        for event in self.events:
+            if (webhook := existing.get(event)) is None:
+                webhook = WebhookItem()
+                webhook.name = f"{self.name}-{event}"
+                webhook.url = self.url
+                webhook.event = event
+                webhook = self.server.webhooks.create(webhook)
+                self._created.append(webhook.id or "")
+            self.webhooks.append(webhook)
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+        if not self.keep_webhooks:
+            for webhook_id in self._created:
+                try:
+                    self.server.webhooks.delete(webhook_id)
+                except Exception as e:
+                    logger.warning(f"Failed to delete webhook (ID: {webhook_id}): {e}")
+        self._created = []
+        self._httpd = None
+
+    def notify(self, resource_id: str, event_type: Optional[str] = None) -> None:
+        """Wake the jobs waiting on `resource_id`, as when an event about it is received."""
+        logger.debug(f"Webhook event {event_type} for {resource_id}")
+        with self._lock:
+            self.received += 1
+            for wake in self._waiters.get(resource_id, []):
+                wake.set()
+
+    def wait_for_job(self, job: Union[str, JobItem], *, timeout: Optional[float] = None) -> JobItem:
+        """
+        Wait for a job to finish, like `Jobs.wait_for_job`, checking it again whenever an event
+        arrives for the data source or workbook it refreshes.
+        """
+        job_item: JobItem = self.server.jobs.get_by_id(job) if isinstance(job, str) else job
+        job_id = job_item.id
+        assert isinstance(job_id, str)
+        resource_id = job_item.datasource_id or job_item.workbook_id or ""
+        wake = threading.Event()
+        with self._lock:
+            self._waiters.setdefault(resource_id, []).append(wake)
+        try:
+            backoff_timer = ExponentialBackoffTimer(timeout=timeout)
+            job_item = self.server.jobs.get_by_id(job_id)
+            while job_item.completed_at is None:
+                woken = backoff_timer.sleep(wake)
+                job_item = self.server.jobs.get_by_id(job_id)
+                logger.debug(f"\tJob {job_id} progress={job_item.progress} (woken by an event: {woken})")
+        finally:
+            with self._lock:
+                self._waiters[resource_id].remove(wake)
+                if not self._waiters[resource_id]:
+                    del self._waiters[resource_id]
+        return self.server.jobs._finished(job_item)
@@ -0,0 +1,594 @@
+"""
+A local stand-in for the Tableau REST API, for exercising the client at scale.
+
+The simulator is an HTTP server on localhost that answers the requests TSC makes for signing
+in, server info, paginated lists of content, single items, file uploads, publishing,
+downloads, refreshes, jobs and webhooks. Site content is synthetic: each item is generated from its
+position in the list when a page is requested, so a site can report millions of workbooks
+without holding any of them in memory.
+
+Latency, throttling (429) and server errors (5xx) can be injected with `Faults`. Finishing a
+refresh job with `finish_job` posts the webhook events registered for it.
+
+Example:
+>>> site = SimulatedSite(workbooks=1_000_000, views=5_000_000)
+>>> with RestSimulator([site], faults=Faults(latency=0.05, throttle_rate=0.01)) as simulator:
+>>>     server = TSC.Server(simulator.url, use_server_version=True)
+>>>     with server.auth.sign_in(TSC.TableauAuth("user", "password")):
+>>>         for workbook in TSC.Pager(server.workbooks):
+>>>             ...
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import urllib.request
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import quoteattr
+
+from defusedxml.ElementTree import fromstring
+
+API_VERSION = "3.24"
+TIMESTAMP = "2024-01-01T00:00:00Z"
+DOWNLOAD_CHUNK = 64 * 1024
+
+# Every kind of content is given its own range of ids, so an id tells which item it names
+CONTENT_KINDS = ("workbooks", "views", "datasources", "flows", "projects", "users", "groups", "jobs")
+_KIND_SHIFT = 64
+_INDEX_MASK = (1 << _KIND_SHIFT) - 1
+
+
+def item_id(kind: str, index: int) -> str:
+    return str(uuid.UUID(int=((CONTENT_KINDS.index(kind) + 1) << _KIND_SHIFT) | index))
+
+
+def item_index(kind: str, id_: str) -> Optional[int]:
+    try:
+        value = uuid.UUID(id_).int
+    except ValueError:
+        return None
+    if value >> _KIND_SHIFT != CONTENT_KINDS.index(kind) + 1:
+        return None
+    return value & _INDEX_MASK
+
+
+class SimulatedSite:
+    """
+    The content of a simulated site, given as the number of items of each kind. Views are spread
+    evenly across the workbooks and all content is spread across the projects.
+    """
+
+    def __init__(
+        self,
+        content_url: str = "",
+        workbooks: int = 100,
+        views: int = 500,
+        datasources: int = 50,
+        flows: int = 10,
+        projects: int = 10,
+        users: int = 100,
+        groups: int = 10,
+        download_size: int = 1024 * 1024,
+    ) -> None:
+        self.content_url = content_url
+        self.id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"site/{content_url}"))
+        self.counts = {
+            "workbooks": workbooks,
+            "views": views,
+            "datasources": datasources,
+            "flows": flows,
+            "projects": max(projects, 1),
+            "users": users,
+            "groups": groups,
+        }
+        self.download_size = download_size
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<SimulatedSite {self.content_url!r} {self.counts}>"
+
+    def add(self, kind: str) -> int:
+        """Add an item of `kind`, e.g. when one is published, and return its index."""
+        with self._lock:
+            index = self.counts[kind]
+            self.counts[kind] += 1
+        return index
+
+    def _project(self, index: int) -> str:
+        project = index % self.counts["projects"]
+        return f'<project id="{item_id("projects", project)}" name="Project {project}" />'
+
+    def _owner(self, index: int) -> str:
+        return f'<owner id="{item_id("users", index % max(self.counts["users"], 1))}" />'
+
+    def render(self, kind: str, index: int) -> str:
+        id_ = item_id(kind, index)
+        if kind == "workbooks":
+            return (
+                f'<workbook id="{id_}" name="Workbook {index}" contentUrl="Workbook{index}" '
+                f'webpageUrl="https://tableau.example.com/#/workbooks/{index}" showTabs="true" size="1" '
+                f'createdAt="{TIMESTAMP}" updatedAt="{TIMESTAMP}">'
+                f"{self._project(index)}{self._owner(index)}<tags /></workbook>"
+            )
+        if kind == "views":
+            workbook = index % max(self.counts["workbooks"], 1)
+            return (
+                f'<view id="{id_}" name="View {index}" contentUrl="Workbook{workbook}/sheets/View{index}" '
+                f'sheetType="worksheet" createdAt="{TIMESTAMP}" updatedAt="{TIMESTAMP}">'
+                f'<workbook id="{item_id("workbooks", workbook)}" />{self._owner(workbook)}{self._project(workbook)}'
+                f'<tags /><usage totalViewCount="{index}" /></view>'
+            )
+        if kind == "datasources":
+            return (
+                f'<datasource id="{id_}" name="Datasource {index}" contentUrl="Datasource{index}" type="hyper" '
+                f'isCertified="false" hasExtracts="true" size="1" createdAt="{TIMESTAMP}" updatedAt="{TIMESTAMP}">'
+                f"{self._project(index)}{self._owner(index)}<tags /></datasource>"
+            )
+        if kind == "flows":
+            return (
+                f'<flow id="{id_}" name="Flow {index}" createdAt="{TIMESTAMP}" updatedAt="{TIMESTAMP}">'
+                f"{self._project(index)}{self._owner(index)}<tags /></flow>"
+            )
+        if kind == "projects":
+            return (
+                f'<project id="{id_}" name="Project {index}" description="" '
+                f'contentPermissions="ManagedByOwner">{self._owner(index)}</project>'
+            )
+        if kind == "users":
+            return (
+                f'<user id="{id_}" name="user{index}" siteRole="Viewer" fullName="User {index}" '
+                f'email="user{index}@example.com" authSetting="ServerDefault" lastLogin="{TIMESTAMP}">'
+                '<domain name="local" /></user>'
+            )
+        if kind == "groups":
+            return f'<group id="{id_}" name="Group {index}"><domain name="local" /></group>'
+        raise ValueError(f"Unknown content {kind}")
+
+
+class Faults:
+    """
+    Faults injected into the simulator's responses. `latency` seconds (plus up to `jitter`
+    seconds more) are added to every request. A `throttle_rate` fraction of the requests are
+    answered with 429 and a Retry-After header, and an `error_rate` fraction with `error_status`.
+    Sign in and server info requests are never failed. Pass `seed` for a repeatable sequence.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self) -> tuple[float, Optional[int]]:
+        """The delay to add to a request, and the status to fail it with if any."""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            return delay, 429
+        if roll < self.throttle_rate + self.error_rate:
+            return delay, self.error_status
+        return delay, None
+
+
+class Job:
+    def __init__(self, id_: str, job_type: str, polls: int, resource: Optional[tuple[str, str]] = None) -> None:
+        self.id = id_
+        self.type = job_type
+        self.polls_left = polls
+        # The kind and id of the content refreshed
+        self.resource = resource
+        self.finish_code = 0
+
+    def poll(self) -> str:
+        rendered = self.render()
+        self.polls_left = max(self.polls_left - 1, 0)
+        return rendered
+
+    def render(self) -> str:
+        details = ""
+        if self.resource is not None:
+            kind, id_ = self.resource
+            details = f'<extractRefreshJob><{_SINGULAR[kind]} id="{id_}" /></extractRefreshJob>'
+        if self.polls_left > 0:
+            return f'<job id="{self.id}" type="{self.type}" progress="50" createdAt="{TIMESTAMP}">{details}</job>'
+        return (
+            f'<job id="{self.id}" type="{self.type}" progress="100" createdAt="{TIMESTAMP}" '
+            f'completedAt="{TIMESTAMP}" finishCode="{self.finish_code}">{details}</job>'
+        )
+
+
+_SINGULAR = {
+    "workbooks": "workbook",
+    "views": "view",
+    "datasources": "datasource",
+    "flows": "flow",
+    "projects": "project",
+    "users": "user",
+    "groups": "group",
+}
+_LIST = re.compile(r"^(?P<kind>workbooks|views|datasources|flows|projects|users|groups)$")
+_ITEM = re.compile(r"^(?P<kind>workbooks|views|datasources|flows|projects|users|groups)/(?P<id>[^/]+)$")
+_CONTENT = re.compile(r"^(?P<kind>workbooks|datasources|flows)/(?P<id>[^/]+)(/revisions/[^/]+)?/content$")
+_REFRESH = re.compile(r"^(?P<kind>workbooks|datasources)/(?P<id>[^/]+)/refresh$")
+_PUBLISH = re.compile(r"^(?P<kind>workbooks|datasources|flows)$")
+_UPLOAD = re.compile(r"^fileUploads/(?P<id>[^/]+)$")
+_JOB = re.compile(r"^jobs/(?P<id>[^/]+)$")
+_WEBHOOK = re.compile(r"^webhooks/(?P<id>[^/]+)$")
+_EXTENSIONS = {"workbooks": "twbx", "datasources": "tdsx", "flows": "tflx"}
+
+
+class RestSimulator:
+    """
+    Serves one or more simulated sites on localhost. Use as a context manager, or call `start`
+    and `stop`. Requests are answered on a thread each, so concurrent clients see concurrent
+    responses. `stats` counts the requests served by route, alongside the bytes uploaded and
+    downloaded. Jobs are reported in progress for the first `job_polls` polls, or until
+    `finish_job` is called.
+    """
+
+    def __init__(
+        self,
+        sites: Optional[list[SimulatedSite]] = None,
+        faults: Optional[Faults] = None,
+        api_version: str = API_VERSION,
+        job_polls: int = 2,
+        port: int = 0,
+    ) -> None:
+        self.sites = {site.content_url: site for site in (sites or [SimulatedSite()])}
+        self.faults = faults or Faults()
+        self.api_version = api_version
+        self.job_polls = job_polls
+        self.stats: Counter = Counter()
+        self._port = port
+        self._tokens: dict[str, SimulatedSite] = {}
+        self._uploads: dict[str, int] = {}
+        self._jobs: dict[str, Job] = {}
+        # webhook id -> name, event and url
+        self.webhooks: dict[str, tuple[str, str, str]] = {}
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "RestSimulator":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError("The simulator has not been started.")
+        return f"http://127.0.0.1:{self._httpd.server_port}"
+
+    def start(self) -> None:
+        simulator = self
+
+        class Handler(_Handler):
+            pass
+
+        Handler.simulator = simulator
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", self._port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+
+    def sign_in(self, content_url: str) -> tuple[str, SimulatedSite]:
+        site = self.sites.get(content_url)
+        if site is None:
+            raise KeyError(content_url)
+        token = uuid.uuid4().hex
+        with self._lock:
+            self._tokens[token] = site
+        return token, site
+
+    def site_for(self, token: Optional[str]) -> Optional[SimulatedSite]:
+        with self._lock:
+            return self._tokens.get(token or "")
+
+    def new_job(self, job_type: str, resource: Optional[tuple[str, str]] = None) -> Job:
+        with self._lock:
+            job = Job(item_id("jobs", len(self._jobs)), job_type, self.job_polls, resource)
+            self._jobs[job.id] = job
+        return job
+
+    def job(self, id_: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(id_)
+
+    def finish_job(self, id_: str, succeeded: bool = True) -> None:
+        """Finish a job now, posting the webhook events for it when it refreshed content."""
+        job = self.job(id_)
+        if job is None:
+            raise KeyError(id_)
+        job.polls_left = 0
+        job.finish_code = 0 if succeeded else 1
+        if job.resource is None:
+            return
+        kind, resource_id = job.resource
+        singular = _SINGULAR[kind]
+        outcome = "succeeded" if succeeded else "failed"
+        event_type = f"{singular.capitalize()}Refresh{outcome.capitalize()}"
+        payload = json.dumps(
+            {
+                "resource": singular.upper(),
+                "event_type": event_type,
+                "resource_name": resource_id,
+                "resource_luid": resource_id,
+                "created_at": TIMESTAMP,
+            }
+        ).encode("utf-8")
+        with self._lock:
+            urls = [url for _, event, url in self.webhooks.values() if event == f"{singular}-refresh-{outcome}"]
+        for url in urls:
+            self.count("webhook_event")
+            request = urllib.request.Request(url, payload, {"Content-Type": "application/json"}, method="POST")
+            with urllib.request.urlopen(request, timeout=5):
+                pass
+
+    def new_upload(self) -> str:
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = 0
+        return upload_id
+
+    def append_upload(self, upload_id: str, size: int) -> Optional[int]:
+        with self._lock:
+            if upload_id not in self._uploads:
+                return None
+            self._uploads[upload_id] += size
+            return self._uploads[upload_id]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    simulator: RestSimulator
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_PUT(self) -> None:
+        self._handle("PUT")
+
+    def do_DELETE(self) -> None:
+        self._handle("DELETE")
+
+    def _handle(self, method: str) -> None:
+        split = urlsplit(self.path)
+        query = {key.lower(): values[-1] for key, values in parse_qs(split.query).items()}
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        match = re.match(r"^/api/[^/]+/(?P<rest>.*)$", split.path)
+        if match is None:
+            return self._error(404, "404000", "Not found")
+        rest = match.group("rest")
+
+        if rest.lower() == "serverinfo":
+            self.simulator.count("serverinfo")
+            return self._xml(
+                200,
+                '<serverInfo><productVersion build="20241.0">2024.1.0</productVersion>'
+                f"<restApiVersion>{self.simulator.api_version}</restApiVersion></serverInfo>",
+            )
+        if rest == "auth/signin" and method == "POST":
+            return self._sign_in(body)
+        if rest == "auth/signout" and method == "POST":
+            self.simulator.count("signout")
+            return self._empty(204)
+
+        site_match = re.match(r"^sites/(?P<site>[^/]+)/(?P<path>.+)$", rest)
+        if site_match is None:
+            return self._error(404, "404000", "Not found")
+        site = self.simulator.site_for(self.headers.get("X-Tableau-Auth"))
+        if site is None or site.id != site_match.group("site"):
+            return self._error(401, "401002", "Unauthorized Access")
+
+        delay, status = self.simulator.faults.draw()
+        if delay:
+            time.sleep(delay)
+        if status == 429:
+            self.simulator.count("throttled")
+            return self._error(
+                429, "429000", "Too many requests", {"Retry-After": str(self.simulator.faults.retry_after)}
+            )
+        if status is not None:
+            self.simulator.count("failed")
+            return self._text(status, "Simulated server error")
+
+        self._route(method, site, site_match.group("path"), query, body)
+
+    def _route(self, method: str, site: SimulatedSite, path: str, query: dict[str, str], body: bytes) -> None:
+        if method == "GET":
+            match = _LIST.match(path)
+            if match:
+                return self._list(site, match.group("kind"), query)
+            match = _CONTENT.match(path)
+            if match:
+                return self._download(site, match.group("kind"), match.group("id"))
+            match = _ITEM.match(path)
+            if match:
+                return self._item(site, match.group("kind"), match.group("id"))
+            if path == "webhooks":
+                self.simulator.count("webhooks")
+                return self._xml(200, f"<webhooks>{''.join(map(self._webhook, self.simulator.webhooks))}</webhooks>")
+            match = _JOB.match(path)
+            if match:
+                job = self.simulator.job(match.group("id"))
+                if job is None:
+                    return self._error(404, "404000", "Job not found")
+                self.simulator.count("job")
+                return self._xml(200, job.poll())
+        elif method == "POST":
+            if path == "fileUploads":
+                self.simulator.count("upload_initiate")
+                upload_id = self.simulator.new_upload()
+                return self._xml(201, f'<fileUpload uploadSessionId="{upload_id}" fileSize="0" />')
+            match = _PUBLISH.match(path)
+            if match:
+                return self._publish(site, match.group("kind"), query, body)
+            match = _REFRESH.match(path)
+            if match:
+                self.simulator.count("refresh")
+                job = self.simulator.new_job("RefreshExtract", (match.group("kind"), match.group("id")))
+                return self._xml(202, job.render())
+            if path == "webhooks":
+                return self._create_webhook(body)
+        elif method == "PUT":
+            match = _UPLOAD.match(path)
+            if match:
+                size = self.simulator.append_upload(match.group("id"), len(body))
+                if size is None:
+                    return self._error(404, "404000", "Upload session not found")
+                self.simulator.count("upload_append")
+                self.simulator.count("bytes_uploaded", len(body))
+                return self._xml(200, f'<fileUpload uploadSessionId="{match.group("id")}" fileSize="{size}" />')
+        elif method == "DELETE":
+            match = _WEBHOOK.match(path)
+            if match and self.simulator.webhooks.pop(match.group("id"), None):
+                self.simulator.count("webhook_delete")
+                return self._empty(204)
+        return self._error(404, "404000", f"Not found: {method} {path}")
+
+    def _webhook(self, id_: str) -> str:
+        name, event, url = self.simulator.webhooks[id_]
+        return (
+            f"<webhook id={quoteattr(id_)} name={quoteattr(name)}><webhook-source><webhook-source-event-{event} />"
+            f'</webhook-source><webhook-destination><webhook-destination-http method="POST" url={quoteattr(url)} />'
+            f'</webhook-destination><owner id="{item_id("users", 0)}" /></webhook>'
+        )
+
+    def _create_webhook(self, body: bytes) -> None:
+        self.simulator.count("webhook_create")
+        webhook = fromstring(body).find(".//webhook")
+        source = webhook.find("webhook-source")[0]
+        url = webhook.find(".//webhook-destination-http").get("url")
+        id_ = uuid.uuid4().hex
+        self.simulator.webhooks[id_] = (webhook.get("name"), source.tag.replace("webhook-source-event-", ""), url)
+        self._xml(201, self._webhook(id_))
+
+    def _sign_in(self, body: bytes) -> None:
+        self.simulator.count("signin")
+        site_elem = fromstring(body).find(".//site")
+        content_url = site_elem.get("contentUrl", "") if site_elem is not None else ""
+        try:
+            token, site = self.simulator.sign_in(content_url)
+        except KeyError:
+            return self._error(401, "401001", "Signin Error")
+        self._xml(
+            200,
+            f'<credentials token="{token}"><site id="{site.id}" contentUrl={quoteattr(site.content_url)} />'
+            f'<user id="{item_id("users", 0)}" /></credentials>',
+        )
+
+    def _list(self, site: SimulatedSite, kind: str, query: dict[str, str]) -> None:
+        self.simulator.count(kind)
+        page_number = max(int(query.get("pagenumber", 1)), 1)
+        page_size = min(max(int(query.get("pagesize", 100)), 1), 1000)
+        total = site.counts[kind]
+        start = (page_number - 1) * page_size
+        items = "".join(site.render(kind, i) for i in range(start, min(start + page_size, total)))
+        self._xml(
+            200,
+            f'<pagination pageNumber="{page_number}" pageSize="{page_size}" totalAvailable="{total}" />'
+            f"<{kind}>{items}</{kind}>",
+        )
+
+    def _item(self, site: SimulatedSite, kind: str, id_: str) -> None:
+        self.simulator.count(_SINGULAR[kind])
+        index = item_index(kind, id_)
+        if index is None or index >= site.counts[kind]:
+            return self._error(404, "404000", f"Resource not found: {id_}")
+        self._xml(200, site.render(kind, index))
+
+    def _publish(self, site: SimulatedSite, kind: str, query: dict[str, str], body: bytes) -> None:
+        self.simulator.count(f"publish_{kind}")
+        self.simulator.count("bytes_uploaded", len(body))
+        upload_id = query.get("uploadsessionid")
+        if upload_id is not None and self.simulator.append_upload(upload_id, 0) is None:
+            return self._error(404, "404000", "Upload session not found")
+        if query.get("asjob") == "true":
+            return self._xml(202, self.simulator.new_job("PublishWorkbook").render())
+        self._xml(201, site.render(kind, site.add(kind)))
+
+    def _download(self, site: SimulatedSite, kind: str, id_: str) -> None:
+        self.simulator.count(f"download_{kind}")
+        index = item_index(kind, id_)
+        if index is None or index >= site.counts[kind]:
+            return self._error(404, "404000", f"Resource not found: {id_}")
+        size = site.download_size
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(size))
+        self.send_header("Content-Disposition", f'name="tableau_file"; filename="{kind}-{index}.{_EXTENSIONS[kind]}"')
+        self.end_headers()
+        chunk = b"\0" * DOWNLOAD_CHUNK
+        remaining = size
+        while remaining > 0:
+            written = min(remaining, DOWNLOAD_CHUNK)
+            self.wfile.write(chunk[:written])
+            remaining -= written
+        self.simulator.count("bytes_downloaded", size)
+
+    def _xml(self, status: int, content: str, headers: Optional[dict[str, str]] = None) -> None:
+        body = (
+            f'<?xml version="1.0" encoding="UTF-8"?><tsResponse xmlns="http://tableau.com/api">{content}</tsResponse>'
+        )
+        self._send(status, body.encode("utf-8"), "application/xml", headers)
+
+    def _error(self, status: int, code: str, summary: str, headers: Optional[dict[str, str]] = None) -> None:
+        self._xml(
+            status,
+            f'<error code="{code}"><summary>{summary}</summary><detail>{summary}</detail></error>',
+            headers,
+        )
+
+    def _text(self, status: int, text: str) -> None:
+        self._send(status, text.encode("utf-8"), "text/plain")
+
+    def _empty(self, status: int) -> None:
+        self._send(status, b"", "text/plain")
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
@@ -0,0 +1,156 @@
+import os
+import re
+import tempfile
+import unittest
+from typing import Any
+from unittest import mock
+
+import requests_mock
+
+import tableauserverclient as TSC
+
+NS = 'xmlns="http://tableau.com/api"'
+SITE_ID = "dad65087-b08b-4603-af4e-2887b8aafc67"
+
+
+def response(body: str, total: int = 1) -> str:
+    pagination = f'<pagination pageNumber="1" pageSize="100" totalAvailable="{total}" />'
+    return f"<tsResponse {NS}>{pagination}{body}</tsResponse>"
+
+
+class BackupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake sign in
+        self.server._site_id = SITE_ID
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.root = os.path.join(self.directory.name, "backup")
+
+        # workbook id -> updated at, and revision number -> (content, deleted)
+        self.workbooks: dict[str, Any] = {
+            "w-1": ["2024-01-01T00:00:00Z", {"1": (b"first", False), "2": (b"second", False), "3": (b"", True)}],
+            "w-2": ["2024-01-01T00:00:00Z", {"1": (b"first", False)}],
+        }
+        self.broken: set[str] = set()
+        self.names: dict[str, str] = {}
+
+        self.mock = requests_mock.Mocker()
+        self.mock.start()
+        self.addCleanup(self.mock.stop)
+        baseurl = self.server.workbooks.baseurl
+        self.mock.get(baseurl, text=self.list_workbooks)
+        self.mock.get(re.compile(f"{baseurl}/[^/]+/revisions$"), text=self.list_revisions)
+        self.mock.get(re.compile(f"{baseurl}/[^/]+/revisions/[^/]+/content"), content=self.download)
+
+    def list_workbooks(self, request, context) -> str:
+        workbooks = "".join(
+            f'<workbook id="{id_}" name="{self.names.get(id_, id_)}" updatedAt="{updated_at}"><project id="p-1" name="Default" /></workbook>'
+            for id_, (updated_at, _) in self.workbooks.items()
+        )
+        return response(f"<workbooks>{workbooks}</workbooks>", len(self.workbooks))
+
+    def list_revisions(self, request, context) -> str:
+        revisions = self.workbooks[request.url.split("/")[-2]][1]
+        body = "".join(
+            f'<revision revisionNumber="{number}" publishedAt="2024-01-01T00:00:00Z" deleted="{str(deleted).lower()}">'
+            '<publisher id="u-1" name="Cassie" /></revision>'
+            for number, (_, deleted) in revisions.items()
+        )
+        return response(f"<revisions>{body}</revisions>", len(revisions))
+
+    def download(self, request, context) -> bytes:
+        workbook_id, number = request.url.split("/")[-4], request.url.split("/")[-2]
+        if f"{workbook_id}/{number}" in self.broken:
+            context.status_code = 500
+            return b""
+        context.headers["Content-Disposition"] = f'name="tableau_workbook"; filename="{workbook_id}.twbx"'
+        return self.workbooks[workbook_id][1][number][0]
+
+    def requests(self, pattern: str) -> list[str]:
+        return [r.url for r in self.mock.request_history if re.search(pattern, r.url)]
+
+    def objects(self) -> list[str]:
+        return [name for _, _, names in os.walk(os.path.join(self.root, "objects")) for name in names]
+
+    def test_run(self) -> None:
+        backup = TSC.Backup(self.server, self.root, content=["workbooks"]).run()
+
+        self.assertEqual(
+            sorted(backup.added), [("workbooks", "w-1", "1"), ("workbooks", "w-1", "2"), ("workbooks", "w-2", "1")]
+        )
+        # The deleted revision is not downloaded, and the same bytes are stored once
+        self.assertEqual(len(self.requests("/content")), 3)
+        self.assertEqual(len(self.objects()), 2)
+        revisions = backup.index["workbooks"]["w-1"]["revisions"]
+        self.assertEqual(revisions["2"]["filename"], "w-1.twbx")
+        self.assertEqual(revisions["2"]["size"], 6)
+        self.assertEqual(revisions["1"]["sha256"], backup.index["workbooks"]["w-2"]["revisions"]["1"]["sha256"])
+
+        restored = backup.restore("workbooks", "w-1", path=os.path.join(self.directory.name, "restored"))
+        with open(restored, "rb") as f:
+            self.assertEqual(f.read(), b"second")
+        self.assertEqual(os.path.basename(restored), "w-1.twbx")
+
+    def test_incremental(self) -> None:
+        TSC.Backup(self.server, self.root, content=["workbooks"]).run()
+        self.mock.reset_mock()
+        self.workbooks["w-2"][0] = "2024-02-01T00:00:00Z"
+        self.workbooks["w-2"][1]["2"] = (b"third", False)
+
+        # The index is read back from disk, only the updated workbook is listed
+        backup = TSC.Backup(self.server, self.root, content=["workbooks"]).run()
+        self.assertEqual(backup.added, [("workbooks", "w-2", "2")])
+        self.assertEqual(len(self.requests("/revisions$")), 1)
+        self.assertEqual(self.requests("/content"), [f"{self.server.workbooks.baseurl}/w-2/revisions/2/content"])
+
+    def test_renamed_without_revision(self) -> None:
+        TSC.Backup(self.server, self.root, content=["workbooks"]).run()
+        self.mock.reset_mock()
+        self.workbooks["w-2"][0] = "2024-02-01T00:00:00Z"
+        self.names["w-2"] = "Renamed"
+
+        backup = TSC.Backup(self.server, self.root, content=["workbooks"]).run()
+        self.assertEqual(backup.added, [])
+        self.assertEqual(self.requests("/content"), [])
+        self.assertEqual(TSC.Backup(self.server, self.root).index["workbooks"]["w-2"]["name"], "Renamed")
+
+    def test_index_saved_once_per_kind(self) -> None:
+        with mock.patch.object(TSC.Backup, "_save_index", autospec=True) as save_index:
+            backup = TSC.Backup(self.server, self.root, content=["workbooks"]).run()
+        self.assertEqual(len(backup.added), 3)
+        self.assertEqual(save_index.call_count, 1)
+
+    def test_failed_revisions_are_retried(self) -> None:
+        self.broken = {"w-1/2"}
+        backup = TSC.Backup(self.server, self.root, content=["workbooks"], max_workers=1).run()
+        self.assertEqual(list(backup.failed["workbooks"]), ["w-1/2"])
+        self.assertNotIn("updated_at", backup.index["workbooks"]["w-1"])
+
+        self.broken = set()
+        backup.run()
+        self.assertEqual(backup.added, [("workbooks", "w-1", "2")])
+        self.assertEqual(backup.failed, {})
+        self.assertEqual(sorted(os.listdir(self.root)), ["files", "index.json", "objects"])
+
+    def test_chunked_store(self) -> None:
+        store = TSC.ContentStore(self.root, chunk_size=4)
+        digests = []
+        for content in (b"aaaabbbbcc", b"aaaabbbbdd", b"aaaa"):
+            path = os.path.join(self.directory.name, "file")
+            with open(path, "wb") as f:
+                f.write(content)
+            digests.append(store.add_file(path))
+            self.assertFalse(os.path.exists(path))
+
+        # aaaa, bbbb, cc and dd
+        self.assertEqual(len(self.objects()), 4)
+        self.assertEqual(digests[0][1], 10)
+        self.assertEqual(b"".join(store.read(digests[1][0])), b"aaaabbbbdd")
+        self.assertEqual(b"".join(store.read(digests[2][0])), b"aaaa")
+        with self.assertRaises(KeyError):
+            list(store.read("0" * 64))
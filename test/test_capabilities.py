@@ -0,0 +1,68 @@
+import tempfile
+import unittest
+from unittest import mock
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.capabilities import FEATURES, Capabilities
+from tableauserverclient.server.exceptions import EndpointUnavailableError
+
+
+class CapabilitiesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.20"
+
+        # Fake signin
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+    def test_features(self) -> None:
+        # Registered by the endpoint decorators
+        self.assertEqual(FEATURES["Groups.add_users"], "3.21")
+        self.assertEqual(FEATURES["Workbooks.download.include_extract"], "2.5")
+
+        capabilities = self.server.capabilities
+        self.assertFalse(capabilities.supports("Groups.add_users"))
+        self.assertTrue(capabilities.supports("Groups.add_user"))
+        self.assertIn("Workbooks.download.include_extract", capabilities)
+        self.assertNotIn("Workbooks.fly", capabilities)
+        with self.assertRaises(KeyError):
+            capabilities.supports("Workbooks.fly")
+        self.assertEqual(capabilities.features()["Groups.add_users"], False)
+
+    def test_follows_version(self) -> None:
+        self.assertFalse(self.server.check_at_least_version("3.21"))
+        self.server.version = "3.21"
+        self.assertTrue(self.server.capabilities.supports("Groups.add_users"))
+        self.assertTrue(self.server.check_at_least_version("3.21"))
+        # Versions are compared as numbers, not strings
+        self.assertTrue(self.server.check_at_least_version("3.3"))
+        self.assertFalse(self.server.check_at_least_version("3.100"))
+
+    def test_checks_are_lookups(self) -> None:
+        with mock.patch("tableauserverclient.server.capabilities.Version") as version:
+            self.assertTrue(self.server.check_at_least_version("3.7"))
+            with self.assertRaises(EndpointUnavailableError):
+                self.server.groups.add_users(TSC.GroupItem("Sales"), ["user-id"])
+            with requests_mock.mock() as m:
+                m.get(
+                    self.server.users.baseurl, text='<tsResponse xmlns="http://tableau.com/api"><users /></tsResponse>'
+                )
+                self.server.users.get(TSC.RequestOptions(pagesize=5))
+        version.assert_not_called()
+
+    def test_parameter_added_in(self) -> None:
+        self.server.version = "2.4"
+        headers = {"Content-Disposition": 'name="tableau_workbook"; filename="workbook.twbx"'}
+        with requests_mock.mock() as m, tempfile.TemporaryDirectory() as directory:
+            m.get(f"{self.server.workbooks.baseurl}/1/content", content=b"", headers=headers)
+            with self.assertWarns(UserWarning):
+                self.server.workbooks.download("1", directory, include_extract=False)
+
+    def test_unknown_version(self) -> None:
+        # Servers that do not report their version can be used until a version check is made
+        capabilities = Capabilities("Unknown")
+        with self.assertRaises(ValueError):
+            capabilities.at_least("3.7")
@@ -0,0 +1,42 @@
+import datetime
+import unittest
+
+from tableauserverclient.datetime_helpers import TABLEAU_DATE_FORMAT, format_datetime, parse_datetime, utc
+
+
+def strptime(date):
+    try:
+        return datetime.datetime.strptime(date, TABLEAU_DATE_FORMAT).replace(tzinfo=utc)
+    except ValueError:
+        return None
+
+
+class DatetimeHelpersTests(unittest.TestCase):
+    def test_parse_datetime(self) -> None:
+        parsed = parse_datetime("2016-07-06T20:19:00Z")
+        self.assertEqual(parsed, datetime.datetime(2016, 7, 6, 20, 19, 0, tzinfo=utc))
+        self.assertEqual(parsed.utcoffset(), datetime.timedelta(0))
+        self.assertEqual(format_datetime(parsed), "2016-07-06T20:19:00Z")
+
+    def test_parse_datetime_matches_strptime(self) -> None:
+        dates = [
+            "2016-07-06T20:19:00Z",
+            "2024-02-29T23:59:59Z",
+            "2016-7-6T20:19:0Z",
+            "2016-13-06T20:19:00Z",
+            "2023-02-29T00:00:00Z",
+            "2016-07-06T20:19:00",
+            "2016-07-06 20:19:00Z",
+            "2016-07-06T20:19:00.123Z",
+            "",
+            "not a date",
+        ]
+        for date in dates:
+            with self.subTest(date=date):
+                self.assertEqual(parse_datetime(date), strptime(date))
+
+    def test_parse_datetime_none(self) -> None:
+        self.assertIsNone(parse_datetime(None))
+
+    def test_parse_datetime_is_memoized(self) -> None:
+        self.assertIs(parse_datetime("2020-01-01T00:00:00Z"), parse_datetime("2020-01-01T00:00:00Z"))
@@ -0,0 +1,185 @@
+import unittest
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.effective_permissions import ALL_CAPABILITIES, VIEWER_CAPABILITIES
+
+NS = 'xmlns="http://tableau.com/api"'
+SITE_ID = "dad65087-b08b-4603-af4e-2887b8aafc67"
+
+ADMIN, CREATOR, VIEWER, EXPLORER, UNLICENSED = "u-admin", "u-creator", "u-viewer", "u-explorer", "u-unlicensed"
+ROLES = {
+    ADMIN: "SiteAdministratorCreator",
+    CREATOR: "Creator",
+    VIEWER: "Viewer",
+    EXPLORER: "Explorer",
+    UNLICENSED: "Unlicensed",
+}
+MEMBERS = {"g-1": [CREATOR, VIEWER], "g-2": [EXPLORER], "g-3": [CREATOR]}
+
+# p-1 > p-1a is managed by the owners, p-2 > p-2a locked to p-2
+PROJECTS = [
+    ("p-1", None, "ManagedByOwner"),
+    ("p-1a", "p-1", "ManagedByOwner"),
+    ("p-2", None, "LockedToProject"),
+    ("p-2a", "p-2", "ManagedByOwner"),
+]
+WORKBOOKS = {"w-1": ("p-1a", CREATOR), "w-2": ("p-1", ADMIN), "w-3": ("p-2a", ADMIN)}
+
+PERMISSIONS = {
+    "projects/p-1a": [("group", "g-2", {"ProjectLeader": "Allow"})],
+    "workbooks/w-2": [
+        ("group", "g-1", {"Read": "Allow", "ExportData": "Allow", "Write": "Allow"}),
+        ("group", "g-2", {"Read": "Allow"}),
+        ("group", "g-3", {"ExportData": "Deny"}),
+        ("user", EXPLORER, {"Read": "Deny"}),
+        ("groupSet", "gs-1", {"Filter": "Allow"}),
+    ],
+    "workbooks/w-3": [("group", "g-1", {"Read": "Allow"})],
+    "projects/p-2/default-permissions/workbooks": [("group", "g-2", {"Read": "Allow"})],
+}
+
+
+def response(body: str, total: int = 1) -> str:
+    pagination = f'<pagination pageNumber="1" pageSize="100" totalAvailable="{total}" />'
+    return f"<tsResponse {NS}>{pagination}{body}</tsResponse>"
+
+
+def permissions_response(rules) -> str:
+    grantees = "".join(
+        f'<granteeCapabilities><{tag} id="{id_}" /><capabilities>'
+        + "".join(f'<capability name="{name}" mode="{mode}" />' for name, mode in capabilities.items())
+        + "</capabilities></granteeCapabilities>"
+        for tag, id_, capabilities in rules
+    )
+    return f"<tsResponse {NS}><permissions>{grantees}</permissions></tsResponse>"
+
+
+class EffectivePermissionsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.22"
+
+        # Fake sign in
+        self.server._site_id = SITE_ID
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.site_url = f"{self.server.baseurl}/sites/{SITE_ID}"
+        self.mock = requests_mock.Mocker()
+        self.mock.start()
+        self.addCleanup(self.mock.stop)
+        self.register_site()
+
+    def register_site(self) -> None:
+        m, url = self.mock, self.site_url
+        users = "".join(f'<user id="{id_}" name="{id_}" siteRole="{role}" />' for id_, role in ROLES.items())
+        m.get(f"{url}/users", text=response(f"<users>{users}</users>", len(ROLES)))
+        groups = "".join(f'<group id="{id_}" name="{id_}" />' for id_ in MEMBERS)
+        m.get(f"{url}/groups", text=response(f"<groups>{groups}</groups>", len(MEMBERS)))
+        for group_id, members in MEMBERS.items():
+            users = "".join(f'<user id="{id_}" name="{id_}" />' for id_ in members)
+            m.get(f"{url}/groups/{group_id}/users", text=response(f"<users>{users}</users>", len(members)))
+        group_sets = '<groupSet id="gs-1" name="gs-1" groupCount="2"><group id="g-1" /><group id="g-3" /></groupSet>'
+        m.get(f"{url}/groupsets", text=response(f"<groupSets>{group_sets}</groupSets>"))
+        projects = "".join(
+            f'<project id="{id_}" name="{id_}" contentPermissions="{lock}"'
+            + (f' parentProjectId="{parent}"' if parent else "")
+            + f'><owner id="{ADMIN}" /></project>'
+            for id_, parent, lock in PROJECTS
+        )
+        m.get(f"{url}/projects", text=response(f"<projects>{projects}</projects>", len(PROJECTS)))
+        workbooks = "".join(
+            f'<workbook id="{id_}" name="{id_}"><project id="{project}" /><owner id="{owner}" /></workbook>'
+            for id_, (project, owner) in WORKBOOKS.items()
+        )
+        m.get(f"{url}/workbooks", text=response(f"<workbooks>{workbooks}</workbooks>", len(WORKBOOKS)))
+        for id_, _, _ in PROJECTS:
+            m.get(
+                f"{url}/projects/{id_}/permissions", text=permissions_response(PERMISSIONS.get(f"projects/{id_}", []))
+            )
+        for id_ in WORKBOOKS:
+            m.get(
+                f"{url}/workbooks/{id_}/permissions", text=permissions_response(PERMISSIONS.get(f"workbooks/{id_}", []))
+            )
+        default = "projects/p-2/default-permissions/workbooks"
+        m.get(f"{url}/{default}", text=permissions_response(PERMISSIONS[default]))
+
+    def load(self) -> TSC.EffectivePermissions:
+        return TSC.EffectivePermissions(self.server, content=["workbooks"], max_workers=4).load()
+
+    def test_load(self) -> None:
+        permissions = self.load()
+        self.assertIn("users=5 items=7", repr(permissions))
+        # Only the project that locks its content needs its default permissions
+        defaults = [r.url for r in self.mock.request_history if "default-permissions" in r.url]
+        self.assertEqual(defaults, [f"{self.site_url}/projects/p-2/default-permissions/workbooks"])
+
+    def test_site_roles(self) -> None:
+        permissions = self.load()
+        self.assertEqual(permissions.capabilities(ADMIN, "workbooks", "w-1"), set(ALL_CAPABILITIES))
+        self.assertEqual(permissions.capabilities(UNLICENSED, "workbooks", "w-2"), set())
+        self.assertEqual(permissions.capabilities("u-unknown", "workbooks", "w-2"), set())
+
+    def test_rules(self) -> None:
+        permissions = self.load()
+        # Group deny wins over group allow, the group set applies to members of all its groups
+        self.assertEqual(permissions.capabilities(CREATOR, "workbooks", "w-2"), {"Read", "Write", "Filter"})
+        # Viewers are capped whatever the rules say
+        self.assertEqual(permissions.capabilities(VIEWER, "workbooks", "w-2"), {"Read", "ExportData"})
+        # A rule for the user wins over their groups
+        self.assertFalse(permissions.allows(EXPLORER, "workbooks", "w-2", "Read"))
+
+    def test_owner_and_project_leader(self) -> None:
+        permissions = self.load()
+        self.assertEqual(permissions.capabilities(CREATOR, "workbooks", "w-1"), set(ALL_CAPABILITIES))
+        # g-2 leads p-1a, so its members can do anything in it but not in the project above
+        self.assertEqual(permissions.capabilities(EXPLORER, "workbooks", "w-1"), set(ALL_CAPABILITIES))
+        self.assertEqual(permissions.capabilities(EXPLORER, "projects", "p-1a"), set(ALL_CAPABILITIES))
+        self.assertEqual(permissions.capabilities(EXPLORER, "projects", "p-1"), set())
+        self.assertEqual(permissions.capabilities(VIEWER, "projects", "p-1"), set())
+
+    def test_locked_project(self) -> None:
+        permissions = self.load()
+        # w-3 is in a project nested in p-2, so p-2's defaults apply instead of its own rules
+        self.assertEqual(permissions.capabilities(EXPLORER, "workbooks", "w-3"), {"Read"})
+        self.assertEqual(permissions.capabilities(CREATOR, "workbooks", "w-3"), set())
+
+    def test_unknown(self) -> None:
+        permissions = self.load()
+        with self.assertRaises(KeyError):
+            permissions.capabilities(CREATOR, "workbooks", "w-missing")
+        with self.assertRaises(ValueError):
+            permissions.capabilities(CREATOR, "datasources", "d-1")
+        with self.assertRaises(ValueError):
+            TSC.EffectivePermissions(self.server, content=["views"])
+
+    def test_refresh_item(self) -> None:
+        permissions = self.load()
+        self.mock.get(
+            f"{self.site_url}/workbooks/w-2/permissions",
+            text=permissions_response([("user", VIEWER, {"Read": "Allow", "WebAuthoring": "Allow"})]),
+        )
+        workbook = TSC.WorkbookItem("p-1")
+        workbook._id = "w-2"
+        workbook.owner_id = ADMIN
+        permissions.refresh_item("workbooks", workbook)
+        self.assertEqual(permissions.capabilities(VIEWER, "workbooks", "w-2"), {"Read"})
+        self.assertEqual(permissions.capabilities(CREATOR, "workbooks", "w-2"), set())
+
+    def test_refresh_group_and_user(self) -> None:
+        permissions = self.load()
+        self.mock.get(f"{self.site_url}/groups/g-3/users", text=response("<users />", 0))
+        group = TSC.GroupItem("g-3")
+        group._id = "g-3"
+        permissions.refresh_group(group)
+        self.assertEqual(permissions.capabilities(CREATOR, "workbooks", "w-2"), {"Read", "Write", "ExportData"})
+
+        self.mock.get(
+            f"{self.site_url}/users/{VIEWER}/groups", text=response('<groups><group id="g-2" name="g-2" /></groups>')
+        )
+        viewer = TSC.UserItem(VIEWER, "Viewer")
+        viewer._id = VIEWER
+        permissions.refresh_user(viewer)
+        self.assertEqual(permissions.capabilities(VIEWER, "workbooks", "w-2"), {"Read"})
+        self.assertEqual(permissions.capabilities(VIEWER, "workbooks", "w-1"), VIEWER_CAPABILITIES)
@@ -0,0 +1,130 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.helpers import export
+from tableauserverclient.helpers.export import export_ndjson, item_to_dict
+
+from test.test_pager import workbook_page
+
+
+class ExportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+
+        # Fake sign in
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.baseurl = self.server.workbooks.baseurl
+        self.path = os.path.join(tempfile.mkdtemp(), "workbooks.ndjson")
+
+    def read_names(self) -> list[str]:
+        with open(self.path) as f:
+            return [json.loads(line)["name"] for line in f]
+
+    def test_item_to_dict(self) -> None:
+        workbook = TSC.WorkbookItem("project-id", "name")
+        workbook.tags = {"b", "a"}
+        row = item_to_dict(workbook)
+        self.assertEqual(row["project_id"], "project-id")
+        self.assertEqual(row["tags"], ["a", "b"])
+        self.assertNotIn("views", row)
+
+    def test_export_ndjson(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=workbook_page)
+            rows = export_ndjson(self.server.workbooks, self.path, TSC.RequestOptions(pagesize=10))
+
+        self.assertEqual(rows, 25)
+        self.assertEqual(self.read_names(), [f"Workbook{i}" for i in range(25)])
+        self.assertFalse(os.path.exists(self.path + ".checkpoint"))
+
+    def test_export_ndjson_resumes(self) -> None:
+        calls = 0
+
+        def failing_page(request, context):
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                context.status_code = 500
+                return "Server error"
+            return workbook_page(request, context)
+
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=failing_page)
+            with self.assertRaises(TSC.server.endpoint.exceptions.InternalServerError):
+                export_ndjson(self.server.workbooks, self.path, TSC.RequestOptions(pagesize=10), checkpoint_every=7)
+            self.assertTrue(os.path.exists(self.path + ".checkpoint"))
+
+            rows = export_ndjson(self.server.workbooks, self.path)
+
+        # 14 rows were checkpointed before the failure, the other 6 written rows are discarded
+        self.assertEqual(rows, 11)
+        self.assertEqual(self.read_names(), [f"Workbook{i}" for i in range(25)])
+
+
+class InventoryExportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+
+        # Fake sign in
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+        self.server.version = "3.22"
+
+        self.baseurl = self.server.workbooks.baseurl
+        self.path = tempfile.mkdtemp()
+
+    def test_inventory_ndjson(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=workbook_page)
+            written = self.server.export.inventory(["workbooks"], path=self.path, page_size=4, max_workers=3)
+
+        self.assertEqual(written, {"workbooks": os.path.join(self.path, "workbooks.ndjson")})
+        with open(written["workbooks"]) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual([row["name"] for row in rows], [f"Workbook{i}" for i in range(25)])
+        self.assertEqual(rows[0]["project_name"], "default")
+        self.assertIsNone(rows[0]["size"])
+
+    def test_inventory_csv(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=workbook_page)
+            written = self.server.export.inventory(["workbooks"], fmt="csv", path=self.path, page_size=10)
+
+        with open(written["workbooks"], newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row["id"] for row in rows], [f"wb-{i}" for i in range(25)])
+        self.assertEqual(rows[0]["project_id"], "p")
+
+    @unittest.skipUnless(export.pyarrow_available(), "pyarrow is not installed")
+    def test_inventory_parquet(self) -> None:
+        import pyarrow.parquet
+
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=workbook_page)
+            written = self.server.export.inventory(["workbooks"], fmt="parquet", path=self.path, page_size=10)
+
+        table = pyarrow.parquet.read_table(written["workbooks"])
+        self.assertEqual(table.num_rows, 25)
+        self.assertEqual(table.column("name").to_pylist()[-1], "Workbook24")
+
+    def test_inventory_personal_space_project(self) -> None:
+        workbook = TSC.WorkbookItem(name="Personal")
+        columns = export.INVENTORY["workbooks"][2]
+        batch = export.to_columns([workbook, workbook], columns)
+        self.assertEqual(batch["project_id"], [None, None])
+
+    def test_inventory_unknown_content(self) -> None:
+        with self.assertRaises(ValueError):
+            self.server.export.inventory(["dashboards"], path=self.path)
+
+    def test_inventory_unknown_format(self) -> None:
+        with self.assertRaises(ValueError):
+            self.server.export.inventory(["workbooks"], fmt="xlsx", path=self.path)
@@ -310,3 +310,66 @@ class GroupTests(unittest.TestCase):
         self.assertEqual(job.id, "c2566efc-0767-4f15-89cb-56acb4349c1b")
         self.assertEqual(job.mode, "Asynchronous")
         self.assertEqual(job.type, "GroupSync")
+
+    def sync_members_mock(self, m: requests_mock.Mocker, group: TSC.GroupItem, members: list[str]) -> None:
+        users = "".join(f'<user id="{user_id}" name="{user_id}" />' for user_id in members)
+        m.get(
+            f"{self.baseurl}/{group.id}/users",
+            text=f'<tsResponse xmlns="http://tableau.com/api"><pagination pageNumber="1" pageSize="1000" '
+            f'totalAvailable="{len(members)}" /><users>{users}</users></tsResponse>',
+        )
+
+    def test_sync_members(self) -> None:
+        self.server.version = "3.21"
+        self.baseurl = self.server.groups.baseurl
+        group = TSC.GroupItem("test")
+        group._id = "e7833b48-c6f7-47b5-a2a7-36e7dd232758"
+        kept = TSC.UserItem("kept", "Viewer")
+        kept._id = "u-kept"
+
+        with requests_mock.mock() as m:
+            self.sync_members_mock(m, group, ["u-kept", "u-gone-1", "u-gone-2"])
+            m.post(f"{self.baseurl}/{group.id}/users", text=ADD_USERS.read_text())
+            m.put(f"{self.baseurl}/{group.id}/users/remove")
+            changes = self.server.groups.sync_members(group, [kept, "u-new-1", "u-new-2", "u-new-3"], chunk_size=2)
+            history = [(r.method, r.url, r.text) for r in m.request_history]
+
+        self.assertEqual(changes.add, ["u-new-1", "u-new-2", "u-new-3"])
+        self.assertEqual(changes.remove, ["u-gone-1", "u-gone-2"])
+        self.assertIn("pageSize=1000", history[0][1])
+        self.assertEqual(sorted(method for method, _, _ in history[1:]), ["POST", "POST", "PUT"])
+        added = " ".join(body for method, _, body in history if method == "POST")
+        self.assertTrue(all(user_id in added for user_id in changes.add))
+
+    def test_sync_members_dry_run(self) -> None:
+        group = TSC.GroupItem("test")
+        group._id = "e7833b48-c6f7-47b5-a2a7-36e7dd232758"
+        with requests_mock.mock() as m:
+            self.sync_members_mock(m, group, ["u-1", "u-2"])
+            changes = self.server.groups.sync_members(group, ["u-2", "u-3"], dry_run=True)
+            self.assertEqual(m.call_count, 1)
+            self.assertFalse(self.server.groups.sync_members(group, ["u-1", "u-2"]))
+        self.assertEqual((changes.add, changes.remove), (["u-3"], ["u-1"]))
+
+    def test_sync_members_one_at_a_time(self) -> None:
+        # Before 3.21 there are no bulk requests
+        self.server.version = "3.20"
+        self.baseurl = self.server.groups.baseurl
+        group = TSC.GroupItem("test")
+        group._id = "e7833b48-c6f7-47b5-a2a7-36e7dd232758"
+        with open(ADD_USER, "rb") as f:
+            add_user_xml = f.read().decode("utf-8")
+
+        with requests_mock.mock() as m:
+            self.sync_members_mock(m, group, ["u-1", "u-2", "u-3"])
+            m.post(f"{self.baseurl}/{group.id}/users", text=add_user_xml)
+            m.delete(requests_mock.ANY)
+            self.server.groups.sync_members(group, ["u-3", "u-4", "u-5"])
+            deleted = sorted(r.url for r in m.request_history if r.method == "DELETE")
+            self.assertEqual(len([r for r in m.request_history if r.method == "POST"]), 2)
+
+        self.assertEqual(deleted, [f"{self.baseurl}/{group.id}/users/u-1", f"{self.baseurl}/{group.id}/users/u-2"])
+
+    def test_sync_members_missing_id(self) -> None:
+        with self.assertRaises(TSC.MissingRequiredFieldError):
+            self.server.groups.sync_members(TSC.GroupItem("test"), [])
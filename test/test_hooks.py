@@ -0,0 +1,167 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.endpoint.exceptions import InternalServerError
+from tableauserverclient.server.hooks import url_template
+
+TEST_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+GET_XML = os.path.join(TEST_ASSET_DIR, "workbook_get.xml")
+SITE_ID = "dad65087-b08b-4603-af4e-2887b8aafc67"
+UPLOAD_XML = '<tsResponse xmlns="http://tableau.com/api"><fileUpload uploadSessionId="1:2" /></tsResponse>'
+
+
+class HooksTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake sign in
+        self.server._site_id = SITE_ID
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.baseurl = self.server.workbooks.baseurl
+        with open(GET_XML, "rb") as f:
+            self.response_xml = f.read()
+
+        self.events: list[tuple[str, TSC.RequestEvent]] = []
+        for name in TSC.Hooks.Events:
+            self.server.hooks.add(name, lambda event, name=name: self.events.append((name, event)))
+
+    def test_url_template(self) -> None:
+        url = f"http://test/api/3.10/sites/{SITE_ID}/workbooks/3cc6cd06-89ce-4fdc-b935-5294135d6d42/content?a=b"
+        self.assertEqual(url_template(url, SITE_ID), "/sites/{site_id}/workbooks/{id}/content")
+        self.assertEqual(
+            url_template("http://test/api/3.10/sites/s/workbooks/w/revisions/3/content"),
+            "/sites/s/workbooks/w/revisions/{id}/content",
+        )
+        self.assertEqual(url_template("http://test/api/metadata/graphql"), "/api/metadata/graphql")
+        self.assertEqual(url_template("http://test/api/3.10/auth/signin"), "/auth/signin")
+
+    def test_request_events(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, content=self.response_xml)
+            self.server.workbooks.get()
+
+        self.assertEqual([name for name, _ in self.events], ["before_request", "after_response"])
+        event = self.events[-1][1]
+        self.assertEqual(event.method, "GET")
+        self.assertEqual(event.endpoint, "Workbooks")
+        self.assertEqual(event.url_template, "/sites/{site_id}/workbooks")
+        self.assertEqual(event.status, 200)
+        self.assertEqual(event.bytes_received, len(self.response_xml))
+        self.assertIsNotNone(event.latency)
+        self.assertGreater(event.parse_time or 0, 0)
+
+    def test_bytes_sent(self) -> None:
+        with requests_mock.mock() as m:
+            m.post(self.server.fileuploads.baseurl, text=UPLOAD_XML)
+            self.server.fileuploads.initiate()
+            m.put(
+                self.server.fileuploads.baseurl + "/1:2",
+                text=UPLOAD_XML,
+            )
+            self.server.fileuploads.append("1:2", b"abcdef", "application/octet-stream")
+
+        event = self.events[-1][1]
+        self.assertEqual(event.method, "PUT")
+        self.assertEqual(event.url_template, "/sites/{site_id}/fileUploads/{id}")
+        self.assertEqual(event.bytes_sent, 6)
+
+    def test_error(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, status_code=500, text="Internal error")
+            with self.assertRaises(InternalServerError):
+                self.server.workbooks.get()
+
+        self.assertEqual([name for name, _ in self.events], ["before_request", "on_error"])
+        event = self.events[-1][1]
+        self.assertEqual(event.status, 500)
+        self.assertIsInstance(event.error, InternalServerError)
+
+    def test_retry(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, content=self.response_xml)
+            with mock.patch.object(TSC.server.endpoint.Endpoint, "send_request_while_show_progress_threaded") as send:
+                send.return_value = None
+                self.server.workbooks.get()
+
+        self.assertEqual([name for name, _ in self.events], ["before_request", "on_retry", "after_response"])
+        self.assertEqual(self.events[-1][1].attempt, 2)
+
+    def test_failing_hook(self) -> None:
+        def fail(event):
+            raise RuntimeError("Broken hook")
+
+        self.server.hooks.add(TSC.Hooks.BeforeRequest, fail)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, content=self.response_xml)
+            workbooks, _ = self.server.workbooks.get()
+        self.assertEqual(len(workbooks), 2)
+
+    def test_remove(self) -> None:
+        server = TSC.Server("http://test", False)
+        callback = mock.Mock()
+        server.hooks.add(TSC.Hooks.AfterResponse, callback)
+        self.assertTrue(server.hooks)
+        server.hooks.remove(TSC.Hooks.AfterResponse, callback)
+        self.assertFalse(server.hooks)
+
+    def test_unknown_hook(self) -> None:
+        with self.assertRaises(ValueError):
+            self.server.hooks.add("after_request", print)
+
+
+class MetricsAggregatorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake sign in
+        self.server._site_id = SITE_ID
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.baseurl = self.server.workbooks.baseurl
+        with open(GET_XML, "rb") as f:
+            self.response_xml = f.read()
+        self.metrics = TSC.MetricsAggregator()
+        self.metrics.attach(self.server)
+
+    def test_snapshot(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, content=self.response_xml)
+            m.get(self.baseurl + "/missing", status_code=500)
+            self.server.workbooks.get()
+            self.server.workbooks.get()
+            with self.assertRaises(InternalServerError):
+                self.server.workbooks.get_by_id("missing")
+
+        snapshot = self.metrics.snapshot()
+        json.dumps(snapshot)
+        workbooks = snapshot["Workbooks"]["GET /sites/{site_id}/workbooks"]
+        self.assertEqual(workbooks["count"], 2)
+        self.assertEqual(workbooks["errors"], 0)
+        self.assertEqual(workbooks["statuses"], {"200": 2})
+        self.assertEqual(sum(workbooks["latency"]["histogram"].values()), 2)
+        self.assertEqual(workbooks["bytes_received"], 2 * len(self.response_xml))
+        self.assertGreater(workbooks["parse_time_sum"], 0)
+
+        missing = snapshot["Workbooks"]["GET /sites/{site_id}/workbooks/missing"]
+        self.assertEqual(missing["errors"], 1)
+        self.assertEqual(missing["statuses"], {"500": 1})
+
+    def test_detach_and_reset(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, content=self.response_xml)
+            self.server.workbooks.get()
+            self.metrics.detach(self.server)
+            self.server.workbooks.get()
+
+        self.assertEqual(self.metrics.snapshot("Workbooks")["Workbooks"]["GET /sites/{site_id}/workbooks"]["count"], 1)
+        self.metrics.reset()
+        self.assertEqual(self.metrics.snapshot(), {})
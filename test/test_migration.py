@@ -0,0 +1,203 @@
+import json
+import os
+import re
+import tempfile
+import unittest
+
+import requests_mock
+
+import tableauserverclient as TSC
+
+NS = 'xmlns="http://tableau.com/api"'
+SOURCE_SITE = "dad65087-b08b-4603-af4e-2887b8aafc67"
+TARGET_SITE = "0626857c-1def-4503-a7d8-7907c3ff9d9f"
+
+# id, name, parent
+SOURCE_PROJECTS = [("p-finance", "Finance", None), ("p-reports", "Reports", "p-finance")]
+TARGET_PROJECTS = [("t-finance", "Finance", None)]
+# id, name, project, owner, tags
+DATASOURCES = [
+    ("ds-orders", "Orders", "p-reports", "u-alice", ["sales"]),
+    ("ds-returns", "Returns", "p-finance", "u-bob", []),
+]
+
+
+def response(body: str, total: int = 1) -> str:
+    pagination = f'<pagination pageNumber="1" pageSize="100" totalAvailable="{total}" />'
+    return f"<tsResponse {NS}>{pagination}{body}</tsResponse>"
+
+
+def project_xml(id_, name, parent) -> str:
+    parent_attribute = f' parentProjectId="{parent}"' if parent else ""
+    return f'<project id="{id_}" name="{name}"{parent_attribute}><owner id="t-admin" /></project>'
+
+
+def datasource_xml(id_, name, project, owner, tags) -> str:
+    tags_xml = "".join(f'<tag label="{tag}" />' for tag in tags)
+    return (
+        f'<datasource id="{id_}" name="{name}" type="dataengine"><project id="{project}" />'
+        f'<owner id="{owner}" /><tags>{tags_xml}</tags></datasource>'
+    )
+
+
+def permissions_xml(rules) -> str:
+    grantees = "".join(
+        f'<granteeCapabilities><{tag} id="{id_}" /><capabilities><capability name="Read" mode="Allow" />'
+        "</capabilities></granteeCapabilities>"
+        for tag, id_ in rules
+    )
+    return f"<tsResponse {NS}><permissions>{grantees}</permissions></tsResponse>"
+
+
+def search(pattern: bytes, body: bytes) -> str:
+    match = re.search(pattern, body)
+    assert match is not None
+    return match.group(1).decode()
+
+
+def make_server(address: str, site_id: str) -> TSC.Server:
+    server = TSC.Server(address, False)
+    server.version = "3.10"
+    # Fake sign in
+    server._site_id = site_id
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    return server
+
+
+class MigrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = make_server("http://source", SOURCE_SITE)
+        self.target = make_server("http://target", TARGET_SITE)
+        self.mock = requests_mock.Mocker()
+        self.mock.start()
+        self.addCleanup(self.mock.stop)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.manifest = os.path.join(self.directory.name, "manifest.jsonl")
+        self.published: list[str] = []
+        self.unpublishable: set[str] = set()
+        self.permissions: dict[str, str] = {}
+        self.register_source()
+        self.register_target()
+
+    def register_source(self) -> None:
+        m, url = self.mock, f"{self.source.baseurl}/sites/{SOURCE_SITE}"
+        users = '<user id="u-alice" name="alice" /><user id="u-bob" name="bob" />'
+        m.get(f"{url}/users", text=response(f"<users>{users}</users>", 2))
+        m.get(f"{url}/groups", text=response('<groups><group id="g-sales" name="Sales" /></groups>'))
+        projects = "".join(project_xml(*p) for p in SOURCE_PROJECTS)
+        m.get(f"{url}/projects", text=response(f"<projects>{projects}</projects>", len(SOURCE_PROJECTS)))
+        datasources = "".join(datasource_xml(*d) for d in DATASOURCES)
+        m.get(f"{url}/datasources", text=response(f"<datasources>{datasources}</datasources>", len(DATASOURCES)))
+        m.get(
+            re.compile(f"{url}/(projects|datasources)/[^/]+/permissions"),
+            text=permissions_xml([("group", "g-sales"), ("user", "u-bob")]),
+        )
+        for id_, name, *_ in DATASOURCES:
+            m.get(
+                f"{url}/datasources/{id_}/content",
+                content=name.encode(),
+                headers={"Content-Disposition": f'name="tableau_datasource"; filename="{name}.tds"'},
+            )
+
+    def register_target(self) -> None:
+        m, url = self.mock, f"{self.target.baseurl}/sites/{TARGET_SITE}"
+        users = '<user id="t-alice" name="Alice" /><user id="t-admin" name="admin" />'
+        m.get(f"{url}/users", text=response(f"<users>{users}</users>", 2))
+        m.get(f"{url}/groups", text=response('<groups><group id="t-sales" name="Sales" /></groups>'))
+        projects = "".join(project_xml(*p) for p in TARGET_PROJECTS)
+        m.get(f"{url}/projects", text=response(f"<projects>{projects}</projects>", len(TARGET_PROJECTS)))
+        m.post(f"{url}/projects", text=response(project_xml("t-reports", "Reports", "t-finance")))
+        m.get(re.compile(f"{url}/(projects|datasources)/[^/]+/permissions"), text=permissions_xml([]))
+        m.put(re.compile(f"{url}/(projects|datasources)/[^/]+/permissions"), text=self.update_permissions)
+        m.post(f"{url}/datasources", text=self.publish)
+        m.put(re.compile(f"{url}/datasources/[^/]+/tags"), text=response('<tags><tag label="sales" /></tags>'))
+        m.put(re.compile(f"{url}/datasources/[^/]+$"), text=self.update_datasource)
+
+    def publish(self, request, context) -> str:
+        name = search(rb'name="(\w+)"', request.body.split(b"tsRequest", 1)[1])
+        if name in self.unpublishable:
+            context.status_code = 500
+            return "error"
+        self.published.append(name)
+        project = search(rb'<project id="([\w-]+)"', request.body)
+        return response(datasource_xml(f"t-{name.lower()}", name, project, "t-admin", []))
+
+    def update_datasource(self, request, context) -> str:
+        owner = search(rb'<owner id="([\w-]+)"', request.body)
+        id_ = request.url.rsplit("/", 1)[1]
+        return response(datasource_xml(id_, id_, "t-reports", owner, ["sales"]))
+
+    def update_permissions(self, request, context) -> str:
+        self.permissions[request.url.split("/")[-2]] = request.body.decode()
+        return permissions_xml([])
+
+    def requests(self, method: str, pattern: str) -> list:
+        return [r for r in self.mock.request_history if r.method == method and re.search(pattern, r.url)]
+
+    def test_run(self) -> None:
+        migration = TSC.Migration(self.source, self.target, self.manifest, content=["datasources"]).run()
+
+        self.assertEqual(migration.failed, {})
+        self.assertEqual(migration.migrated["projects"], {"p-finance": "t-finance", "p-reports": "t-reports"})
+        self.assertEqual(migration.migrated["datasources"], {"ds-orders": "t-orders", "ds-returns": "t-returns"})
+        with open(self.manifest) as f:
+            entries = [json.loads(line) for line in f]
+        self.assertEqual(len(entries), 4)
+        self.assertIn({"kind": "datasources", "id": "ds-orders", "target_id": "t-orders"}, entries)
+
+        # The existing project is reused, the missing one created under it
+        (created,) = self.requests("POST", "/projects")
+        self.assertIn(b'parentProjectId="t-finance"', created.body)
+        published = {r.body.count(b"t-reports") for r in self.requests("POST", "/datasources")}
+        self.assertEqual(published, {0, 1})
+
+        # Owners and permissions are mapped by name, bob has no account on the target
+        (owner_update,) = self.requests("PUT", "/datasources/t-orders$")
+        self.assertIn(b'<owner id="t-alice"', owner_update.body)
+        self.assertEqual(len(self.requests("PUT", "/datasources/t-orders/tags")), 1)
+        self.assertIn('<group id="t-sales"', self.permissions["t-orders"])
+        self.assertNotIn("<user", self.permissions["t-orders"])
+
+    def test_resume(self) -> None:
+        with open(self.manifest, "w") as f:
+            f.write('{"kind": "projects", "id": "p-finance", "target_id": "t-finance"}\n')
+            f.write('{"kind": "datasources", "id": "ds-returns", "error": "Internal error"}\n')
+            f.write('{"kind": "datasources", "id": "ds-orders", "target_id": "t-1"}\n')
+            # Cut short by an interrupted migration
+            f.write('{"kind": "datasources", "id": "ds-ret')
+        migration = TSC.Migration(self.source, self.target, self.manifest, content=["datasources"]).run()
+
+        self.assertEqual(self.published, ["Returns"])
+        self.assertEqual(self.requests("GET", "/datasources/ds-orders/content"), [])
+        self.assertEqual(migration.migrated["datasources"], {"ds-orders": "t-1", "ds-returns": "t-returns"})
+        with open(self.manifest) as f:
+            self.assertEqual(json.loads(f.readlines()[-1])["target_id"], "t-returns")
+
+    def test_personal_space(self) -> None:
+        url = f"{self.source.baseurl}/sites/{SOURCE_SITE}/workbooks"
+        workbook = '<workbook id="wb-mine" name="Mine"><owner id="u-alice" /></workbook>'
+        self.mock.get(url, text=response(f"<workbooks>{workbook}</workbooks>"))
+        migration = TSC.Migration(self.source, self.target, self.manifest, content=["workbooks"]).run()
+
+        self.assertEqual(migration.failed, {})
+        self.assertEqual(list(migration.skipped["workbooks"]), ["wb-mine"])
+        self.assertIn("Personal Space", migration.skipped["workbooks"]["wb-mine"])
+        self.assertEqual(self.requests("GET", "/workbooks/wb-mine/content"), [])
+
+    def test_failures(self) -> None:
+        self.unpublishable.add("Returns")
+        migration = TSC.Migration(
+            self.source, self.target, self.manifest, content=["datasources"], download_workers=1, upload_workers=1
+        ).run()
+
+        self.assertEqual(list(migration.failed["datasources"]), ["ds-returns"])
+        self.assertEqual(migration.migrated["datasources"], {"ds-orders": "t-orders"})
+        # Nothing is left behind in the working directories
+        self.assertEqual(os.listdir(self.directory.name), ["manifest.jsonl"])
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            TSC.Migration(self.source, self.target, content=["views"])
+        with self.assertRaises(ValueError):
+            TSC.Migration(self.source, self.target, queue_size=0)
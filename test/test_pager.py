@@ -15,6 +15,24 @@ GET_XML_PAGE2 = os.path.join(TEST_ASSET_DIR, "workbook_get_page_2.xml")
 GET_XML_PAGE3 = os.path.join(TEST_ASSET_DIR, "workbook_get_page_3.xml")
 
 
+def workbook_page(request, context, total=25, fail_above=None):
+    page_number = int(request.qs["pagenumber"][0])
+    page_size = int(request.qs["pagesize"][0])
+    if fail_above is not None and page_size > fail_above:
+        context.status_code = 504
+        return "Gateway Timeout"
+    start = (page_number - 1) * page_size
+    workbooks = "".join(
+        f'<workbook id="wb-{i}" name="Workbook{i}"><project id="p" name="default" /></workbook>'
+        for i in range(start, min(start + page_size, total))
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><tsResponse xmlns="http://tableau.com/api">'
+        f'<pagination pageNumber="{page_number}" pageSize="{page_size}" totalAvailable="{total}" />'
+        f"<workbooks>{workbooks}</workbooks></tsResponse>"
+    )
+
+
 @contextlib.contextmanager
 def set_env(**environ):
     old_environ = dict(os.environ)
@@ -122,3 +140,151 @@ class PagerTests(unittest.TestCase):
             m.get(self.server.views.baseurl, text=view_xml)
             for view in TSC.Pager(self.server.views):
                 assert view.name is not None
+
+    def test_pager_adaptive_page_size(self) -> None:
+        adaptive = TSC.AdaptivePageSize(maximum=10, minimum=2)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=workbook_page)
+            workbooks = list(TSC.Pager(self.server.workbooks, page_size=adaptive))
+
+        self.assertEqual([wb.name for wb in workbooks], [f"Workbook{i}" for i in range(25)])
+        self.assertEqual(adaptive.history[0].page_size, 10)
+        self.assertEqual(sum(page.item_count for page in adaptive.history), 25)
+
+    def test_pager_adaptive_page_size_shrinks_on_timeout(self) -> None:
+        adaptive = TSC.AdaptivePageSize(maximum=20, minimum=2)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=lambda request, context: workbook_page(request, context, fail_above=5))
+            workbooks = list(TSC.Pager(self.server.workbooks, page_size=adaptive))
+
+        self.assertEqual([wb.name for wb in workbooks], [f"Workbook{i}" for i in range(25)])
+        self.assertTrue(adaptive.history[0].timed_out)
+        self.assertTrue(all(page.page_size <= 5 for page in adaptive.history if not page.timed_out))
+
+    def test_pager_adaptive_gives_up_at_minimum(self) -> None:
+        adaptive = TSC.AdaptivePageSize(maximum=4, minimum=2)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=lambda request, context: workbook_page(request, context, fail_above=1))
+            with self.assertRaises(TSC.server.endpoint.exceptions.InternalServerError):
+                list(TSC.Pager(self.server.workbooks, page_size=adaptive))
+
+    def test_adaptive_page_size_shrinks_when_slow(self) -> None:
+        adaptive = TSC.AdaptivePageSize(maximum=1000, minimum=100, target_seconds=1)
+        adaptive.record(1, 1000, 1000, 2.5)
+        self.assertEqual(adaptive.current, 500)
+        adaptive.record(2, 500, 500, 0.1)
+        self.assertEqual(adaptive.current, 1000)
+        # offset 1500 is not a multiple of 1000, so the page size must be reduced to stay aligned
+        self.assertEqual(adaptive.next_page(1500), (3, 750))
+
+    def test_adaptive_page_size_resumes_at_prime_offset(self) -> None:
+        adaptive = TSC.AdaptivePageSize(maximum=1000, minimum=10, initial=100)
+        # A larger page keeps the page size above the minimum
+        self.assertEqual(adaptive.next_page(101), (2, 101))
+        self.assertEqual(adaptive.next_page(150), (2, 150))
+        # Only an offset with no divisor from the minimum up goes below it
+        self.assertEqual(adaptive.next_page(7), (2, 7))
+
+    def test_pager_endpoint_page_size_override(self) -> None:
+        self.server.workbooks.page_size = 10
+        try:
+            with requests_mock.mock() as m:
+                m.get(self.baseurl, text=workbook_page)
+                workbooks = list(TSC.Pager(self.server.workbooks))
+                self.assertEqual(m.request_history[0].qs["pagesize"], ["10"])
+        finally:
+            del self.server.workbooks.page_size
+        self.assertEqual(len(workbooks), 25)
+
+    def test_queryset_adaptive_page_size(self) -> None:
+        adaptive = TSC.AdaptivePageSize(maximum=20, minimum=2)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=lambda request, context: workbook_page(request, context, fail_above=5))
+            workbooks = list(self.server.workbooks.all(page_size=adaptive))
+
+        self.assertEqual([wb.name for wb in workbooks], [f"Workbook{i}" for i in range(25)])
+        self.assertTrue(adaptive.history[0].timed_out)
+
+    def test_pager_checkpoint_resume(self) -> None:
+        opts = TSC.RequestOptions(pagesize=10)
+        opts.filter.add(TSC.Filter(TSC.RequestOptions.Field.Name, TSC.RequestOptions.Operator.Equals, "foo"))
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=workbook_page)
+            pager = TSC.Pager(self.server.workbooks, opts)
+            seen = []
+            for workbook in pager:
+                seen.append(workbook.name)
+                if len(seen) == 13:
+                    break
+            state = pager.checkpoint.to_json()
+
+            checkpoint = TSC.PaginationCheckpoint.from_json(state)
+            self.assertEqual(checkpoint.endpoint, "workbooks")
+            self.assertEqual((checkpoint.page_number, checkpoint.page_offset), (2, 3))
+            self.assertEqual(checkpoint.watermark, "wb-12")
+
+            resumed = [wb.name for wb in TSC.Pager.from_checkpoint(self.server, checkpoint)]
+            self.assertIn("filter=name:eq:foo", m.last_request.url)
+
+        self.assertEqual(seen + resumed, [f"Workbook{i}" for i in range(25)])
+
+    def test_queryset_checkpoint_resume(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=workbook_page)
+            queryset = self.server.workbooks.filter(page_size=10).order_by("-name")
+            seen = []
+            for workbook in queryset:
+                seen.append(workbook.name)
+                if len(seen) == 20:
+                    break
+            checkpoint = TSC.PaginationCheckpoint.from_json(queryset.checkpoint.to_json())
+            self.assertEqual(checkpoint.sort, [("name", "desc")])
+
+            resumed = [wb.name for wb in self.server.workbooks.from_checkpoint(checkpoint)]
+            self.assertIn("sort=name:desc", m.last_request.url)
+
+        self.assertEqual(seen + resumed, [f"Workbook{i}" for i in range(25)])
+
+    def test_queryset_checkpoint_resume_adaptive_page_size(self) -> None:
+        checkpoint = TSC.PaginationCheckpoint(endpoint="workbooks", page_number=3, page_size=5)
+        adaptive = TSC.AdaptivePageSize(maximum=10, minimum=1)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=workbook_page)
+            resumed = [wb.name for wb in self.server.workbooks.from_checkpoint(checkpoint, page_size=adaptive)]
+
+        self.assertEqual(resumed, [f"Workbook{i}" for i in range(10, 25)])
+
+    def test_pager_stream(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=workbook_page)
+            workbooks = list(TSC.Pager(self.server.workbooks, page_size=10, stream=True))
+
+        self.assertEqual([wb.name for wb in workbooks], [f"Workbook{i}" for i in range(25)])
+        self.assertEqual(len(m.request_history), 3)
+
+    def test_pager_stream_checkpoint_resume(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=workbook_page)
+            pager = TSC.Pager(self.server.workbooks, page_size=10, stream=True)
+            seen = []
+            for workbook in pager:
+                seen.append(workbook.name)
+                if len(seen) == 15:
+                    break
+            checkpoint = TSC.PaginationCheckpoint.from_json(pager.checkpoint.to_json())
+            resumed = [wb.name for wb in TSC.Pager.from_checkpoint(self.server, checkpoint, stream=True)]
+
+        self.assertEqual(seen + resumed, [f"Workbook{i}" for i in range(25)])
+
+    def test_pager_stream_adaptive_page_size(self) -> None:
+        adaptive = TSC.AdaptivePageSize(maximum=10, minimum=2)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=workbook_page)
+            workbooks = list(TSC.Pager(self.server.workbooks, page_size=adaptive, stream=True))
+
+        self.assertEqual(len(workbooks), 25)
+        self.assertIsNone(adaptive.history[0].item_count)
+
+    def test_pager_stream_requires_get_stream(self) -> None:
+        with self.assertRaises(ValueError):
+            TSC.Pager(self.server.groups, stream=True)
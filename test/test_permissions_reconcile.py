@@ -0,0 +1,137 @@
+import os
+import unittest
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.models import GroupItem, PermissionsRule, UserItem
+from tableauserverclient.server.endpoint.permissions_endpoint import PermissionsChanges
+
+TEST_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+POPULATE_PERMISSIONS_XML = os.path.join(TEST_ASSET_DIR, "workbook_populate_permissions.xml")
+UPDATE_PERMISSIONS = os.path.join(TEST_ASSET_DIR, "workbook_update_permissions.xml")
+
+WORKBOOK_ID = "21778de4-b7b9-44bc-a599-1506a2639ace"
+GROUP_ID = "5e5e1978-71fa-11e4-87dd-7382f5c437af"
+USER_ID = "7c37ee24-c4b1-42b6-a154-eaeab7ee330a"
+
+Allow = TSC.Permission.Mode.Allow
+Deny = TSC.Permission.Mode.Deny
+
+
+class PermissionsReconcileTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake sign in
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.baseurl = self.server.workbooks.baseurl
+        self.permissions_url = f"{self.baseurl}/{WORKBOOK_ID}/permissions"
+        with open(POPULATE_PERMISSIONS_XML, "rb") as f:
+            self.current_xml = f.read()
+        with open(UPDATE_PERMISSIONS, "rb") as f:
+            self.update_xml = f.read()
+
+        self.workbook = TSC.WorkbookItem("test")
+        self.workbook._id = WORKBOOK_ID
+        self.group = GroupItem.as_reference(GROUP_ID)
+        self.user = UserItem.as_reference(USER_ID)
+
+    def desired(self) -> list[PermissionsRule]:
+        return [
+            # Read changes to Deny, WebAuthoring is dropped and Write is new
+            PermissionsRule(self.group, {"Read": Deny, "Filter": Allow, "AddComment": Allow, "Write": Allow}),
+        ]
+
+    def test_changes_between(self) -> None:
+        current = PermissionsRule.from_response(self.current_xml, self.server.namespace)
+        changes = PermissionsChanges.between(self.workbook, current, self.desired())
+
+        self.assertEqual(changes.add, [PermissionsRule(self.group, {"Read": Deny, "Write": Allow})])
+        self.assertEqual(
+            changes.remove,
+            [
+                PermissionsRule(self.group, {"WebAuthoring": Allow, "Read": Allow}),
+                PermissionsRule(
+                    self.user, {"ExportImage": Allow, "ShareView": Allow, "ExportData": Deny, "ViewComments": Deny}
+                ),
+            ],
+        )
+        self.assertEqual(changes.calls, 7)
+        self.assertFalse(PermissionsChanges.between(self.workbook, current, current))
+
+    def test_duplicate_grantees(self) -> None:
+        rules = [PermissionsRule(self.user, {"Read": Allow}), PermissionsRule(self.user, {"Write": Allow})]
+        changes = PermissionsChanges.between(self.workbook, [], rules)
+        self.assertEqual(changes.add, [PermissionsRule(self.user, {"Read": Allow, "Write": Allow})])
+
+        rules.append(PermissionsRule(self.user, {"Read": Deny}))
+        with self.assertRaises(ValueError):
+            PermissionsChanges.between(self.workbook, [], rules)
+
+    def test_reconcile(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.permissions_url, content=self.current_xml)
+            m.delete(requests_mock.ANY)
+            m.put(self.permissions_url, content=self.update_xml)
+            changes = self.server.workbooks.reconcile_permissions(self.workbook, self.desired())
+            history = [(r.method, r.url) for r in m.request_history]
+
+        self.assertEqual(changes.calls, 7)
+        self.assertEqual(history[0], ("GET", self.permissions_url))
+        self.assertEqual(history[-1], ("PUT", self.permissions_url))
+        deletions = {url for method, url in history if method == "DELETE"}
+        self.assertEqual(len(deletions), 6)
+        self.assertIn(f"{self.permissions_url}/groups/{GROUP_ID}/Read/Allow", deletions)
+        self.assertIn(f"{self.permissions_url}/users/{USER_ID}/ExportData/Deny", deletions)
+
+    def test_reconcile_dry_run(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.permissions_url, content=self.current_xml)
+            changes = self.server.workbooks.reconcile_permissions(self.workbook, self.desired(), dry_run=True)
+            self.assertEqual(m.call_count, 1)
+        self.assertEqual(changes.calls, 7)
+
+    def test_reconcile_unchanged(self) -> None:
+        current = PermissionsRule.from_response(self.current_xml, self.server.namespace)
+        with requests_mock.mock() as m:
+            m.get(self.permissions_url, content=self.current_xml)
+            self.assertFalse(self.server.workbooks.reconcile_permissions(self.workbook, current))
+            self.assertEqual(m.call_count, 1)
+
+    def test_reconcile_many(self) -> None:
+        workbooks = []
+        for i in range(5):
+            workbook = TSC.WorkbookItem("test")
+            workbook._id = f"{WORKBOOK_ID[:-1]}{i}"
+            workbooks.append(workbook)
+        rules = [PermissionsRule(self.user, {"Read": Allow})]
+
+        with requests_mock.mock() as m:
+            m.get(requests_mock.ANY, content=b'<tsResponse xmlns="http://tableau.com/api"><permissions /></tsResponse>')
+            m.put(requests_mock.ANY, content=self.update_xml)
+            results = self.server.workbooks.reconcile_permissions_many([(w, rules) for w in workbooks], max_workers=3)
+            self.assertEqual(m.call_count, 10)
+
+        self.assertEqual([changes.resource for changes in results], workbooks)
+        self.assertTrue(all(changes.add == rules for changes in results))
+
+    def test_reconcile_max_workers(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.permissions_url, content=self.current_xml)
+            m.delete(requests_mock.ANY)
+            m.put(self.permissions_url, content=self.update_xml)
+            self.server.workbooks.reconcile_permissions(self.workbook, self.desired(), max_workers=1)
+            methods = [r.method for r in m.request_history]
+        self.assertEqual(methods, ["GET", *["DELETE"] * 6, "PUT"])
+
+        with self.assertRaises(ValueError):
+            self.server.workbooks.reconcile_permissions(self.workbook, self.desired(), max_workers=0)
+
+    def test_reconcile_missing_id(self) -> None:
+        with self.assertRaises(TSC.MissingRequiredFieldError):
+            self.server.workbooks.reconcile_permissions(TSC.WorkbookItem("test"), [])
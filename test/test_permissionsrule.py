@@ -102,3 +102,33 @@ class TestPermissionsRules(unittest.TestCase):
             },
         )
         self.assertEqual(rule1, rule2)
+
+    def test_sub(self):
+        grantee = ResourceReference("a", "user")
+        rule1 = TSC.PermissionsRule(
+            grantee,
+            {
+                TSC.Permission.Capability.ExportData: TSC.Permission.Mode.Allow,
+                TSC.Permission.Capability.Delete: TSC.Permission.Mode.Deny,
+                TSC.Permission.Capability.ViewComments: TSC.Permission.Mode.Allow,
+            },
+        )
+        rule2 = TSC.PermissionsRule(
+            grantee,
+            {
+                TSC.Permission.Capability.ExportData: TSC.Permission.Mode.Allow,
+                TSC.Permission.Capability.Delete: TSC.Permission.Mode.Allow,
+            },
+        )
+
+        difference = rule1 - rule2
+
+        self.assertEqual(
+            difference.capabilities,
+            {
+                TSC.Permission.Capability.Delete: TSC.Permission.Mode.Deny,
+                TSC.Permission.Capability.ViewComments: TSC.Permission.Mode.Allow,
+            },
+        )
+        with self.assertRaises(ValueError):
+            rule1 - TSC.PermissionsRule(ResourceReference("b", "user"), {})
@@ -0,0 +1,152 @@
+import unittest
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import requests_mock
+
+import tableauserverclient as TSC
+
+NS = 'xmlns="http://tableau.com/api"'
+SITE_ID = "dad65087-b08b-4603-af4e-2887b8aafc67"
+
+# id, name, parent
+PROJECTS = [
+    ("p-finance", "Finance", None),
+    ("p-emea", "EMEA", "p-finance"),
+    ("p-reports", "Reports", "p-emea"),
+    ("p-amer", "AMER", "p-finance"),
+    ("p-amer-reports", "Reports", "p-amer"),
+    ("p-sales", "Sales", None),
+]
+WORKBOOKS = [
+    ("w-1", "p-finance"),
+    ("w-2", "p-reports"),
+    ("w-3", "p-amer-reports"),
+    ("w-4", "p-sales"),
+    ("w-5", "p-emea"),
+]
+
+
+def response(body: str, total: int) -> str:
+    pagination = f'<pagination pageNumber="1" pageSize="100" totalAvailable="{total}" />'
+    return f"<tsResponse {NS}>{pagination}{body}</tsResponse>"
+
+
+def projects_response(projects) -> str:
+    body = "".join(
+        f'<project id="{id_}" name="{name}"' + (f' parentProjectId="{parent}"' if parent else "") + " />"
+        for id_, name, parent in projects
+    )
+    return response(f"<projects>{body}</projects>", len(projects))
+
+
+class ProjectTreeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake sign in
+        self.server._site_id = SITE_ID
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.mock = requests_mock.Mocker()
+        self.mock.start()
+        self.addCleanup(self.mock.stop)
+        self.projects = list(PROJECTS)
+        self.updated: set[str] = set()
+        self.mock.get(self.server.projects.baseurl, text=self.list_projects)
+
+    def list_projects(self, request, context) -> str:
+        if "filter" in request.qs:
+            return projects_response([p for p in self.projects if p[0] in self.updated])
+        if "fields" in request.qs:
+            body = "".join(f'<project id="{id_}" />' for id_, *_ in self.projects)
+            return response(f"<projects>{body}</projects>", len(self.projects))
+        return projects_response(self.projects)
+
+    def test_lookups(self) -> None:
+        tree = self.server.projects.tree()
+        self.assertEqual(len(tree), 6)
+        self.assertIn("p-emea", tree)
+        self.assertEqual(tree.by_path("Finance/EMEA/Reports").id, "p-reports")
+        self.assertEqual(tree.by_path(["Finance", "AMER", "Reports"]).id, "p-amer-reports")
+        with self.assertRaises(KeyError):
+            tree.by_path("Finance/Reports")
+        self.assertEqual(tree.path("p-amer-reports"), "Finance/AMER/Reports")
+        self.assertEqual([p.id for p in tree.children()], ["p-finance", "p-sales"])
+        self.assertEqual([p.id for p in tree.ancestors("p-reports")], ["p-emea", "p-finance"])
+        self.assertEqual(
+            [p.id for p in tree.descendants("p-finance")], ["p-emea", "p-reports", "p-amer", "p-amer-reports"]
+        )
+        self.assertIsNone(tree.parent("p-sales"))
+
+    def test_subtree_content(self) -> None:
+        tree = self.server.projects.tree()
+        names = {id_: name for id_, name, _ in PROJECTS}
+
+        def list_workbooks(request, context) -> str:
+            # Filter on the project names like the server would
+            query = parse_qs(urlsplit(request.url).query)
+            wanted = query["filter"][0].split(":in:")[1].strip("[]").split(",") if "filter" in query else None
+            workbooks = [(id_, p) for id_, p in WORKBOOKS if wanted is None or names[p] in wanted]
+            body = "".join(f'<workbook id="{id_}" name="{id_}"><project id="{p}" /></workbook>' for id_, p in workbooks)
+            return response(f"<workbooks>{body}</workbooks>", len(workbooks))
+
+        self.mock.get(self.server.workbooks.baseurl, text=list_workbooks)
+
+        workbooks = tree.workbooks("p-emea")
+        self.assertEqual([w.id for w in workbooks], ["w-2", "w-5"])
+        filters = [unquote(r.qs["filter"][0]) for r in self.mock.request_history if "filter" in r.qs]
+        self.assertEqual(filters, ["projectname:in:[emea,reports]"])
+
+        # The names are sent in batches, and the items of namesakes elsewhere are left out
+        self.assertEqual([w.id for w in tree.workbooks("p-finance", chunk_size=2)], ["w-5", "w-1", "w-2", "w-3"])
+        self.assertEqual([w.id for w in tree.workbooks("p-finance", recursive=False)], ["w-1"])
+
+    def test_unfilterable_names(self) -> None:
+        self.projects.append(("p-odd", "A, B", None))
+        tree = self.server.projects.tree()
+        self.mock.get(self.server.workbooks.baseurl, text=response("<workbooks />", 0))
+        self.assertEqual(list(tree.workbooks("p-odd")), [])
+        self.assertNotIn("filter", self.mock.request_history[-1].qs)
+
+    def test_add_and_remove(self) -> None:
+        tree = self.server.projects.tree()
+        moved = TSC.ProjectItem("Reports", parent_id="p-sales")
+        moved._id = "p-reports"
+        tree.add(moved)
+        self.assertEqual(tree.path("p-reports"), "Sales/Reports")
+        with self.assertRaises(KeyError):
+            tree.by_path("Finance/EMEA/Reports")
+
+        tree.remove("p-finance")
+        self.assertEqual(sorted(p.id for p in tree), ["p-reports", "p-sales"])
+
+    def test_refresh(self) -> None:
+        tree = self.server.projects.tree()
+        self.projects[1] = ("p-emea", "Europe", "p-finance")
+        self.updated = {"p-emea"}
+        self.assertEqual(tree.refresh(), 1)
+        self.assertEqual(tree.path("p-reports"), "Finance/Europe/Reports")
+        filters = [unquote(r.qs["filter"][0]) for r in self.mock.request_history if "filter" in r.qs]
+        self.assertTrue(filters[0].startswith("updatedat:gte:"))
+
+        # A project deleted while another is created, which keeps the count the same
+        loads = len([r for r in self.mock.request_history if not r.qs.keys() & {"filter", "fields"}])
+        self.projects[-1] = ("p-marketing", "Marketing", None)
+        self.updated = {"p-marketing"}
+        self.assertEqual(tree.refresh(), 2)
+        self.assertNotIn("p-sales", tree)
+        self.assertEqual(tree.path("p-marketing"), "Marketing")
+        self.assertEqual(len([r for r in self.mock.request_history if not r.qs.keys() & {"filter", "fields"}]), loads)
+
+        # A project that the refresh did not find as changed, so everything is loaded again
+        self.projects.append(("p-hr", "HR", None))
+        self.updated = set()
+        tree.refresh()
+        self.assertEqual(tree.path("p-hr"), "HR")
+
+    def test_not_loaded(self) -> None:
+        tree = TSC.ProjectTree([])
+        self.assertEqual(len(tree), 0)
+        with self.assertRaises(ValueError):
+            tree.refresh()
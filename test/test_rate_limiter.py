@@ -0,0 +1,157 @@
+import email.utils
+import os
+import threading
+import time
+import unittest
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.endpoint.exceptions import NonXMLResponseError
+from tableauserverclient.server.rate_limiter import parse_retry_after
+
+TEST_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+GET_XML = os.path.join(TEST_ASSET_DIR, "workbook_get.xml")
+VIEW_ID = "d79634e1-6063-4ec9-95ff-50acbf609ff5"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimiterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+
+    def limiter(self, rate: float, **kwargs) -> TSC.RateLimiter:
+        return TSC.RateLimiter(rate, clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_burst_then_rate(self) -> None:
+        limiter = self.limiter(2, burst=3)
+        for _ in range(3):
+            self.assertEqual(limiter.acquire(), 0)
+        self.assertAlmostEqual(limiter.acquire(), 0.5)
+        self.assertAlmostEqual(limiter.acquire(), 0.5)
+        self.clock.now += 10
+        # The bucket never holds more than the burst
+        for _ in range(3):
+            self.assertEqual(limiter.acquire(), 0)
+        self.assertAlmostEqual(limiter.acquire(), 0.5)
+
+    def test_weights(self) -> None:
+        limiter = self.limiter(1, burst=10, weights={"/workbooks/{id}/content": 4})
+        self.assertEqual(limiter.cost("/sites/{site_id}/views/{id}/pdf"), 5)
+        self.assertEqual(limiter.cost("/sites/{site_id}/workbooks/{id}/content"), 4)
+        self.assertEqual(limiter.cost("/sites/{site_id}/workbooks"), 1)
+
+        limiter.acquire(5)
+        limiter.acquire(5)
+        self.assertAlmostEqual(limiter.acquire(5), 5)
+        # More than the burst can hold waits for a full bucket
+        self.assertAlmostEqual(limiter.acquire(50), 10)
+
+    def test_throttled(self) -> None:
+        limiter = self.limiter(4, burst=4)
+        limiter.throttled(3)
+        self.assertEqual(limiter.current_rate, 2)
+        # Waits out the pause, then for a token at the lowered rate, as none build up during the pause
+        self.assertAlmostEqual(limiter.acquire(), 3.5)
+        self.assertEqual(self.clock.sleeps, [3, 0.5])
+        self.assertAlmostEqual(limiter.acquire(), 0.5)
+
+        # Recovers towards the configured rate as requests succeed
+        for _ in range(10):
+            limiter.succeeded()
+        self.assertEqual(limiter.current_rate, 4)
+
+        for _ in range(10):
+            limiter.throttled()
+        self.assertEqual(limiter.current_rate, 0.25)
+
+    def test_invalid_rate(self) -> None:
+        with self.assertRaises(ValueError):
+            TSC.RateLimiter(0)
+
+    def test_parse_retry_after(self) -> None:
+        self.assertEqual(parse_retry_after("7"), 7)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        retry_at = email.utils.formatdate(time.time() + 60, usegmt=True)
+        self.assertAlmostEqual(parse_retry_after(retry_at) or 0, 60, delta=2)
+        self.assertEqual(parse_retry_after(email.utils.formatdate(0, usegmt=True)), 0)
+
+    def test_shared_across_threads(self) -> None:
+        limiter = TSC.RateLimiter(1000, burst=1)
+        start = time.perf_counter()
+        threads = [threading.Thread(target=lambda: [limiter.acquire() for _ in range(25)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.09)
+
+
+class RateLimitedServerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake sign in
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.clock = FakeClock()
+        self.server.rate_limiter = TSC.RateLimiter(10, burst=10, clock=self.clock, sleep=self.clock.sleep)
+        self.baseurl = self.server.workbooks.baseurl
+        with open(GET_XML, "rb") as f:
+            self.response_xml = f.read()
+
+    def test_retry_after_throttling(self) -> None:
+        retries: list[TSC.RequestEvent] = []
+        self.server.hooks.add(TSC.Hooks.OnRetry, retries.append)
+        with requests_mock.mock() as m:
+            m.get(
+                self.baseurl,
+                [
+                    {"status_code": 429, "headers": {"Retry-After": "2"}},
+                    {"status_code": 200, "content": self.response_xml},
+                ],
+            )
+            workbooks, _ = self.server.workbooks.get()
+
+        self.assertEqual(len(workbooks), 2)
+        # The pause, then a token at the halved rate
+        self.assertEqual(self.clock.sleeps, [2, 0.2])
+        self.assertEqual(len(retries), 1)
+        self.assertEqual(self.server.rate_limiter.current_rate, 5.5)
+
+    def test_throttled_too_often(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, status_code=429, text="Too many requests")
+            with self.assertRaises(NonXMLResponseError):
+                self.server.workbooks.get()
+            self.assertEqual(m.call_count, 4)
+
+    def test_shared_across_endpoints(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, content=self.response_xml)
+            m.get(f"{self.server.views.baseurl}/{VIEW_ID}/pdf", content=b"%PDF")
+            view = TSC.ViewItem()
+            view._id = VIEW_ID
+            self.server.views.populate_pdf(view)
+            self.assertEqual(view.pdf, b"%PDF")
+            for _ in range(6):
+                self.server.workbooks.get()
+
+        # Five tokens for the PDF, then one for each of the workbook requests
+        self.assertAlmostEqual(sum(self.clock.sleeps), 0.1)
@@ -0,0 +1,92 @@
+import io
+import unittest
+
+import tableauserverclient as TSC
+from tableauserverclient.server.endpoint.exceptions import InternalServerError, ServerResponseError
+
+from test.simulator import Faults, RestSimulator, SimulatedSite, item_id
+
+
+class SimulatorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.site = SimulatedSite("Sales", workbooks=2500, views=10, download_size=200 * 1024)
+        self.simulator = RestSimulator([self.site])
+        self.simulator.start()
+        self.addCleanup(self.simulator.stop)
+
+        self.server = TSC.Server(self.simulator.url, use_server_version=True)
+        self.server.auth.sign_in(TSC.TableauAuth("user", "password", "Sales"))
+
+    def test_sign_in(self) -> None:
+        self.assertEqual(self.server.version, "3.24")
+        self.assertEqual(self.server.site_id, self.site.id)
+        self.assertEqual(self.simulator.stats["signin"], 1)
+
+    def test_sign_in_unknown_site(self) -> None:
+        server = TSC.Server(self.simulator.url)
+        with self.assertRaises(TSC.FailedSignInError):
+            server.auth.sign_in(TSC.TableauAuth("user", "password", "Marketing"))
+
+    def test_pages(self) -> None:
+        workbooks = list(TSC.Pager(self.server.workbooks, TSC.RequestOptions(pagesize=1000)))
+        self.assertEqual(len(workbooks), 2500)
+        self.assertEqual(workbooks[-1].name, "Workbook 2499")
+        self.assertEqual(self.simulator.stats["workbooks"], 3)
+
+    def test_large_site(self) -> None:
+        self.site.counts["views"] = 5_000_000
+        views, pagination = self.server.views.get(TSC.RequestOptions(pagenumber=4000, pagesize=1000))
+        self.assertEqual(pagination.total_available, 5_000_000)
+        self.assertEqual(views[0].name, "View 3999000")
+
+    def test_get_by_id(self) -> None:
+        workbook = self.server.workbooks.get_by_id(item_id("workbooks", 7))
+        self.assertEqual(workbook.name, "Workbook 7")
+        with self.assertRaises(ServerResponseError):
+            self.server.workbooks.get_by_id(item_id("workbooks", 7000))
+
+    def test_upload_and_publish(self) -> None:
+        upload_id = self.server.fileuploads.upload(io.BytesIO(b"x" * 1000))
+        self.assertEqual(self.simulator.stats["upload_append"], 1)
+
+        workbook = TSC.WorkbookItem(item_id("projects", 0), "Published")
+        published = self.server.workbooks.publish(workbook, io.BytesIO(b"PK\x03\x04 zipped"), "CreateNew")
+        self.assertEqual(published.name, "Workbook 2500")
+        self.assertEqual(self.site.counts["workbooks"], 2501)
+        self.assertGreater(self.simulator.stats["bytes_uploaded"], 1000)
+        self.assertTrue(upload_id)
+
+    def test_download(self) -> None:
+        output = io.BytesIO()
+        self.server.workbooks.download_revision(item_id("workbooks", 1), None, output)
+        self.assertEqual(len(output.getvalue()), 200 * 1024)
+        self.assertEqual(self.simulator.stats["bytes_downloaded"], 200 * 1024)
+
+    def test_wait_for_job(self) -> None:
+        self.simulator.job_polls = 1
+        job = self.server.workbooks.refresh(item_id("workbooks", 1))
+        self.assertIsNone(job.completed_at)
+        finished = self.server.jobs.wait_for_job(job)
+        self.assertEqual(finished.finish_code, TSC.JobItem.FinishCode.Success)
+        self.assertEqual(self.simulator.stats["job"], 2)
+
+    def test_throttling(self) -> None:
+        self.simulator.faults = Faults(throttle_rate=1.0, retry_after=7)
+        with self.assertRaises(ServerResponseError) as context:
+            self.server.workbooks.get()
+        self.assertEqual(context.exception.code, "429000")
+        self.assertEqual(self.simulator.stats["throttled"], 1)
+
+    def test_server_errors(self) -> None:
+        self.simulator.faults = Faults(error_rate=1.0, error_status=502)
+        with self.assertRaises(InternalServerError) as context:
+            self.server.workbooks.get()
+        self.assertEqual(context.exception.code, 502)
+
+    def test_faults_are_repeatable(self) -> None:
+        first, second = Faults(throttle_rate=0.3, error_rate=0.3, seed=1), Faults(
+            throttle_rate=0.3, error_rate=0.3, seed=1
+        )
+        draws = [first.draw() for _ in range(20)]
+        self.assertEqual(draws, [second.draw() for _ in range(20)])
+        self.assertIn(429, [status for _, status in draws])
@@ -0,0 +1,92 @@
+import os
+import unittest
+from typing import Any
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.helpers.export import item_to_dict
+from tableauserverclient.models.streaming import iter_elements
+
+TEST_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+NS = {"t": "http://tableau.com/api"}
+
+
+def read_asset(name: str) -> bytes:
+    with open(os.path.join(TEST_ASSET_DIR, name), "rb") as f:
+        return f.read()
+
+
+class StreamingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.3"
+
+        # Fake sign in
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+    def assert_same_items(self, streamed, parsed) -> None:
+        self.assertEqual([item_to_dict(i) for i in streamed], [item_to_dict(i) for i in parsed])
+
+    def test_stream_matches_from_response(self) -> None:
+        cases: list[tuple[Any, str]] = [
+            (TSC.WorkbookItem, "workbook_get.xml"),
+            (TSC.WorkbookItem, "workbook_get_by_id_acceleration_status.xml"),
+            (TSC.ViewItem, "view_get_usage.xml"),
+            (TSC.DatasourceItem, "datasource_get.xml"),
+            (TSC.FlowItem, "flow_get.xml"),
+            (TSC.ProjectItem, "project_get.xml"),
+            (TSC.UserItem, "user_get.xml"),
+        ]
+        for model, asset in cases:
+            with self.subTest(asset=asset):
+                response = read_asset(asset)
+                items, pagination_item = model.stream_response(response, NS)
+                expected_pagination = TSC.PaginationItem.from_response(response, NS)
+                self.assert_same_items(items, model.from_response(response, NS))
+                self.assertEqual(vars(pagination_item), vars(expected_pagination))
+
+    def test_stream_empty_response(self) -> None:
+        items, pagination_item = TSC.WorkbookItem.stream_response(read_asset("workbook_get_empty.xml"), NS)
+        self.assertEqual(list(items), [])
+        self.assertEqual(pagination_item.total_available, 0)
+
+    def test_nested_elements_are_not_yielded(self) -> None:
+        # Workbooks include their views, and each view names its workbook
+        response = read_asset("workbook_get_by_id_acceleration_status.xml")
+        elements = [e.get("id") for e in iter_elements(response, "view", NS)]
+        self.assertEqual(len(elements), len(set(elements)))
+
+        workbooks = [e.get("id") for e in iter_elements(response, "workbook", NS)]
+        self.assertEqual(len(workbooks), 1)
+
+    def test_processed_elements_are_released(self) -> None:
+        response = read_asset("workbook_get.xml")
+        previous = None
+        for element in iter_elements(response, "workbook", NS):
+            if previous is not None:
+                self.assertEqual(len(previous), 0)
+                self.assertEqual(previous.attrib, {})
+            previous = element
+
+    def test_get_stream(self) -> None:
+        response = read_asset("view_get_usage.xml")
+        with requests_mock.mock() as m:
+            m.get(self.server.views.baseurl + "?includeUsageStatistics=true", content=response)
+            items, pagination_item = self.server.views.get_stream(usage=True)
+            views = list(items)
+
+        self.assertEqual(pagination_item.total_available, 2)
+        self.assert_same_items(views, TSC.ViewItem.from_response(response, NS))
+        self.assertEqual(views[0].total_views, 7)
+
+    def test_users_get_stream(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.server.users.baseurl, content=read_asset("user_get.xml"))
+            items, _ = self.server.users.get_stream()
+            users = list(items)
+
+        self.assertIn("fields=_all_", m.last_request.url)
+        self.assertEqual(len(users), 2)
@@ -7,6 +7,7 @@ from xml.etree import ElementTree as ET
 import pytest
 import requests_mock
 import tableauserverclient as TSC
+from tableauserverclient.server import RequestFactory
 
 
 @pytest.fixture
@@ -228,3 +229,98 @@ def test_tags_batch_delete(get_server) -> None:
         tag_result = server.tags.batch_delete(tags, content)
 
     assert set(tag_result) == set(tags)
+
+
+def test_tags_batch_content_types() -> None:
+    content: list = [make_workbook(), make_view(), make_datasource()]
+    root = ET.fromstring(RequestFactory.Tag.batch_create({"a"}, content))
+    assert [c.attrib["contentType"] for c in root.iter("content")] == ["workbook", "view", "datasource"]
+
+
+def tagged(item, tags):
+    item._initial_tags = set(tags)
+    item.tags = set(tags)
+    return item
+
+
+def test_tags_bulk_update(get_server) -> None:
+    server = get_server
+    workbooks = [tagged(make_workbook(), {"a", "old"}) for _ in range(5)]
+    view = tagged(make_view(), {"a"})
+    unchanged = tagged(make_datasource(), {"a"})
+    desired = {w: {"a", "new"} for w in workbooks}
+    desired[view] = {"a", "new", "b"}
+    desired[unchanged] = {"a"}
+
+    with requests_mock.mock() as m:
+        m.put(f"{server.tags.baseurl}:batchCreate", text=add_tag_xml_response_factory([]))
+        m.put(f"{server.tags.baseurl}:batchDelete", text=add_tag_xml_response_factory([]))
+        changed = server.tags.bulk_update(desired, chunk_size=2)
+        history = m.request_history
+
+    assert changed == [*workbooks, view]
+    batches = []
+    for request in history:
+        root = ET.fromstring(request.body)
+        tags = {t.attrib["label"] for t in root.iter("tag")}
+        batches.append((request.url.rsplit(":", 1)[1], frozenset(tags), len(list(root.iter("content")))))
+    # The workbooks gaining "new" are sent in chunks of 2, the view gaining more on its own
+    assert sorted(batches, key=repr) == sorted(
+        [
+            ("batchCreate", frozenset({"new"}), 2),
+            ("batchCreate", frozenset({"new"}), 2),
+            ("batchCreate", frozenset({"new"}), 1),
+            ("batchCreate", frozenset({"new", "b"}), 1),
+            ("batchDelete", frozenset({"old"}), 2),
+            ("batchDelete", frozenset({"old"}), 2),
+            ("batchDelete", frozenset({"old"}), 1),
+        ],
+        key=repr,
+    )
+    assert all(w._initial_tags == {"a", "new"} for w in workbooks)
+
+
+def test_tags_bulk_update_one_at_a_time(get_server) -> None:
+    server = get_server
+    server.version = "3.8"
+    workbook = tagged(make_workbook(), {"old"})
+    view = tagged(make_view(), set())
+
+    with requests_mock.mock() as m:
+        m.put(f"{server.workbooks.baseurl}/{workbook.id}/tags", text=add_tag_xml_response_factory(["new"]))
+        m.delete(f"{server.workbooks.baseurl}/{workbook.id}/tags/old")
+        m.put(f"{server.views.baseurl}/{view.id}/tags", text=add_tag_xml_response_factory(["new"]))
+        server.tags.bulk_update([(workbook, ["new"]), (view, "new")], max_workers=2)
+        assert m.call_count == 3
+
+    assert workbook.tags == workbook._initial_tags == {"new"}
+    assert view.tags == {"new"}
+
+
+def test_tags_bulk_update_batch_only_types(get_server) -> None:
+    server = get_server
+    table = tagged(make_table(), set())
+    database = tagged(make_database(), {"old"})
+
+    with requests_mock.mock() as m:
+        m.put(f"{server.tags.baseurl}:batchCreate", text=add_tag_xml_response_factory(["new"]))
+        m.put(f"{server.tags.baseurl}:batchDelete", text=add_tag_xml_response_factory([]))
+        changed = server.tags.bulk_update({table: ["new"], database: ["new"]})
+        content_types = {
+            c.attrib["contentType"] for r in m.request_history for c in ET.fromstring(r.body).iter("content")
+        }
+
+    assert changed == [table, database]
+    assert content_types == {"table", "database"}
+
+
+def test_tags_bulk_update_untaggable(get_server) -> None:
+    # Tables can only be tagged with the batch requests
+    get_server.version = "3.8"
+    workbook = tagged(make_workbook(), {"old"})
+    with pytest.raises(ValueError, match="batch requests"):
+        get_server.tags.bulk_update({workbook: ["a"], tagged(make_table(), set()): ["a"]})
+    # Nothing is changed when an item cannot be tagged
+    assert workbook.tags == {"old"}
+    with pytest.raises(ValueError):
+        get_server.tags.bulk_update({make_workbook(): ["a"]}, chunk_size=0)
@@ -0,0 +1,180 @@
+import contextlib
+import os
+import unittest
+from typing import Any, Optional
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.helpers import tracing
+from tableauserverclient.server.endpoint.exceptions import InternalServerError
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:
+    TracerProvider = None  # type: ignore[assignment,misc]
+
+TEST_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+GET_XML = os.path.join(TEST_ASSET_DIR, "workbook_get.xml")
+JOB_XML = os.path.join(TEST_ASSET_DIR, "job_get_by_id.xml")
+UPLOAD_XML = '<tsResponse xmlns="http://tableau.com/api"><fileUpload uploadSessionId="1:2" fileSize="1" /></tsResponse>'
+
+
+class FakeSpan:
+    def __init__(self, name: str, attributes: dict[str, Any], parent: Optional["FakeSpan"]) -> None:
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent = parent
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class FakeTracer:
+    def __init__(self) -> None:
+        self.spans: list[FakeSpan] = []
+        self._current: Optional[FakeSpan] = None
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name, attributes=None, **kwargs):
+        span = FakeSpan(name, attributes or {}, self._current)
+        self.spans.append(span)
+        previous, self._current = self._current, span
+        try:
+            yield span
+        finally:
+            self._current = previous
+
+    def names(self) -> list[tuple[str, Optional[str]]]:
+        return [(span.name, span.parent and span.parent.name) for span in self.spans]
+
+
+class TracingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake sign in
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.baseurl = self.server.workbooks.baseurl
+        self.tracer = FakeTracer()
+        self.server.tracer = self.tracer
+
+    def test_no_tracer(self) -> None:
+        self.server.tracer = None
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=open(GET_XML).read())
+            self.server.workbooks.get()
+        self.assertEqual(self.tracer.spans, [])
+        self.assertIsNone(tracing.active_tracer())
+
+    def test_endpoint_request_and_parse_spans(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=open(GET_XML).read())
+            self.server.workbooks.get()
+
+        # The items and the pagination are each parsed from the response
+        self.assertEqual(
+            self.tracer.names(),
+            [
+                ("workbooks.get", None),
+                ("HTTP GET", "workbooks.get"),
+                ("parse", "workbooks.get"),
+                ("parse", "workbooks.get"),
+            ],
+        )
+        request = self.tracer.spans[1]
+        self.assertEqual(request.attributes["url.full"], self.baseurl)
+        self.assertEqual(request.attributes["http.response.status_code"], 200)
+        self.assertGreater(request.attributes["http.response.body.size"], 0)
+        self.assertIsNone(tracing.active_tracer())
+
+    def test_item_attributes(self) -> None:
+        workbook_id = "3cc6cd06-89ce-4fdc-b935-5294135d6d42"
+        with requests_mock.mock() as m:
+            m.post(f"{self.baseurl}/{workbook_id}/refresh", text=open(JOB_XML).read())
+            self.server.workbooks.refresh(workbook_id)
+
+        span = self.tracer.spans[0]
+        self.assertEqual(span.attributes["tsc.item.id"], workbook_id)
+        self.assertEqual(span.attributes["tsc.result.id"], "2eef4225-aa0c-41c4-8662-a76d89ed7336")
+
+    def test_upload_chunks(self) -> None:
+        uploads = self.server.fileuploads.baseurl
+        with requests_mock.mock() as m:
+            m.post(uploads, text=UPLOAD_XML)
+            m.put(uploads + "/1:2", text=UPLOAD_XML)
+            self.server.fileuploads.upload(open(GET_XML, "rb"))
+
+        self.assertEqual(
+            [name for name in self.tracer.names() if name[0] != "parse"],
+            [
+                ("fileuploads.upload", None),
+                ("fileuploads.initiate", "fileuploads.upload"),
+                ("HTTP POST", "fileuploads.initiate"),
+                ("fileuploads.append", "fileuploads.upload"),
+                ("HTTP PUT", "fileuploads.append"),
+            ],
+        )
+        self.assertGreater(self.tracer.spans[4].attributes["http.request.body.size"], os.path.getsize(GET_XML))
+
+    def test_wait_for_job(self) -> None:
+        job_id = "2eef4225-aa0c-41c4-8662-a76d89ed7336"
+        with requests_mock.mock() as m:
+            m.get(f"{self.server.jobs.baseurl}/{job_id}", text=open(JOB_XML).read())
+            self.server.jobs.wait_for_job(job_id)
+
+        self.assertEqual(
+            self.tracer.names()[:2], [("jobs.wait_for_job", None), ("jobs.get_by_id", "jobs.wait_for_job")]
+        )
+
+    def test_operation_name(self) -> None:
+        self.assertEqual(tracing.operation_name(self.server.flow_tasks, "create"), "flow_tasks.create")
+        self.assertEqual(
+            tracing.operation_name(self.server.data_acceleration_report, "get"), "data_acceleration_report.get"
+        )
+
+
+@unittest.skipUnless(TracerProvider is not None, "opentelemetry-sdk is not installed")
+class OpenTelemetryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake sign in
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.baseurl = self.server.workbooks.baseurl
+        self.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.server.tracer = provider.get_tracer("test")
+
+    def test_spans_and_propagation(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=open(GET_XML).read())
+            self.server.workbooks.get()
+            traceparent = m.request_history[0].headers["traceparent"]
+
+        spans = {span.name: span for span in self.exporter.get_finished_spans()}
+        self.assertEqual(set(spans), {"workbooks.get", "HTTP GET", "parse"})
+        request = spans["HTTP GET"]
+        assert request.parent is not None
+        self.assertEqual(request.parent.span_id, spans["workbooks.get"].context.span_id)
+        self.assertIn(format(request.context.span_id, "016x"), traceparent)
+
+    def test_error_status(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, status_code=500)
+            with self.assertRaises(InternalServerError):
+                self.server.workbooks.get()
+
+        spans = {span.name: span for span in self.exporter.get_finished_spans()}
+        self.assertFalse(spans["HTTP GET"].status.is_ok)
+        self.assertFalse(spans["workbooks.get"].status.is_ok)
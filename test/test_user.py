@@ -1,5 +1,9 @@
+import json
 import os
+import re
+import tempfile
 import unittest
+from typing import Any
 
 import requests_mock
 
@@ -20,6 +24,8 @@ POPULATE_GROUPS_XML = os.path.join(TEST_ASSET_DIR, "user_populate_groups.xml")
 USERNAMES = os.path.join(TEST_ASSET_DIR, "Data", "usernames.csv")
 USERS = os.path.join(TEST_ASSET_DIR, "Data", "user_details.csv")
 
+NS = 'xmlns="http://tableau.com/api"'
+
 
 class UserTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -223,13 +229,136 @@ class UserTests(unittest.TestCase):
             m.post(self.server.users.baseurl, text=response_xml)
             user_list, failures = self.server.users.create_from_file(USERNAMES)
         assert user_list[0].name == "Cassie", user_list
-        assert failures == [], failures
+        # The lines with invalid user names are not sent
+        assert [user.name for user, _ in failures] == ["in@v@lid", "in valid"], failures
 
     def test_get_users_from_file(self):
         with open(ADD_XML, "rb") as f:
             response_xml = f.read().decode("utf-8")
+        with open(UPDATE_XML, "rb") as f:
+            update_xml = f.read().decode("utf-8")
         with requests_mock.mock() as m:
             m.post(self.server.users.baseurl, text=response_xml)
+            m.put(self.server.users.baseurl + "/4cc4c17f-898a-4de4-abed-a1681c673ced", text=update_xml)
             users, failures = self.server.users.create_from_file(USERS)
+            update = m.request_history[-1].body
         assert users[0].name == "Cassie", users
         assert failures == []
+        # The line sets an email and password, which are sent in an update after the user is added
+        self.assertIn(b'email="username@email.com"', update)
+        self.assertIn(b'password="pword"', update)
+
+    def import_users(self, lines: list[str], report: list[dict[str, Any]], **kwargs):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "users.csv")
+            with open(csv_path, "w") as f:
+                f.write("\n".join(lines))
+            report_path = os.path.join(directory, "report.json")
+            with open(report_path, "w") as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in report)
+                # Cut short by an interrupted import
+                f.write('{"line": 9, "na')
+            result = self.server.users.create_from_file(csv_path, report_path=report_path, **kwargs)
+            with open(report_path) as f:
+                written = [json.loads(line) for line in f.read().splitlines()[len(report) + 1 :]]
+        return result, written
+
+    def test_create_from_file_concurrently(self) -> None:
+        self.server.version = "3.21"
+        group = TSC.GroupItem("Imported")
+        group._id = "e7833b48-c6f7-47b5-a2a7-36e7dd232758"
+        added_to_group: list[bytes] = []
+
+        def add_user(request, context) -> str:
+            name = re.findall(r'name="([^"]+)"', request.body.decode())[0]
+            if name == "dave":
+                context.status_code = 409
+                return f'<tsResponse {NS}><error code="409017"><summary>Conflict</summary><detail>Exists</detail></error></tsResponse>'
+            return f'<tsResponse {NS}><user id="id-{name}" name="{name}" siteRole="Viewer" /></tsResponse>'
+
+        def add_to_group(request, context) -> str:
+            added_to_group.append(request.body)
+            return f"<tsResponse {NS}><users /></tsResponse>"
+
+        lines = [
+            "alice, Secret, Alice Smith, creator, none, yes, alice@email.com",
+            "bob",
+            "in valid,",
+            "carol, , , viewer, none, no",
+            "dave",
+        ]
+        with requests_mock.mock() as m:
+            m.post(self.server.users.baseurl, text=add_user)
+            m.put(self.server.users.baseurl + "/id-alice", text=f'<tsResponse {NS}><user name="alice" /></tsResponse>')
+            m.post(f"{self.server.groups.baseurl}/{group.id}/users", text=add_to_group)
+            (created, failed), report = self.import_users(lines, [], group=group, chunk_size=2)
+            (update,) = [r for r in m.request_history if r.method == "PUT"]
+
+        self.assertEqual([user.name for user in created], ["alice", "bob", "carol"])
+        self.assertEqual([user.name for user, _ in failed], ["in valid", "dave"])
+        self.assertIsInstance(failed[0][1], (AttributeError, ValueError))
+        self.assertEqual(failed[1][1].code, "409017")  # type: ignore[attr-defined]
+        self.assertIn(b'fullName="alice smith"', update.body)
+        self.assertIn(b'password="Secret"', update.body)
+        # The users created are added to the group two at a time
+        self.assertEqual(sorted(len(re.findall(b"<user ", body)) for body in added_to_group), [1, 2])
+        statuses = sorted((entry.get("line", 0), entry["status"]) for entry in report)
+        self.assertEqual(
+            statuses,
+            [
+                (0, "grouped"),
+                (0, "grouped"),
+                (1, "created"),
+                (2, "created"),
+                (3, "invalid"),
+                (4, "created"),
+                (5, "failed"),
+            ],
+        )
+
+    def test_create_from_file_resumes(self) -> None:
+        self.server.version = "3.21"
+        group = TSC.GroupItem("Imported")
+        group._id = "e7833b48-c6f7-47b5-a2a7-36e7dd232758"
+        report: list[dict[str, Any]] = [
+            {"line": 1, "name": "alice", "status": "created", "id": "id-alice"},
+            {"line": 2, "name": "bob", "status": "created", "id": "id-bob"},
+            {"status": "grouped", "group": group.id, "ids": ["id-bob"]},
+            # Added by the last run, but not updated
+            {"line": 3, "name": "carol", "status": "failed", "id": "id-carol", "error": "Timed out"},
+        ]
+        with requests_mock.mock() as m:
+            m.put(self.server.users.baseurl + "/id-carol", text=f'<tsResponse {NS}><user name="carol" /></tsResponse>')
+            m.post(f"{self.server.groups.baseurl}/{group.id}/users", text=f"<tsResponse {NS}><users /></tsResponse>")
+            (created, failed), written = self.import_users(
+                ["alice, , Alice", "bob", "carol, , , , , , carol@email.com"], report, group=group
+            )
+            self.assertEqual([r.method for r in m.request_history], ["PUT", "POST"])
+            grouped = m.request_history[-1].body
+
+        self.assertEqual([user.id for user in created], ["id-carol"])
+        self.assertEqual(failed, [])
+        self.assertEqual(re.findall(rb'<user id="([^"]+)"', grouped), [b"id-alice", b"id-carol"])
+        self.assertEqual([entry["status"] for entry in written], ["created", "grouped"])
+
+    def test_create_from_file_invalid_lines(self) -> None:
+        lines = ["alice", "bob, , , pilot", ", , , viewer", "carol"]
+        with requests_mock.mock() as m, tempfile.TemporaryDirectory() as directory:
+            m.post(self.server.users.baseurl, text=f'<tsResponse {NS}><user id="id" name="user" /></tsResponse>')
+            csv_path = os.path.join(directory, "users.csv")
+            with open(csv_path, "w") as f:
+                f.write("\n".join(lines))
+            created, failed = self.server.users.create_from_file(csv_path)
+            requested = m.call_count
+        self.assertEqual(requested, 2)
+
+        self.assertEqual(len(created), 2)
+        # The invalid lines are not sent, but returned with the users named on them
+        self.assertEqual([user.name for user, _ in failed], ["bob", None])
+        self.assertTrue(all(isinstance(error, (AttributeError, ValueError)) for _, error in failed))
+
+    def test_create_from_file_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            self.server.users.create_from_file(USERS, max_workers=0)
+        with self.assertRaises(TSC.MissingRequiredFieldError):
+            self.server.users.create_from_file(USERS, group=TSC.GroupItem("Imported"))
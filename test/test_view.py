@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 
 import requests_mock
@@ -6,6 +7,8 @@ import requests_mock
 import tableauserverclient as TSC
 from tableauserverclient import UserItem, GroupItem, PermissionsRule
 from tableauserverclient.datetime_helpers import format_datetime
+from tableauserverclient.server.endpoint.exceptions import InternalServerError
+from tableauserverclient.server.exceptions import EndpointUnavailableError
 
 TEST_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
 
@@ -364,3 +367,130 @@ class ViewTests(unittest.TestCase):
         req_option = TSC.PDFRequestOptions(viz_width=1920)
         with self.assertRaises(ValueError):
             req_option.get_query_params()
+
+    def test_export_many(self) -> None:
+        self.server.version = "3.8"
+        self.baseurl = self.server.views.baseurl
+        with open(POPULATE_PREVIEW_IMAGE, "rb") as f:
+            image = f.read()
+        with open(POPULATE_PDF, "rb") as f:
+            pdf = f.read()
+        views = []
+        for view_id in ("v-1", "v-2"):
+            view = TSC.ViewItem()
+            view._id = view_id
+            views.append(view)
+        exports = [
+            (views[0], TSC.ImageRequestOptions().vf("Region", "West").vf("Year", "2024")),
+            (views[0], TSC.ImageRequestOptions().vf("Year", "2024").vf("Region", "West")),
+            (views[0], TSC.ImageRequestOptions().vf("Region", "East")),
+            (views[1], TSC.PDFRequestOptions()),
+            (views[1], TSC.CSVRequestOptions()),
+        ]
+
+        with requests_mock.mock() as m, tempfile.TemporaryDirectory() as directory:
+            m.get(f"{self.baseurl}/v-1/image", content=image)
+            m.get(f"{self.baseurl}/v-2/pdf", content=pdf)
+            m.get(f"{self.baseurl}/v-2/data", status_code=500, text="error")
+            results = self.server.views.export_many(exports, directory, max_workers=2, chunk_size=100)
+            self.assertEqual(m.call_count, 4)
+            files = sorted(os.listdir(directory))
+            with open(results[3].path, "rb") as f:
+                self.assertEqual(f.read(), pdf)
+
+        # The same filters in another order are exported once
+        self.assertIs(results[0], results[1])
+        self.assertEqual(results[0].requested, 2)
+        self.assertEqual(len(files), 3)
+        self.assertTrue(results[3].filename in files and results[3].filename == "v-2.pdf")
+        self.assertEqual(results[2].bytes_written, len(image))
+        self.assertTrue(all(r.ok and r.elapsed is not None for r in results[:4]))
+        self.assertIsInstance(results[4].error, InternalServerError)
+        self.assertIsNone(results[4].path)
+
+    def test_export_many_to_sink(self) -> None:
+        with open(POPULATE_CSV, "rb") as f:
+            response = f.read()
+        view = TSC.ViewItem()
+        view._id = "v-1"
+        received = {}
+
+        def sink(export, chunks):
+            received[export.view.id] = b"".join(chunks)
+
+        with requests_mock.mock() as m:
+            m.get(f"{self.baseurl}/v-1/data?maxAge=5", content=response)
+            (result,) = self.server.views.export_many([(view, TSC.CSVRequestOptions(maxage=5))], sink)
+
+        self.assertEqual(received, {"v-1": response})
+        self.assertEqual(result.bytes_written, len(response))
+        self.assertIsNone(result.path)
+
+    def test_export_many_unavailable(self) -> None:
+        # Excel exports need 3.8
+        view = TSC.ViewItem()
+        view._id = "v-1"
+        (result,) = self.server.views.export_many([(view, TSC.ExcelRequestOptions())], lambda export, chunks: None)
+        self.assertIsInstance(result.error, EndpointUnavailableError)
+        with self.assertRaises(ValueError):
+            self.server.views.export_many([(view, TSC.RequestOptions())], lambda export, chunks: None)
+
+    def test_iter_csv_rows(self) -> None:
+        with open(POPULATE_CSV, "rb") as f:
+            response = f.read()
+        view = TSC.ViewItem()
+        view._id = "d79634e1-6063-4ec9-95ff-50acbf609ff5"
+        with requests_mock.mock() as m:
+            m.get(f"{self.baseurl}/{view.id}/data", content=response)
+            rows = list(self.server.views.iter_csv_rows(view, buffer_size=64))
+            dicts = list(self.server.views.iter_csv_rows(view, types={"Distinct count of Customer Name": "int"}))
+
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[0][:2], ["Measure Names", "Region"])
+        self.assertEqual(rows[1][-1], "$311,784")
+        self.assertEqual(len(dicts), 24)
+        self.assertEqual(dicts[0]["Distinct count of Customer Name"], 438)
+        self.assertEqual(dicts[0]["Sales"], "$311,784")
+
+    def test_iter_csv_rows_quoted_newlines(self) -> None:
+        # A cell that spans a chunk boundary and several lines, behind a byte order mark
+        response = ("\ufeff" 'Name,Count,Active\n"Line 1\nLine 2, ünïcode",3,true\n,,\nShort').encode("utf-8")
+        view = TSC.ViewItem()
+        view._id = "v-1"
+        with requests_mock.mock() as m:
+            m.get(f"{self.baseurl}/v-1/data", content=response)
+            rows = list(self.server.views.iter_csv_rows(view, buffer_size=8))
+            dicts = list(self.server.views.iter_csv_rows(view, types={"Count": "int", "Active": "bool"}))
+            with self.assertRaises(ValueError):
+                list(self.server.views.iter_csv_rows(view, types={"Missing": "int"}))
+
+        self.assertEqual(rows[1], ["Line 1\nLine 2, ünïcode", "3", "true"])
+        self.assertEqual(
+            dicts,
+            [
+                {"Name": "Line 1\nLine 2, ünïcode", "Count": 3, "Active": True},
+                {"Name": None, "Count": None, "Active": None},
+                {"Name": "Short", "Count": None, "Active": None},
+            ],
+        )
+
+    def test_write_csv_rows(self) -> None:
+        response = b"Region,Sales\nWest,1.5\nEast,2\nNorth,\n"
+        view = TSC.ViewItem()
+        view._id = "v-1"
+        with requests_mock.mock() as m, tempfile.TemporaryDirectory() as directory:
+            m.get(f"{self.baseurl}/v-1/data", content=response)
+            path = os.path.join(directory, "sales.ndjson")
+            written = self.server.views.write_csv_rows(view, path, "ndjson", types={"Sales": "float"}, batch_size=2)
+            with open(path) as f:
+                lines = f.read().splitlines()
+
+        self.assertEqual(written, 3)
+        self.assertEqual(
+            lines,
+            [
+                '{"Region": "West", "Sales": 1.5}',
+                '{"Region": "East", "Sales": 2.0}',
+                '{"Region": "North", "Sales": null}',
+            ],
+        )
@@ -0,0 +1,85 @@
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+
+import tableauserverclient as TSC
+from tableauserverclient.server.endpoint.exceptions import JobFailedException
+
+from test.simulator import RestSimulator, SimulatedSite, item_id
+
+
+class WebhookReceiverTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.site = SimulatedSite("Sales")
+        # Jobs only finish when `finish_job` is called
+        self.simulator = RestSimulator([self.site], job_polls=1_000_000)
+        self.simulator.start()
+        self.addCleanup(self.simulator.stop)
+
+        self.server = TSC.Server(self.simulator.url, use_server_version=True)
+        self.server.auth.sign_in(TSC.TableauAuth("user", "password", "Sales"))
+
+    def finish_later(self, job: TSC.JobItem, succeeded: bool = True) -> None:
+        def finish() -> None:
+            time.sleep(0.2)
+            self.simulator.finish_job(job.id or "", succeeded)
+
+        thread = threading.Thread(target=finish)
+        thread.start()
+        self.addCleanup(thread.join)
+
+    def test_event_ends_wait(self) -> None:
+        with TSC.WebhookReceiver(self.server) as receiver:
+            self.assertEqual(self.simulator.stats["webhook_create"], 4)
+            job = self.server.datasources.refresh(item_id("datasources", 3))
+            self.finish_later(job)
+            started = time.monotonic()
+            finished = receiver.wait_for_job(job, timeout=20)
+
+        self.assertEqual(finished.finish_code, TSC.JobItem.FinishCode.Success)
+        self.assertEqual(receiver.received, 1)
+        # Woken by the event, well before the polls would have seen the job finish
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertLessEqual(self.simulator.stats["job"], 3)
+        # The webhooks created are deleted when the receiver stops
+        self.assertEqual(self.simulator.webhooks, {})
+
+    def test_failed_event(self) -> None:
+        with TSC.WebhookReceiver(self.server) as receiver:
+            job = self.server.workbooks.refresh(item_id("workbooks", 1))
+            self.finish_later(job, succeeded=False)
+            with self.assertRaises(JobFailedException):
+                receiver.wait_for_job(job.id or "", timeout=20)
+
+    def test_polling_fallback(self) -> None:
+        # No events are registered for workbooks, so the job is polled until it finishes
+        self.simulator.job_polls = 1
+        with TSC.WebhookReceiver(self.server, events=["datasource-refresh-succeeded"]) as receiver:
+            job = self.server.workbooks.refresh(item_id("workbooks", 1))
+            finished = receiver.wait_for_job(job, timeout=20)
+        self.assertIsNotNone(finished.completed_at)
+        self.assertEqual(receiver.received, 0)
+        self.assertEqual(self.simulator.stats["job"], 2)
+
+    def test_reuses_webhooks(self) -> None:
+        url = "https://events.example.com/tableau"
+        self.simulator.webhooks["existing"] = ("Existing", "datasource-refresh-succeeded", url)
+        events = ["datasource-refresh-succeeded", "datasource-refresh-failed"]
+        with TSC.WebhookReceiver(self.server, public_url=url, events=events) as receiver:
+            self.assertEqual([webhook.id for webhook in receiver.webhooks][0], "existing")
+            self.assertEqual(self.simulator.stats["webhook_create"], 1)
+        self.assertEqual(list(self.simulator.webhooks), ["existing"])
+
+    def test_rejects_other_requests(self) -> None:
+        with TSC.WebhookReceiver(self.server, events=[]) as receiver:
+            for url, body, status in (
+                (receiver.url.rsplit("/", 1)[0] + "/other", b'{"resource_luid": "x"}', 404),
+                (receiver.url, b"not json", 400),
+            ):
+                with self.assertRaises(urllib.error.HTTPError) as error:
+                    urllib.request.urlopen(urllib.request.Request(url, body, method="POST"), timeout=5)
+                self.assertEqual(error.exception.code, status)
+            urllib.request.urlopen(urllib.request.Request(receiver.url, b'{"resource_luid": "x"}', method="POST"))
+        self.assertEqual(receiver.received, 1)
@@ -149,7 +149,7 @@ class WorkbookTests(unittest.TestCase):
         self.assertEqual("2016-07-26T20:34:56Z", format_datetime(single_workbook.created_at))
         self.assertEqual("description for SafariSample", single_workbook.description)
         self.assertEqual("2016-07-26T20:35:05Z", format_datetime(single_workbook.updated_at))
-        self.assertTrue(single_workbook.project_id)
+        self.assertIsNone(single_workbook.project_id)
         self.assertIsNone(single_workbook.project_name)
         self.assertEqual("5de011f8-5aa9-4d5b-b991-f462c8dd6bb7", single_workbook.owner_id)
         self.assertEqual({"Safari", "Sample"}, single_workbook.tags)
@@ -11,3 +11,34 @@ class WorkbookModelTests(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             workbook.show_tabs = None
+
+    def test_slots(self):
+        workbook = TSC.WorkbookItem("10")
+        self.assertEqual(workbook.__dict__, {})
+        self.assertIn("_project_id: 10", repr(workbook))
+
+    def test_extra_attributes(self):
+        workbook = TSC.WorkbookItem("10")
+        workbook.not_a_field = 1  # type: ignore[attr-defined]
+        self.assertEqual(workbook.not_a_field, 1)  # type: ignore[attr-defined]
+        self.assertIn("not_a_field: 1", repr(workbook))
+
+    def test_no_project_id(self):
+        workbook = TSC.WorkbookItem()
+        self.assertIsNone(workbook.project_id)
+
+    def test_default_data_acceleration_config(self):
+        workbook = TSC.WorkbookItem("10")
+        config = workbook.data_acceleration_config
+        self.assertEqual(
+            config,
+            {
+                "acceleration_enabled": None,
+                "accelerate_now": None,
+                "last_updated_at": None,
+                "acceleration_status": None,
+            },
+        )
+        config["acceleration_enabled"] = True
+        self.assertTrue(workbook.data_acceleration_config["acceleration_enabled"])
+        self.assertIsNone(TSC.WorkbookItem("10").data_acceleration_config["acceleration_enabled"])
@@ -0,0 +1,129 @@
+import os
+import unittest
+from typing import Any
+from unittest import mock
+import xml.etree.ElementTree as ET
+
+from defusedxml import EntitiesForbidden
+
+import tableauserverclient as TSC
+from tableauserverclient.helpers.export import item_to_dict
+from tableauserverclient.models import xml_backend
+from tableauserverclient.models.streaming import iter_elements
+
+TEST_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+NS = {"t": "http://tableau.com/api"}
+
+ENTITY_BOMB = """<?xml version="1.0"?>
+<!DOCTYPE tsResponse [<!ENTITY a "aaaaaaaaaa"><!ENTITY b "&a;&a;&a;&a;&a;&a;&a;&a;&a;&a;">]>
+<tsResponse xmlns="http://tableau.com/api"><workbooks><workbook id="1" name="&b;" /></workbooks></tsResponse>"""
+
+MODEL_ASSETS: list[tuple[Any, str]] = [
+    (TSC.WorkbookItem, "workbook_get.xml"),
+    (TSC.WorkbookItem, "workbook_get_by_id_acceleration_status.xml"),
+    (TSC.ViewItem, "view_get_usage.xml"),
+    (TSC.DatasourceItem, "datasource_get.xml"),
+    (TSC.FlowItem, "flow_get.xml"),
+    (TSC.ProjectItem, "project_get.xml"),
+    (TSC.UserItem, "user_get.xml"),
+]
+
+
+def read_asset(name: str) -> bytes:
+    with open(os.path.join(TEST_ASSET_DIR, name), "rb") as f:
+        return f.read()
+
+
+class XMLBackendTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        xml_backend.set_backend(None)
+
+    @mock.patch.dict(os.environ, {"TSC_XML_BACKEND": ""})
+    def test_default_backend_is_defusedxml(self) -> None:
+        os.environ.pop("TSC_XML_BACKEND")
+        self.assertEqual(xml_backend.get_backend(), xml_backend.DEFUSEDXML)
+        self.assertIsInstance(xml_backend.fromstring(read_asset("workbook_get.xml")), ET.Element)
+
+    def test_unknown_backend(self) -> None:
+        with self.assertRaises(ValueError):
+            xml_backend.set_backend("expat")
+
+    def test_auto_backend(self) -> None:
+        xml_backend.set_backend(xml_backend.AUTO)
+        expected = xml_backend.LXML if xml_backend.lxml_available() else xml_backend.DEFUSEDXML
+        self.assertEqual(xml_backend.get_backend(), expected)
+
+    def test_defusedxml_rejects_entities(self) -> None:
+        with self.assertRaises(EntitiesForbidden):
+            TSC.WorkbookItem.from_response(ENTITY_BOMB, NS)
+
+    def test_xpath(self) -> None:
+        root = xml_backend.fromstring(read_asset("workbook_get.xml"))
+        workbooks = xml_backend.XPath(".//t:workbook")
+        self.assertEqual(len(workbooks.all(root, NS)), 2)
+        self.assertEqual(workbooks.first(root, NS).get("name"), "Superstore")
+        self.assertIsNone(xml_backend.XPath(".//t:flow").first(root, NS))
+
+
+@unittest.skipUnless(xml_backend.lxml_available(), "lxml is not installed")
+class LxmlBackendTests(unittest.TestCase):
+    def setUp(self) -> None:
+        xml_backend.set_backend(xml_backend.LXML)
+
+    def tearDown(self) -> None:
+        xml_backend.set_backend(None)
+
+    def test_models_match_defusedxml(self) -> None:
+        for model, asset in MODEL_ASSETS:
+            with self.subTest(asset=asset):
+                response = read_asset(asset)
+                parsed = [item_to_dict(i) for i in model.from_response(response, NS)]
+                streamed = [item_to_dict(i) for i in model.stream_response(response, NS)[0]]
+                xml_backend.set_backend(xml_backend.DEFUSEDXML)
+                expected = [item_to_dict(i) for i in model.from_response(response, NS)]
+                xml_backend.set_backend(xml_backend.LXML)
+                self.assertEqual(parsed, expected)
+                self.assertEqual(streamed, expected)
+
+    def test_rejects_entities(self) -> None:
+        with self.assertRaises(EntitiesForbidden):
+            TSC.WorkbookItem.from_response(ENTITY_BOMB, NS)
+        with self.assertRaises(EntitiesForbidden):
+            list(iter_elements(ENTITY_BOMB, "workbook", NS))
+
+    def test_malformed_response(self) -> None:
+        with self.assertRaises(ET.ParseError):
+            xml_backend.fromstring(b"<tsResponse><workbooks></tsResponse>")
+        with self.assertRaises(ET.ParseError):
+            list(iter_elements(b"<tsResponse><workbooks></tsResponse>", "workbook", NS))
+
+    def test_accepts_text(self) -> None:
+        response = read_asset("workbook_get.xml").decode("utf-8")
+        self.assertEqual(len(TSC.WorkbookItem.from_response(response, NS)), 2)
+
+
+class ChildrenByTagTests(unittest.TestCase):
+    def test_direct_children_only(self) -> None:
+        root = xml_backend.fromstring(read_asset("workbook_get_by_id_acceleration_status.xml"))
+        workbook = xml_backend.XPath(".//t:workbook").first(root, NS)
+        children = xml_backend.children_by_tag(workbook, NS)
+        self.assertIn("project", children)
+        self.assertIn("views", children)
+        self.assertNotIn("view", children)
+        self.assertIs(children["project"], workbook.find("t:project", namespaces=NS))
+
+    def test_first_child_wins(self) -> None:
+        root = xml_backend.fromstring(
+            '<tsResponse xmlns="http://tableau.com/api"><owner id="1" /><!-- owner --><owner id="2" /></tsResponse>'
+        )
+        self.assertEqual(xml_backend.children_by_tag(root, NS)["owner"].get("id"), "1")
+
+    def test_tags_belong_to_the_item(self) -> None:
+        # A workbook without tags must not pick up the tags of one of its views
+        response = """<tsResponse xmlns="http://tableau.com/api"><workbooks><workbook id="wb" name="wb">
+            <views><view id="v" name="v"><tags><tag label="view-tag" /></tags></view></views>
+            </workbook></workbooks></tsResponse>"""
+        workbook = TSC.WorkbookItem.from_response(response, NS)[0]
+        self.assertEqual(workbook.tags, set())
+        self.assertEqual(workbook.views[0].tags, {"view-tag"})